@@ -0,0 +1,80 @@
+"""
+Compares the layered result formatters of the pythonic middleware, followed by
+the ``AttributeDict`` conversion of the attrdict middleware, with the fused
+single-pass formatters which replace them.  The fused formatters keep a cache
+of checksummed addresses, which repeated runs over the same payload make the
+most of, so the speedup on blocks is an upper bound.
+
+    python scripts/benchmark/formatters.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import (  # noqa: E402
+    make_block,
+    make_logs,
+    make_receipt,
+)
+from web3.datastructures import (  # noqa: E402
+    AttributeDict,
+)
+from web3.middleware.pythonic import (  # noqa: E402
+    FUSED_ATTRDICT_FORMATTERS,
+    FUSED_FORMATTERS,
+    block_formatter,
+    filter_result_formatter,
+    receipt_formatter,
+)
+
+CASES = (
+    ('block (150 full transactions)', make_block(), block_formatter, 'block', True),
+    (
+        'block (transaction hashes)',
+        make_block(full_transactions=False),
+        block_formatter,
+        'block',
+        True,
+    ),
+    ('receipt (4 logs)', make_receipt(), receipt_formatter, 'receipt', True),
+    # the attrdict middleware leaves lists of logs as they are
+    ('getLogs (1000 logs)', make_logs(), filter_result_formatter, 'filter_result', False),
+)
+
+
+def time_per_call(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main(repeat):
+    print("{0:<32} {1:>12} {2:>12} {3:>9}".format('payload', 'layered ms', 'fused ms', 'speedup'))
+    for name, payload, layered, fused_name, to_attrdict in CASES:
+        if to_attrdict:
+            fused = FUSED_ATTRDICT_FORMATTERS[fused_name]
+
+            def layered_stack():
+                return AttributeDict.recursive(layered(payload))
+        else:
+            fused = FUSED_FORMATTERS[fused_name]
+
+            def layered_stack():
+                return layered(payload)
+
+        assert fused(payload) == layered_stack()
+        layered_time = time_per_call(layered_stack, repeat)
+        fused_time = time_per_call(lambda: fused(payload), repeat)
+        print("{0:<32} {1:>12.3f} {2:>12.3f} {3:>8.1f}x".format(
+            name,
+            1000 * layered_time,
+            1000 * fused_time,
+            layered_time / fused_time,
+        ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=20)
+    main(parser.parse_args().repeat)
@@ -0,0 +1,67 @@
+"""
+Compares the JSON codecs of ``web3._utils.json_codecs`` on block and log
+responses, including the cost of going through ``FriendlyJsonSerde``.
+
+    python scripts/benchmark/json_codecs.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import (  # noqa: E402
+    make_block,
+    make_logs,
+    make_response,
+)
+from web3._utils.encoding import (  # noqa: E402
+    FriendlyJsonSerde,
+)
+from web3._utils.json_codecs import (  # noqa: E402
+    JSON_CODECS,
+    load_json_codec,
+)
+
+PAYLOADS = {
+    'block (150 full transactions)': make_response(make_block()),
+    'block (transaction hashes)': make_response(make_block(full_transactions=False)),
+    'getLogs (1000 logs)': make_response(make_logs()),
+}
+
+
+def time_per_call(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main(repeat):
+    codecs = [
+        codec for codec in (load_json_codec(name) for name in sorted(JSON_CODECS))
+        if codec is not None
+    ]
+    missing = sorted(set(JSON_CODECS) - {codec.name for codec in codecs})
+    if missing:
+        print("Not installed: {0}".format(", ".join(missing)))
+
+    for payload_name, payload in PAYLOADS.items():
+        raw = json.dumps(payload).encode('utf-8')
+        print("\n{0}: {1:,} bytes".format(payload_name, len(raw)))
+        print("  {0:<8} {1:>12} {2:>12} {3:>12}".format(
+            'codec', 'decode ms', 'serde ms', 'encode ms',
+        ))
+        for codec in codecs:
+            serde = FriendlyJsonSerde(codec)
+            print("  {0:<8} {1:>12.3f} {2:>12.3f} {3:>12.3f}".format(
+                codec.name,
+                1000 * time_per_call(lambda: codec.loads(raw), repeat),
+                1000 * time_per_call(lambda: serde.json_decode(raw), repeat),
+                1000 * time_per_call(lambda: serde.json_encode_bytes(payload), repeat),
+            ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=50)
+    main(parser.parse_args().repeat)
@@ -0,0 +1,99 @@
+"""
+Compares the memory taken by the results of the pythonic and attrdict
+middlewares in each ``result_format`` of Web3, and as plain dicts, for a large
+log query and for a block with full transactions.  Lists of logs are only
+converted by the middlewares with the ``'records'`` format, so for the other
+formats each log is converted here, as an application keeping them would.
+
+    python scripts/benchmark/memory.py [--logs N]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import (  # noqa: E402
+    make_block,
+    make_logs,
+)
+from web3.datastructures import (  # noqa: E402
+    AttributeDict,
+)
+from web3.middleware.pythonic import (  # noqa: E402
+    FUSED_ATTRDICT_FORMATTERS,
+    FUSED_FORMATTERS,
+    FUSED_LAZY_FORMATTERS,
+    FUSED_RECORD_FORMATTERS,
+)
+
+
+def read_all(value):
+    # converts every field of a lazy result
+    if isinstance(value, AttributeDict):
+        for item in value.values():
+            read_all(item)
+    elif isinstance(value, list):
+        for item in value:
+            read_all(item)
+    return value
+
+
+def format_logs(formatters):
+    log_entry = formatters['log_entry']
+    return lambda logs: [log_entry(log) for log in logs]
+
+
+def measure(fn, payload):
+    """
+    Returns the bytes still allocated by the result of ``fn(payload)``.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn(payload)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main(num_logs):
+    cases = (
+        ('getLogs ({0} logs)'.format(num_logs), make_logs(num_logs), (
+            ('dict', FUSED_FORMATTERS['filter_result']),
+            ('attrdict', format_logs(FUSED_ATTRDICT_FORMATTERS)),
+            ('lazy (all read)', lambda logs: read_all(format_logs(FUSED_LAZY_FORMATTERS)(logs))),
+            ('records', FUSED_RECORD_FORMATTERS['filter_result']),
+        )),
+        ('block (150 full transactions)', make_block(), (
+            ('dict', FUSED_FORMATTERS['block']),
+            ('attrdict', FUSED_ATTRDICT_FORMATTERS['block']),
+            ('lazy (all read)', lambda block: read_all(FUSED_LAZY_FORMATTERS['block'](block))),
+            ('records', FUSED_RECORD_FORMATTERS['block']),
+        )),
+    )
+
+    print("{0:<32} {1:<16} {2:>10} {3:>9}".format('payload', 'format', 'KiB', 'vs dict'))
+    for name, payload, formats in cases:
+        baseline = None
+        for format_name, fn in formats:
+            # warm the caches of the formatters, which are not part of the result
+            fn(payload)
+            size = measure(fn, payload)
+            if baseline is None:
+                baseline = size
+            print("{0:<32} {1:<16} {2:>10.1f} {3:>8.2f}x".format(
+                name,
+                format_name,
+                size / 1024,
+                size / baseline,
+            ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--logs', type=int, default=10000)
+    main(parser.parse_args().logs)
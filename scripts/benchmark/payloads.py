@@ -0,0 +1,109 @@
+"""
+JSON-RPC responses shaped like those of a busy mainnet node, for benchmarks.
+
+The values are generated from a fixed seed, so every run works on the same
+payloads.
+"""
+import random
+
+BLOCK_NUMBER = 8000000
+
+
+def _hex_bytes(rng, num_bytes):
+    return '0x' + ''.join('{:02x}'.format(rng.getrandbits(8)) for _ in range(num_bytes))
+
+
+def _hex_int(rng, bits):
+    return hex(rng.getrandbits(bits))
+
+
+def make_transaction(rng, block_hash, index):
+    return {
+        'blockHash': block_hash,
+        'blockNumber': hex(BLOCK_NUMBER),
+        'from': _hex_bytes(rng, 20),
+        'gas': _hex_int(rng, 20),
+        'gasPrice': _hex_int(rng, 36),
+        'hash': _hex_bytes(rng, 32),
+        'input': _hex_bytes(rng, rng.choice((0, 4, 68, 68, 132, 580))),
+        'nonce': _hex_int(rng, 16),
+        'r': _hex_bytes(rng, 32),
+        's': _hex_bytes(rng, 32),
+        'to': _hex_bytes(rng, 20),
+        'transactionIndex': hex(index),
+        'v': rng.choice(('0x25', '0x26', '0x1b', '0x1c')),
+        'value': _hex_int(rng, 64),
+    }
+
+
+def make_block(num_transactions=150, full_transactions=True, seed=0):
+    rng = random.Random(seed)
+    block_hash = _hex_bytes(rng, 32)
+    transactions = [
+        make_transaction(rng, block_hash, index) for index in range(num_transactions)
+    ]
+    if not full_transactions:
+        transactions = [transaction['hash'] for transaction in transactions]
+    return {
+        'difficulty': _hex_int(rng, 52),
+        'extraData': _hex_bytes(rng, 16),
+        'gasLimit': _hex_int(rng, 24),
+        'gasUsed': _hex_int(rng, 24),
+        'hash': block_hash,
+        'logsBloom': _hex_bytes(rng, 256),
+        'miner': _hex_bytes(rng, 20),
+        'mixHash': _hex_bytes(rng, 32),
+        'nonce': _hex_bytes(rng, 8),
+        'number': hex(BLOCK_NUMBER),
+        'parentHash': _hex_bytes(rng, 32),
+        'receiptsRoot': _hex_bytes(rng, 32),
+        'sha3Uncles': _hex_bytes(rng, 32),
+        'size': _hex_int(rng, 16),
+        'stateRoot': _hex_bytes(rng, 32),
+        'timestamp': _hex_int(rng, 31),
+        'totalDifficulty': _hex_int(rng, 80),
+        'transactions': transactions,
+        'transactionsRoot': _hex_bytes(rng, 32),
+        'uncles': [],
+    }
+
+
+def make_log(rng, index):
+    return {
+        'address': _hex_bytes(rng, 20),
+        'blockHash': _hex_bytes(rng, 32),
+        'blockNumber': hex(BLOCK_NUMBER + index // 50),
+        'data': _hex_bytes(rng, rng.choice((0, 32, 64, 96))),
+        'logIndex': hex(index % 50),
+        'removed': False,
+        'topics': [_hex_bytes(rng, 32) for _ in range(rng.randint(1, 4))],
+        'transactionHash': _hex_bytes(rng, 32),
+        'transactionIndex': hex(index % 150),
+    }
+
+
+def make_logs(num_logs=1000, seed=0):
+    rng = random.Random(seed)
+    return [make_log(rng, index) for index in range(num_logs)]
+
+
+def make_receipt(num_logs=4, seed=0):
+    rng = random.Random(seed)
+    return {
+        'blockHash': _hex_bytes(rng, 32),
+        'blockNumber': hex(BLOCK_NUMBER),
+        'contractAddress': None,
+        'cumulativeGasUsed': _hex_int(rng, 24),
+        'from': _hex_bytes(rng, 20),
+        'gasUsed': _hex_int(rng, 20),
+        'logs': [make_log(rng, index) for index in range(num_logs)],
+        'logsBloom': _hex_bytes(rng, 256),
+        'status': '0x1',
+        'to': _hex_bytes(rng, 20),
+        'transactionHash': _hex_bytes(rng, 32),
+        'transactionIndex': '0x1',
+    }
+
+
+def make_response(result, request_id=1):
+    return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
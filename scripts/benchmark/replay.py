@@ -0,0 +1,99 @@
+"""
+Measures the throughput of the default middleware stack, by replaying the
+requests of a cassette recorded with ``web3.providers.RecordingProvider``.
+Without a cassette, one is made from the synthetic payloads of ``payloads``.
+
+    python scripts/benchmark/replay.py [--cassette PATH] [--repeat N]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from payloads import (  # noqa: E402
+    BLOCK_NUMBER,
+    make_block,
+    make_logs,
+    make_receipt,
+    make_response,
+)
+from web3 import Web3  # noqa: E402
+from web3.providers import (  # noqa: E402
+    BaseProvider,
+    RecordingProvider,
+    ReplayProvider,
+)
+
+SYNTHETIC_REQUESTS = (
+    (('vns_getBlockByNumber', [hex(BLOCK_NUMBER), True]), make_block()),
+    (('vns_getBlockByNumber', [hex(BLOCK_NUMBER), False]), make_block(full_transactions=False)),
+    (('vns_getLogs', [{'fromBlock': hex(BLOCK_NUMBER)}]), make_logs()),
+    (('vns_getTransactionReceipt', ['0x' + '11' * 32]), make_receipt()),
+)
+
+
+class SyntheticProvider(BaseProvider):
+    def __init__(self):
+        self.results = {
+            json.dumps(request): result for request, result in SYNTHETIC_REQUESTS
+        }
+
+    def make_request(self, method, params):
+        return make_response(self.results[json.dumps((method, params))])
+
+    def isConnected(self):
+        return True
+
+
+def record_synthetic_cassette(cassette_path):
+    provider = RecordingProvider(SyntheticProvider(), cassette_path)
+    for (method, params), _ in SYNTHETIC_REQUESTS:
+        provider.make_request(method, params)
+
+
+def load_requests(cassette_path):
+    with open(cassette_path, 'rb') as cassette:
+        return [
+            (exchange['method'], exchange['params'])
+            for exchange in map(json.loads, cassette)
+            if 'result' in exchange['response']
+        ]
+
+
+def requests_per_second(make_request, requests, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for method, params in requests:
+            make_request(method, params)
+    return len(requests) * repeat / (time.perf_counter() - start)
+
+
+def main(cassette_path, repeat):
+    if cassette_path is None:
+        cassette_path = os.path.join(tempfile.mkdtemp(), 'cassette.jsonl')
+        record_synthetic_cassette(cassette_path)
+
+    requests = load_requests(cassette_path)
+    provider = ReplayProvider(cassette_path)
+    w3 = Web3(provider)
+    print("Replaying {0} requests from {1}, {2} times".format(
+        len(requests), cassette_path, repeat,
+    ))
+    print("  provider only:     {0:>10.1f} requests/s".format(
+        requests_per_second(provider.make_request, requests, repeat),
+    ))
+    print("  middleware stack:  {0:>10.1f} requests/s".format(
+        requests_per_second(w3.manager.request_blocking, requests, repeat),
+    ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--cassette', default=None)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    main(args.cassette, args.repeat)
@@ -11,6 +11,12 @@ extras_require = {
         "py-geth>=2.0.1,<3.0.0",
         "pytest-ethereum>=0.1.3a6,<1.0.0",
     ],
+    'async': [
+        "aiohttp>=3.5.2,<4",
+    ],
+    'fastjson': [
+        "orjson>=2.0.7",
+    ],
     'linter': [
         "flake8==3.4.1",
         "isort>=4.2.15,<4.3.5",
@@ -51,6 +57,7 @@ extras_require = {
 
 extras_require['dev'] = (
     extras_require['tester'] +
+    extras_require['async'] +
     extras_require['linter'] +
     extras_require['docs'] +
     extras_require['dev']
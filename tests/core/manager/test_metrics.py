@@ -0,0 +1,154 @@
+import pytest
+
+from web3 import Web3
+from web3._utils.metrics import (
+    MetricsCollector,
+)
+from web3.middleware import (
+    construct_simple_cache_middleware,
+)
+from web3.providers import (
+    BaseProvider,
+    LoadBalancedProvider,
+    RecordingProvider,
+)
+from web3.providers.auto import (
+    AutoProvider,
+)
+
+ENDPOINT = 'http://node:8545'
+
+
+class MeasuredProvider(BaseProvider):
+    def make_request(self, method, params):
+        with self._measure_request(ENDPOINT, method) as measurement:
+            measurement.request_bytes = 10
+            if method == 'vns_fail':
+                raise ConnectionError("node unreachable")
+            if method == 'vns_reject':
+                response = {'error': {'code': -32000, 'message': 'rejected'}}
+            else:
+                response = {'result': '0x1'}
+            measurement.response_bytes = 20
+            measurement.response = response
+        return response
+
+    def isConnected(self):
+        return True
+
+
+def test_requests_are_counted_by_endpoint_and_method():
+    w3 = Web3(MeasuredProvider(), middlewares=[])
+    metrics = w3.manager.enable_metrics()
+    assert w3.metrics is metrics
+
+    w3.manager.request_blocking('vns_blockNumber', [])
+    w3.manager.request_blocking('vns_blockNumber', [])
+    with pytest.raises(ValueError):
+        w3.manager.request_blocking('vns_reject', [])
+    with pytest.raises(ConnectionError):
+        w3.manager.request_blocking('vns_fail', [])
+
+    methods = metrics.snapshot()['endpoints'][ENDPOINT]
+    assert methods['vns_blockNumber']['requests'] == 2
+    assert methods['vns_blockNumber']['errors'] == {}
+    assert methods['vns_blockNumber']['request_bytes'] == 20
+    assert methods['vns_blockNumber']['response_bytes'] == 40
+    assert methods['vns_blockNumber']['latency']['count'] == 2
+    assert methods['vns_reject']['errors'] == {'rpc_error:-32000': 1}
+    assert methods['vns_fail']['errors'] == {'ConnectionError': 1}
+
+
+def test_disabled_metrics_are_not_recorded():
+    provider = MeasuredProvider()
+    w3 = Web3(provider, middlewares=[])
+    metrics = w3.manager.enable_metrics()
+    w3.manager.disable_metrics()
+    w3.manager.request_blocking('vns_blockNumber', [])
+
+    assert w3.metrics is None
+    assert provider.metrics is None
+    assert metrics.snapshot() == {'endpoints': {}, 'caches': {}}
+
+
+def test_metrics_follow_provider_changes():
+    old_provider, new_provider = MeasuredProvider(), MeasuredProvider()
+    w3 = Web3(old_provider, middlewares=[])
+    metrics = w3.manager.enable_metrics()
+    w3.provider = new_provider
+
+    assert old_provider.metrics is None
+    assert new_provider.metrics is metrics
+
+
+def test_auto_provider_forwards_metrics_to_active_provider():
+    auto_provider = AutoProvider([MeasuredProvider])
+    w3 = Web3(auto_provider, middlewares=[])
+    metrics = w3.manager.enable_metrics()
+    profiler = w3.manager.enable_profiling()
+    w3.manager.request_blocking('vns_blockNumber', [])
+
+    assert auto_provider._active_provider.metrics is metrics
+    assert auto_provider._active_provider.profiler is profiler
+    assert metrics.snapshot()['endpoints'][ENDPOINT]['vns_blockNumber']['requests'] == 1
+
+    w3.manager.disable_metrics()
+    w3.manager.disable_profiling()
+    assert auto_provider._active_provider.metrics is None
+    assert auto_provider._active_provider.profiler is None
+
+
+def test_load_balanced_provider_forwards_metrics_and_profiler():
+    providers = [MeasuredProvider(), MeasuredProvider()]
+    w3 = Web3(LoadBalancedProvider(providers, head_refresh_interval=None), middlewares=[])
+    metrics = w3.manager.enable_metrics()
+    profiler = w3.manager.enable_profiling()
+
+    assert all(provider.metrics is metrics for provider in providers)
+    assert all(provider.profiler is profiler for provider in providers)
+
+    w3.manager.disable_profiling()
+    assert all(provider.profiler is None for provider in providers)
+
+
+def test_recording_provider_forwards_metrics(tmpdir):
+    provider = MeasuredProvider()
+    w3 = Web3(RecordingProvider(provider, str(tmpdir.join('cassette.jsonl'))), middlewares=[])
+    metrics = w3.manager.enable_metrics()
+    profiler = w3.manager.enable_profiling()
+    w3.manager.request_blocking('vns_blockNumber', [])
+
+    assert provider.metrics is metrics
+    assert provider.profiler is profiler
+    assert metrics.snapshot()['endpoints'][ENDPOINT]['vns_blockNumber']['requests'] == 1
+
+
+def test_cache_hits_are_counted():
+    cache_middleware = construct_simple_cache_middleware(dict, {'web3_clientVersion'})
+    w3 = Web3(MeasuredProvider(), middlewares=[cache_middleware])
+    metrics = w3.manager.enable_metrics()
+    for _ in range(4):
+        w3.manager.request_blocking('web3_clientVersion', [])
+
+    lookups = metrics.snapshot()['caches']['simple_cache']['web3_clientVersion']
+    assert lookups == {'hits': 3, 'misses': 1, 'hit_rate': 0.75}
+    assert metrics.snapshot()['endpoints'][ENDPOINT]['web3_clientVersion']['requests'] == 1
+
+
+def test_text_exposition_format():
+    metrics = MetricsCollector(buckets=(0.1, 1))
+    metrics.record_request(ENDPOINT, 'vns_call', 0.05, 10, 20)
+    metrics.record_request(ENDPOINT, 'vns_call', 0.5, 10, 20, error='TimeoutError')
+    metrics.record_cache_lookup('simple_cache', 'net_version', hit=True)
+    lines = metrics.to_text().splitlines()
+
+    labels = 'endpoint="{0}",method="vns_call"'.format(ENDPOINT)
+    assert '# TYPE web3_requests_total counter' in lines
+    assert 'web3_requests_total{%s} 2' % labels in lines
+    assert 'web3_request_errors_total{%s,error="TimeoutError"} 1' % labels in lines
+    assert 'web3_request_bytes_total{%s} 20' % labels in lines
+    assert 'web3_request_duration_seconds_bucket{%s,le="0.1"} 1' % labels in lines
+    assert 'web3_request_duration_seconds_bucket{%s,le="1"} 2' % labels in lines
+    assert 'web3_request_duration_seconds_bucket{%s,le="+Inf"} 2' % labels in lines
+    assert 'web3_request_duration_seconds_count{%s} 2' % labels in lines
+    assert 'web3_cache_hits_total{cache="simple_cache",method="net_version"} 1' in lines
@@ -0,0 +1,115 @@
+from web3.datastructures import (
+    NamedElementOnion,
+)
+from web3.manager import (
+    RequestManager,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+
+class DummyProvider(BaseProvider):
+    def make_request(self, method, params):
+        return {'result': params}
+
+
+def recording_middleware(name, handles_methods=None):
+    def middleware(make_request, web3):
+        def middleware_fn(method, params):
+            return make_request(method, params + [name])
+        return middleware_fn
+    if handles_methods is not None:
+        middleware.handles_methods = handles_methods
+    return middleware
+
+
+def test_middleware_is_skipped_for_methods_it_does_not_handle():
+    manager = RequestManager(None, DummyProvider(), middlewares=[
+        recording_middleware('all'),
+        recording_middleware('call-only', {'vns_call'}),
+    ])
+
+    assert manager.request_blocking('vns_call', []) == ['all', 'call-only']
+    assert manager.request_blocking('vns_blockNumber', []) == ['all']
+
+
+def test_method_chains_are_rebuilt_when_onion_changes():
+    manager = RequestManager(None, DummyProvider(), middlewares=[recording_middleware('outer')])
+    assert manager.request_blocking('vns_call', []) == ['outer']
+
+    manager.middleware_onion.add(recording_middleware('call-only', {'vns_call'}), 'call-only')
+    assert manager.request_blocking('vns_call', []) == ['call-only', 'outer']
+
+    manager.middleware_onion.remove('call-only')
+    assert manager.request_blocking('vns_call', []) == ['outer']
+
+
+def test_request_func_is_reused_until_onion_changes():
+    provider = DummyProvider()
+    manager = RequestManager(None, provider, middlewares=[recording_middleware('outer')])
+
+    request_func = provider.request_func(None, manager.middleware_onion)
+    assert provider.request_func(None, manager.middleware_onion) is request_func
+
+    manager.middleware_onion.add(recording_middleware('inner'))
+    assert provider.request_func(None, manager.middleware_onion) is not request_func
+
+
+def test_onion_elements_are_cached_until_mutated():
+    first, second = object(), object()
+    onion = NamedElementOnion([(first, 'first')], valid_element=lambda element: False)
+
+    elements = onion.elements
+    assert elements == (first,)
+    assert onion.elements is elements
+
+    onion.inject(second, 'second', layer=0)
+    assert onion.elements == (first, second)
+    onion.replace('second', first)
+    assert onion.elements == (first, first)
+    onion.clear()
+    assert onion.elements == ()
+
+
+def test_middleware_is_set_up_once_for_all_methods():
+    setups = []
+
+    def stateful_middleware(make_request, web3):
+        filters = {}
+        setups.append(filters)
+
+        def middleware_fn(method, params):
+            if method == 'vns_newFilter':
+                filters['0x1'] = params
+                return {'result': '0x1'}
+            elif method == 'vns_getFilterChanges' and params[0] in filters:
+                return {'result': ['local']}
+            return make_request(method, params)
+        return middleware_fn
+
+    manager = RequestManager(None, DummyProvider(), middlewares=[
+        stateful_middleware,
+        recording_middleware('new-filter-only', {'vns_newFilter'}),
+    ])
+
+    assert manager.request_blocking('vns_newFilter', [{}]) == '0x1'
+    assert manager.request_blocking('vns_getFilterChanges', ['0x1']) == ['local']
+    assert len(setups) == 1
+
+
+def test_inner_requests_use_the_middlewares_of_their_method():
+    def block_number_middleware(make_request, web3):
+        def middleware_fn(method, params):
+            if method == 'vns_call':
+                return make_request('vns_blockNumber', [])
+            return make_request(method, params)
+        return middleware_fn
+
+    manager = RequestManager(None, DummyProvider(), middlewares=[
+        block_number_middleware,
+        recording_middleware('call-only', {'vns_call'}),
+        recording_middleware('block-number-only', {'vns_blockNumber'}),
+    ])
+
+    assert manager.request_blocking('vns_call', []) == ['block-number-only']
@@ -0,0 +1,85 @@
+import pytest
+
+from web3.manager import (
+    RequestManager,
+)
+from web3.middleware import (
+    construct_fixture_middleware,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+
+class BatchingProvider(BaseProvider):
+    def __init__(self):
+        self.batches = []
+
+    def make_request(self, method, params):
+        self.batches.append([(method, params)])
+        return {'result': [method] + list(params)}
+
+    def make_batch_request(self, requests):
+        self.batches.append(list(requests))
+        return [
+            {'error': 'failed'} if method == 'fail' else {'result': [method] + list(params)}
+            for method, params in requests
+        ]
+
+
+def test_request_batch_sends_requests_together():
+    provider = BatchingProvider()
+    manager = RequestManager(None, provider, middlewares=[])
+
+    requests = [('method_{0}'.format(i), [i]) for i in range(10)]
+    results = manager.request_batch(requests)
+
+    assert results == [['method_{0}'.format(i), i] for i in range(10)]
+    assert provider.batches == [requests]
+
+
+def test_request_batch_runs_middlewares_per_request():
+    def suffix_middleware(make_request, web3):
+        def middleware(method, params):
+            response = make_request(method + '|A', params + ['A'])
+            return {'result': response['result'] + ['done']}
+        return middleware
+
+    provider = BatchingProvider()
+    manager = RequestManager(None, provider, middlewares=[suffix_middleware])
+
+    results = manager.request_batch([('a', []), ('b', [])])
+
+    assert results == [['a|A', 'A', 'done'], ['b|A', 'A', 'done']]
+    assert sorted(provider.batches[0]) == [('a|A', ['A']), ('b|A', ['A'])]
+
+
+def test_request_batch_skips_provider_for_middleware_responses():
+    provider = BatchingProvider()
+    fixture_middleware = construct_fixture_middleware({'cached': 'from-fixture'})
+    manager = RequestManager(None, provider, middlewares=[fixture_middleware])
+
+    results = manager.request_batch([('cached', []), ('a', [1]), ('b', [2])])
+
+    assert results == ['from-fixture', ['a', 1], ['b', 2]]
+    assert len(provider.batches) == 1
+    assert sorted(provider.batches[0]) == [('a', [1]), ('b', [2])]
+
+
+def test_request_batch_raises_on_error():
+    provider = BatchingProvider()
+    manager = RequestManager(None, provider, middlewares=[])
+
+    with pytest.raises(ValueError):
+        manager.request_batch([('a', []), ('fail', [])])
+
+
+def test_request_batch_with_default_provider_batching():
+    class SingleRequestProvider(BaseProvider):
+        def make_request(self, method, params):
+            return {'result': method}
+
+    manager = RequestManager(None, SingleRequestProvider(), middlewares=[])
+
+    assert manager.request_batch([('a', []), ('b', [])]) == ['a', 'b']
+    assert manager.request_batch([]) == []
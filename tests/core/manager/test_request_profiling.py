@@ -0,0 +1,120 @@
+import time
+
+from web3._utils.profiling import (
+    LatencyHistogram,
+)
+from web3.manager import (
+    RequestManager,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+DELAY = 0.02
+
+
+class SlowProvider(BaseProvider):
+    def make_request(self, method, params):
+        with self._time_stage(method, 'transport'):
+            time.sleep(DELAY)
+        return {'result': params}
+
+
+def sleeping_middleware(delay):
+    def middleware(make_request, web3):
+        def middleware_fn(method, params):
+            time.sleep(delay)
+            return make_request(method, params)
+        return middleware_fn
+    return middleware
+
+
+def nested_request_middleware(make_request, web3):
+    def middleware_fn(method, params):
+        if method == 'vns_call':
+            web3.manager.request_blocking('vns_blockNumber', [])
+        return make_request(method, params)
+    return middleware_fn
+
+
+def test_time_is_recorded_by_stage_and_method():
+    manager = RequestManager(None, SlowProvider(), middlewares=[
+        (sleeping_middleware(DELAY), 'outer'),
+        (sleeping_middleware(0), 'inner'),
+    ])
+    profiler = manager.enable_profiling()
+    manager.request_blocking('vns_call', [])
+
+    stages = profiler.snapshot()['vns_call']
+    assert set(stages) == {
+        'total',
+        'middleware:outer',
+        'middleware:inner',
+        'route',
+        'transport',
+    }
+    assert all(stage['count'] == 1 for stage in stages.values())
+    # each stage only counts its own time
+    assert DELAY <= stages['middleware:outer']['total'] < 2 * DELAY
+    assert stages['middleware:inner']['total'] < DELAY
+    assert stages['route']['total'] < DELAY
+    assert DELAY <= stages['transport']['total'] < 2 * DELAY
+    assert stages['total']['total'] >= 2 * DELAY
+
+
+class Web3Stub:
+    def __init__(self, middlewares):
+        self.manager = RequestManager(self, SlowProvider(), middlewares=middlewares)
+
+
+def test_nested_requests_are_recorded_under_their_own_method():
+    manager = Web3Stub([(nested_request_middleware, 'nested')]).manager
+    profiler = manager.enable_profiling()
+    manager.request_blocking('vns_call', [])
+
+    snapshot = profiler.snapshot()
+    assert snapshot['vns_blockNumber']['transport']['count'] == 1
+    assert snapshot['vns_call']['middleware:nested']['total'] < DELAY
+
+
+def test_unnamed_middlewares_are_named_after_their_function():
+    manager = RequestManager(None, SlowProvider(), middlewares=[nested_request_middleware])
+    profiler = manager.enable_profiling()
+    manager.request_blocking('vns_blockNumber', [])
+
+    assert 'middleware:nested_request_middleware' in profiler.snapshot()['vns_blockNumber']
+
+
+def test_disabling_profiling_restores_the_unprofiled_chain():
+    provider = SlowProvider()
+    manager = RequestManager(None, provider, middlewares=[sleeping_middleware(0)])
+    unprofiled = provider.request_func(None, manager.middleware_onion)
+
+    profiler = manager.enable_profiling()
+    assert provider.request_func(None, manager.middleware_onion) is not unprofiled
+
+    manager.disable_profiling()
+    manager.request_blocking('vns_call', [])
+    assert provider.profiler is None
+    assert profiler.snapshot() == {}
+
+
+def test_profiler_follows_provider_changes():
+    manager = RequestManager(None, SlowProvider(), middlewares=[])
+    old_provider = manager.provider
+    profiler = manager.enable_profiling()
+
+    manager.provider = SlowProvider()
+    assert manager.provider.profiler is profiler
+    assert old_provider.profiler is None
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=(0.001, 0.01))
+    for seconds in (0.0005, 0.001, 0.005, 0.5):
+        histogram.record(seconds)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 4
+    assert snapshot['max'] == 0.5
+    assert snapshot['buckets'] == [(0.001, 2), (0.01, 1), (None, 1)]
@@ -0,0 +1,231 @@
+import pytest
+
+from web3 import Web3
+from web3.datastructures import (
+    AttributeDict,
+    BlockRecord,
+    LazyAttributeDict,
+    LogRecord,
+    Record,
+    TransactionRecord,
+)
+from web3.exceptions import (
+    FieldFormattingError,
+)
+from web3.middleware import (
+    attrdict_middleware,
+    pythonic_middleware,
+)
+from web3.middleware.pythonic import (
+    FUSED_ATTRDICT_FORMATTERS,
+    FUSED_FORMATTERS,
+    FUSED_LAZY_FORMATTERS,
+    FUSED_RECORD_FORMATTERS,
+    block_formatter,
+    filter_result_formatter,
+    receipt_formatter,
+    transaction_formatter,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+ADDRESS = '0xd3cda913deb6f67967b99d67acdfa1712c293601'
+HASH = '0x' + '1a' * 32
+
+TRANSACTION = {
+    'blockHash': HASH,
+    'blockNumber': '0x7a1200',
+    'from': ADDRESS,
+    'gas': '0x5208',
+    'gasPrice': '0x3b9aca00',
+    'hash': HASH,
+    'input': '0x',
+    'nonce': '0x1',
+    'r': '0x' + '0f' * 31,
+    's': '0x' + '2b' * 32,
+    'to': ADDRESS,
+    'transactionIndex': '0x0',
+    'v': '0x25',
+    'value': '0xde0b6b3a7640000',
+}
+
+LOG = {
+    'address': ADDRESS,
+    'blockHash': HASH,
+    'blockNumber': '0x7a1200',
+    'data': '0x' + '00' * 32,
+    'logIndex': '0x3',
+    'removed': False,
+    'topics': [HASH, HASH],
+    'transactionHash': HASH,
+    'transactionIndex': '0x0',
+}
+
+RECEIPT = {
+    'blockHash': HASH,
+    'blockNumber': '0x7a1200',
+    'contractAddress': None,
+    'cumulativeGasUsed': '0xa410',
+    'from': ADDRESS,
+    'gasUsed': '0x5208',
+    'logs': [LOG],
+    'logsBloom': '0x' + '00' * 256,
+    'status': '0x1',
+    'to': ADDRESS,
+    'transactionHash': HASH,
+    'transactionIndex': '0x0',
+}
+
+BLOCK = {
+    'difficulty': '0x8a3a7d1b5d8d',
+    'extraData': '0x617369612d65617374322d32',
+    'gasLimit': '0x7a121d',
+    'gasUsed': '0x5208',
+    'hash': HASH,
+    'logsBloom': '0x' + '00' * 256,
+    'miner': ADDRESS,
+    'mixHash': HASH,
+    'nonce': '0x0123456789abcdef',
+    'number': '0x7a1200',
+    'parentHash': HASH,
+    'receiptsRoot': HASH,
+    'sealFields': [{'unknown': '0x1'}],
+    'sha3Uncles': HASH,
+    'size': '0x21c',
+    'stateRoot': HASH,
+    'timestamp': '0x5c5b1a1f',
+    'totalDifficulty': '0x1b6b8aa5bd2d58c2a2b',
+    'transactions': [TRANSACTION, TRANSACTION],
+    'transactionsRoot': HASH,
+    'uncles': [HASH],
+}
+
+
+@pytest.mark.parametrize(
+    'name,layered_formatter,value',
+    (
+        ('transaction', transaction_formatter, TRANSACTION),
+        ('receipt', receipt_formatter, RECEIPT),
+        ('block', block_formatter, BLOCK),
+        ('block', block_formatter, dict(BLOCK, transactions=[HASH, HASH])),
+    ),
+)
+def test_fused_formatters_match_layered_formatters(name, layered_formatter, value):
+    expected = layered_formatter(value)
+    assert FUSED_FORMATTERS[name](value) == expected
+
+    fused_attrdict = FUSED_ATTRDICT_FORMATTERS[name](value)
+    assert fused_attrdict == AttributeDict.recursive(expected)
+    assert isinstance(fused_attrdict, AttributeDict)
+
+    fused_lazy = FUSED_LAZY_FORMATTERS[name](value)
+    assert fused_lazy == AttributeDict.recursive(expected)
+    assert isinstance(fused_lazy, LazyAttributeDict)
+
+    fused_record = FUSED_RECORD_FORMATTERS[name](value)
+    assert fused_record == AttributeDict.recursive(expected)
+    assert isinstance(fused_record, Record)
+
+
+@pytest.mark.parametrize('value', ([LOG, LOG], [HASH], []))
+def test_fused_filter_result_formatter(value):
+    assert FUSED_FORMATTERS['filter_result'](value) == filter_result_formatter(value)
+
+
+def test_fused_formatters_pass_none_through():
+    assert FUSED_FORMATTERS['block'](None) is None
+    assert FUSED_ATTRDICT_FORMATTERS['receipt'](None) is None
+
+
+def test_fused_formatter_names_field_which_failed():
+    with pytest.raises(ValueError, match='logsBloom'):
+        FUSED_FORMATTERS['block'](dict(BLOCK, logsBloom='0x' + '01' * 300))
+
+
+def test_fused_formatter_names_path_of_nested_field():
+    transactions = [TRANSACTION, dict(TRANSACTION, value='not hex')]
+    with pytest.raises(FieldFormattingError) as excinfo:
+        FUSED_FORMATTERS['block'](dict(BLOCK, transactions=transactions))
+
+    assert excinfo.value.path == 'transactions[1].value'
+    assert str(excinfo.value) == "Could not format field 'transactions[1].value'"
+    # the value is only in the original exception
+    assert isinstance(excinfo.value.__cause__, ValueError)
+    assert 'not hex' in str(excinfo.value.__cause__)
+
+
+class BlockProvider(BaseProvider):
+    def make_request(self, method, params):
+        return {'jsonrpc': '2.0', 'id': 1, 'result': BLOCK}
+
+
+def test_block_is_attrdict_with_attrdict_middleware():
+    w3 = Web3(BlockProvider(), middlewares=[attrdict_middleware, pythonic_middleware])
+    block = w3.manager.request_blocking('vns_getBlockByNumber', [8000000, True])
+
+    assert isinstance(block, AttributeDict)
+    assert isinstance(block.transactions[0], AttributeDict)
+    assert isinstance(block.sealFields[0], AttributeDict)
+    assert block.number == 8000000
+    assert block.miner == Web3.toChecksumAddress(ADDRESS)
+
+
+def test_block_is_dict_without_attrdict_middleware():
+    w3 = Web3(BlockProvider(), middlewares=[pythonic_middleware])
+    block = w3.manager.request_blocking('vns_getBlockByNumber', [8000000, True])
+
+    assert type(block) is dict
+    assert type(block['transactions'][0]) is dict
+    assert block['number'] == 8000000
+
+
+def test_lazy_result_format():
+    w3 = Web3(BlockProvider(), middlewares=[attrdict_middleware, pythonic_middleware])
+    w3.result_format = 'lazy'
+    block = w3.manager.request_blocking('vns_getBlockByNumber', [8000000, True])
+
+    assert isinstance(block, LazyAttributeDict)
+    assert isinstance(block.transactions[0], LazyAttributeDict)
+    assert block.number == 8000000
+    assert block.transactions[0].value == 10 ** 18
+
+    w3.result_format = 'attrdict'
+    eager_block = w3.manager.request_blocking('vns_getBlockByNumber', [8000000, True])
+    assert not isinstance(eager_block, LazyAttributeDict)
+    assert eager_block == block
+
+
+def test_records_result_format():
+    w3 = Web3(BlockProvider(), middlewares=[attrdict_middleware, pythonic_middleware])
+    w3.result_format = 'records'
+    block = w3.manager.request_blocking('vns_getBlockByNumber', [8000000, True])
+
+    assert isinstance(block, BlockRecord)
+    assert isinstance(block.transactions[0], TransactionRecord)
+    assert isinstance(block.sealFields[0], AttributeDict)
+    assert block.number == 8000000
+    assert block['transactions'][0].value == 10 ** 18
+
+    w3.result_format = 'attrdict'
+    assert w3.manager.request_blocking('vns_getBlockByNumber', [8000000, True]) == block
+
+
+def test_records_result_format_converts_logs():
+    class LogsProvider(BaseProvider):
+        def make_request(self, method, params):
+            return {'jsonrpc': '2.0', 'id': 1, 'result': [LOG, LOG]}
+
+    w3 = Web3(LogsProvider(), middlewares=[attrdict_middleware, pythonic_middleware])
+    w3.result_format = 'records'
+    logs = w3.manager.request_blocking('vns_getLogs', [{}])
+
+    assert len(logs) == 2
+    assert all(isinstance(log, LogRecord) for log in logs)
+    assert logs[0].logIndex == 3
+
+
+def test_unknown_result_format():
+    w3 = Web3(BlockProvider(), middlewares=[])
+    with pytest.raises(ValueError):
+        w3.result_format = 'unknown'
@@ -12,9 +12,14 @@ from requests.exceptions import (
 )
 
 import web3
+from web3.exceptions import (
+    CircuitBreakerOpen,
+)
 from web3.middleware.exception_retry_request import (
+    RetryPolicy,
     check_if_retry_on_failure,
     exception_retry_middleware,
+    get_retry_after,
 )
 from web3.providers import (
     HTTPProvider,
@@ -27,7 +32,8 @@ def exception_retry_request_setup():
     web3 = Mock()
     provider = HTTPProvider()
     errors = (ConnectionError, HTTPError, Timeout, TooManyRedirects)
-    setup = exception_retry_middleware(provider.make_request, web3, errors, 5)
+    policy = RetryPolicy(retries=5, backoff=0)
+    setup = exception_retry_middleware(provider.make_request, web3, errors, policy=policy)
     setup.web3 = web3
     return setup
 
@@ -67,6 +73,19 @@ def test_valid_method_retried(make_post_request_mock, exception_retry_request_se
     assert make_post_request_mock.call_count == 5
 
 
+def test_retries_are_immediate_without_policy():
+    make_request = Mock(side_effect=ConnectionError)
+    middleware = exception_retry_middleware(make_request, Mock(), (ConnectionError,))
+
+    with patch('web3.middleware.exception_retry_request.time.sleep') as sleep_mock:
+        for _ in range(20):
+            with pytest.raises(ConnectionError):
+                middleware('vns_getBalance', [])
+    # every request gets all its attempts, without budget or circuit breaker
+    assert make_request.call_count == 100
+    assert sleep_mock.call_count == 0
+
+
 def test_is_strictly_default_http_middleware():
     web3 = HTTPProvider()
     assert 'http_retry_request' in web3.middlewares
@@ -82,3 +101,76 @@ def test_check_with_all_middlewares(make_post_request_mock):
     with pytest.raises(ConnectionError):
         w3.vns.blockNumber()
     assert make_post_request_mock.call_count == 5
+
+
+def test_retry_budget_limits_retries():
+    make_request = Mock(side_effect=ConnectionError)
+    policy = RetryPolicy(retries=5, backoff=0, budget_ratio=0, budget_min_retries=2)
+    middleware = exception_retry_middleware(
+        make_request,
+        Mock(),
+        (ConnectionError,),
+        policy=policy,
+    )
+
+    with pytest.raises(ConnectionError):
+        middleware('vns_getBalance', [])
+    assert make_request.call_count == 3
+
+    with pytest.raises(ConnectionError):
+        middleware('vns_getBalance', [])
+    assert make_request.call_count == 4
+
+
+def test_backoff_grows_exponentially():
+    policy = RetryPolicy(retries=10, backoff=1, max_backoff=5, jitter=False)
+    delays = [policy.get_retry_delay(attempt, ConnectionError()) for attempt in range(1, 6)]
+    assert delays == [1, 2, 4, 5, 5]
+
+
+def test_circuit_breaker_fails_fast():
+    make_request = Mock(side_effect=ConnectionError)
+    policy = RetryPolicy(retries=1, failure_threshold=3, reset_timeout=60)
+    middleware = exception_retry_middleware(
+        make_request,
+        Mock(),
+        (ConnectionError,),
+        policy=policy,
+    )
+
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            middleware('vns_getBalance', [])
+    with pytest.raises(CircuitBreakerOpen):
+        middleware('vns_getBalance', [])
+    assert make_request.call_count == 3
+
+
+def test_circuit_breaker_closes_after_successful_trial():
+    make_request = Mock(side_effect=[ConnectionError(), {'result': 1}, {'result': 2}])
+    policy = RetryPolicy(retries=1, failure_threshold=1, reset_timeout=0)
+    middleware = exception_retry_middleware(
+        make_request,
+        Mock(),
+        (ConnectionError,),
+        policy=policy,
+    )
+
+    with pytest.raises(ConnectionError):
+        middleware('vns_getBalance', [])
+    assert middleware('vns_getBalance', []) == {'result': 1}
+    assert middleware('vns_getBalance', []) == {'result': 2}
+
+
+def test_retry_after_header_is_honoured():
+    response = Mock(status_code=429, headers={'Retry-After': '3'})
+    exception = HTTPError(response=response)
+    assert get_retry_after(exception) == 3
+
+    policy = RetryPolicy(backoff=0)
+    assert policy.get_retry_delay(1, exception) == 3
+
+
+def test_retry_after_ignored_for_other_statuses():
+    response = Mock(status_code=500, headers={'Retry-After': '3'})
+    assert get_retry_after(HTTPError(response=response)) is None
@@ -1,6 +1,9 @@
 import pytest
 
 from web3 import Web3
+from web3._utils.ens import (
+    may_contain_ens_name,
+)
 from web3.exceptions import (
     InvalidAddress,
 )
@@ -52,3 +55,55 @@ def test_fail_name_resolver(w3):
     w3.middleware_onion.inject(return_chain_on_mainnet, layer=0)
     with pytest.raises(InvalidAddress, match=r'.*ethereum\.vns.*'):
         w3.vns.getBalance("ethereum.vns")
+
+
+def test_network_version_is_looked_up_once_per_provider(w3):
+    network_version_requests = []
+
+    def count_network_version_middleware(make_request, web3):
+        def middleware_fn(method, params):
+            if method == 'net_version':
+                network_version_requests.append(params)
+            return make_request(method, params)
+        return middleware_fn
+
+    w3.middleware_onion.inject(count_network_version_middleware, layer=0)
+    w3.middleware_onion.inject(construct_fixture_middleware({
+        'net_version': '1',
+        'vns_getBalance': BALANCE,
+    }), layer=0)
+    assert w3.vns.getBalance(NAME) == BALANCE
+    assert w3.vns.getBalance(NAME) == BALANCE
+    assert len(network_version_requests) == 1
+
+
+def test_params_without_names_are_passed_through(w3):
+    received = []
+
+    def receive_params_middleware(make_request, web3):
+        def middleware_fn(method, params):
+            received.append(params)
+            return {'result': BALANCE}
+        return middleware_fn
+
+    w3.middleware_onion.inject(receive_params_middleware, layer=0)
+    params = [ADDRESS, 'latest']
+    w3.manager.request_blocking('vns_getBalance', params)
+    assert received == [params]
+    assert received[0] is params
+
+
+@pytest.mark.parametrize(
+    'params,expected',
+    (
+        ([ADDRESS, 'latest'], False),
+        ([{'to': ADDRESS, 'data': '0x1234', 'gas': 21000}, 'pending'], False),
+        ([{'address': [ADDRESS, ADDRESS], 'topics': [None]}], False),
+        ([NAME, 'latest'], True),
+        ([{'to': NAME, 'value': 1}], True),
+        ([{'address': [ADDRESS, NAME]}], True),
+        (['0x' + 'zz' * 20], True),
+    ),
+)
+def test_may_contain_ens_name(params, expected):
+    assert may_contain_ens_name(params) is expected
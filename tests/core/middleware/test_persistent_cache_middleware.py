@@ -0,0 +1,123 @@
+import pytest
+
+from web3 import Web3
+from web3._utils.persistent_cache import (
+    PersistentResponseCache,
+)
+from web3.middleware import (
+    construct_persistent_cache_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+BLOCK_HASH = '0x' + '11' * 32
+FORKED_BLOCK_HASH = '0x' + '22' * 32
+TRANSACTION_HASH = '0x' + '33' * 32
+
+
+class ChainProvider(BaseProvider):
+    def __init__(self, block_hash=BLOCK_HASH, head='0x100'):
+        self.block_hash = block_hash
+        self.head = head
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        if method == 'vns_blockNumber':
+            result = self.head
+        elif method == 'vns_getTransactionReceipt':
+            result = {
+                'transactionHash': params[0],
+                'blockHash': self.block_hash,
+                'blockNumber': '0x10',
+            }
+        elif method == 'vns_getBlockByNumber':
+            result = {'hash': self.block_hash, 'number': '0x10'}
+        elif method == 'vns_getBlockByHash':
+            result = {'hash': params[0], 'number': '0x10'}
+        else:
+            result = []
+        return {'jsonrpc': '2.0', 'id': 1, 'result': result}
+
+
+@pytest.fixture
+def cache_path(tmpdir):
+    return str(tmpdir.join('responses.sqlite'))
+
+
+def make_web3(provider, cache_path, **kwargs):
+    return Web3(provider, middlewares=[
+        construct_persistent_cache_middleware(cache_path, **kwargs),
+    ])
+
+
+def test_responses_outlive_the_middleware(cache_path):
+    provider = ChainProvider()
+    w3 = make_web3(provider, cache_path)
+    block = w3.manager.request_blocking('vns_getBlockByHash', [BLOCK_HASH, False])
+
+    restarted_provider = ChainProvider()
+    restarted_w3 = make_web3(restarted_provider, cache_path)
+    cached_block = restarted_w3.manager.request_blocking('vns_getBlockByHash', [BLOCK_HASH, False])
+    assert cached_block == block
+    assert restarted_provider.requests == []
+
+
+def test_logs_are_only_cached_by_block_hash(cache_path):
+    provider = ChainProvider()
+    w3 = make_web3(provider, cache_path)
+    for _ in range(2):
+        w3.manager.request_blocking('vns_getLogs', [{'blockHash': BLOCK_HASH}])
+        w3.manager.request_blocking('vns_getLogs', [{'fromBlock': '0x1', 'toBlock': '0x10'}])
+
+    assert provider.requests.count('vns_getLogs') == 3
+
+
+def test_receipts_are_dropped_after_reorg(cache_path):
+    provider = ChainProvider()
+    w3 = make_web3(provider, cache_path)
+    receipt = w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH])
+    assert w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH]) == receipt
+    assert provider.requests.count('vns_getTransactionReceipt') == 1
+
+    # the canonical block at the receipt's height is still the same one
+    w3.manager.request_blocking('vns_getBlockByNumber', ['0x10', False])
+    w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH])
+    assert provider.requests.count('vns_getTransactionReceipt') == 1
+
+    provider.block_hash = FORKED_BLOCK_HASH
+    w3.manager.request_blocking('vns_getBlockByNumber', ['0x10', False])
+    reorged_receipt = w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH])
+    assert reorged_receipt['blockHash'] == FORKED_BLOCK_HASH
+    assert provider.requests.count('vns_getTransactionReceipt') == 2
+
+
+def test_receipts_are_cached_once_confirmed(cache_path):
+    provider = ChainProvider(head='0x11')
+    w3 = make_web3(provider, cache_path, confirmations=2)
+    w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH])
+    w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH])
+    assert provider.requests.count('vns_getTransactionReceipt') == 2
+
+    provider.head = '0x12'
+    w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH])
+    w3.manager.request_blocking('vns_getTransactionReceipt', [TRANSACTION_HASH])
+    assert provider.requests.count('vns_getTransactionReceipt') == 3
+    assert provider.requests.count('vns_blockNumber') == 3
+
+
+def test_oldest_responses_are_evicted(cache_path):
+    cache = PersistentResponseCache(cache_path, max_entries=10)
+    for index in range(11):
+        cache.set(str(index), {'result': index})
+
+    assert len(cache) == 9
+    assert cache.get('0') is None
+    assert cache.get('1') is None
+    assert cache.get('10') == {'result': 10}
+
+
+def test_max_entries_must_be_positive(cache_path):
+    with pytest.raises(ValueError):
+        PersistentResponseCache(cache_path, max_entries=0)
@@ -0,0 +1,98 @@
+import pytest
+
+from web3 import Web3
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.middleware import (
+    attrdict_middleware,
+    pythonic_middleware,
+)
+from web3.providers import (
+    BaseProvider,
+)
+
+BLOCK = {
+    'hash': '0x' + '1a' * 32,
+    'number': '0x7a1200',
+    'transactions': [],
+}
+
+
+class BlockProvider(BaseProvider):
+    def __init__(self):
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        if method == 'vns_blockNumber':
+            result = '0x7a1200'
+        else:
+            result = BLOCK
+        return {'jsonrpc': '2.0', 'id': 1, 'result': result}
+
+
+@pytest.fixture
+def w3():
+    return Web3(BlockProvider(), middlewares=[attrdict_middleware, pythonic_middleware])
+
+
+def test_raw_result_format(w3):
+    w3.result_format = 'raw'
+    block = w3.manager.request_blocking('vns_getBlockByNumber', [8000000, False])
+
+    assert type(block) is dict
+    assert block == BLOCK
+    # requests are still formatted
+    assert w3.provider.requests == [('vns_getBlockByNumber', ['0x7a1200', False])]
+
+
+@pytest.mark.parametrize(
+    'middlewares',
+    ([attrdict_middleware, pythonic_middleware], [pythonic_middleware]),
+)
+def test_raw_module_methods(middlewares):
+    w3 = Web3(BlockProvider(), middlewares=middlewares)
+
+    assert w3.vns.raw.getBlock(8000000) == BLOCK
+    assert w3.vns.raw.blockNumber == '0x7a1200'
+    assert w3.vns.getBlock(8000000)['number'] == 8000000
+
+
+def test_using_result_format(w3):
+    with w3.using_result_format('raw'):
+        assert w3.manager.request_blocking('vns_blockNumber', []) == '0x7a1200'
+    assert w3.manager.request_blocking('vns_blockNumber', []) == 8000000
+
+    with w3.using_result_format('attrdict'):
+        w3.result_format = 'raw'
+        assert isinstance(w3.vns.getBlock(8000000), AttributeDict)
+
+
+def test_using_result_format_only_affects_its_web3(w3):
+    other_w3 = Web3(BlockProvider(), middlewares=[attrdict_middleware, pythonic_middleware])
+    with w3.using_result_format('raw'):
+        assert other_w3.manager.request_blocking('vns_blockNumber', []) == 8000000
+
+
+def test_nested_requests_are_formatted():
+    nested_results = []
+
+    def block_number_middleware(make_request, web3):
+        def middleware(method, params):
+            if method == 'vns_getBlockByNumber':
+                nested_results.append(web3.manager.request_blocking('vns_blockNumber', []))
+            return make_request(method, params)
+        return middleware
+
+    w3 = Web3(
+        BlockProvider(),
+        middlewares=[block_number_middleware, attrdict_middleware, pythonic_middleware],
+    )
+    assert w3.vns.raw.getBlock(8000000) == BLOCK
+    assert nested_results == [8000000]
+
+
+def test_unknown_result_format_override(w3):
+    with pytest.raises(ValueError):
+        w3.using_result_format('unknown')
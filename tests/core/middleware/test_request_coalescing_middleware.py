@@ -0,0 +1,98 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import itertools
+import pytest
+import time
+
+from web3 import Web3
+from web3.middleware import (
+    construct_request_coalescing_middleware,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+class SlowProvider(BaseProvider):
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.counter = itertools.count()
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        time.sleep(self.delay)
+        if method == 'fail':
+            raise ValueError("failed")
+        return {'result': next(self.counter)}
+
+
+@pytest.fixture
+def provider():
+    return SlowProvider()
+
+
+@pytest.fixture
+def w3(provider):
+    w3 = Web3(provider=provider, middlewares=[])
+    w3.middleware_onion.add(construct_request_coalescing_middleware(
+        rpc_whitelist={'fake_endpoint', 'fail'},
+    ))
+    return w3
+
+
+def request_concurrently(w3, method, params, count=8):
+    with ThreadPoolExecutor(count) as executor:
+        futures = [
+            executor.submit(w3.manager.request_blocking, method, params)
+            for _ in range(count)
+        ]
+    return futures
+
+
+def test_concurrent_identical_requests_are_sent_once(w3, provider):
+    futures = request_concurrently(w3, 'fake_endpoint', [1])
+
+    assert {future.result() for future in futures} == {0}
+    assert len(provider.requests) == 1
+
+
+def test_requests_with_different_params_are_not_coalesced(w3, provider):
+    with ThreadPoolExecutor(2) as executor:
+        first = executor.submit(w3.manager.request_blocking, 'fake_endpoint', [1])
+        second = executor.submit(w3.manager.request_blocking, 'fake_endpoint', [2])
+
+    assert {first.result(), second.result()} == {0, 1}
+    assert len(provider.requests) == 2
+
+
+def test_non_whitelisted_requests_are_not_coalesced(w3, provider):
+    futures = request_concurrently(w3, 'not_whitelisted', [], count=3)
+
+    assert sorted(future.result() for future in futures) == [0, 1, 2]
+    assert len(provider.requests) == 3
+
+
+def test_exception_is_shared(w3, provider):
+    futures = request_concurrently(w3, 'fail', [], count=4)
+
+    for future in futures:
+        with pytest.raises(ValueError):
+            future.result()
+    assert len(provider.requests) == 1
+
+
+def test_nothing_is_kept_after_completion(w3, provider):
+    assert w3.manager.request_blocking('fake_endpoint', []) == 0
+    assert w3.manager.request_blocking('fake_endpoint', []) == 1
+
+
+def test_coalesced_requests_in_batch(w3, provider):
+    results = w3.manager.request_batch([
+        ('fake_endpoint', []),
+        ('fake_endpoint', []),
+    ])
+
+    assert results == [0, 0]
+    assert len(provider.requests) == 1
@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+from unittest.mock import (
+    patch,
+)
+
+from web3 import Web3
+from web3._utils.request import (
+    _get_async_session,
+    close_async_sessions,
+)
+from web3.middleware import (
+    async_attrdict_middleware,
+    async_pythonic_middleware,
+)
+from web3.providers.async_rpc import (
+    AsyncHTTPProvider,
+)
+
+URI = 'http://mynode.local:8545'
+
+
+def test_async_provider_uses_async_default_middlewares():
+    w3 = Web3(AsyncHTTPProvider(URI))
+
+    assert w3.middleware_onion.get('pythonic') is async_pythonic_middleware
+    assert w3.middleware_onion.get('attrdict') is async_attrdict_middleware
+    assert 'name_to_address' not in w3.middleware_onion
+    assert 'http_retry_request' in w3.provider.middlewares
+
+
+def test_user_provided_middlewares_are_kept():
+    w3 = Web3(AsyncHTTPProvider(URI), middlewares=[])
+
+    assert len(w3.middleware_onion) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_make_request():
+    async def fake_post_request(endpoint_uri, data, *args, **kwargs):
+        assert endpoint_uri == URI
+        return b'{"jsonrpc": "2.0", "id": 0, "result": "0x10"}'
+
+    with patch('web3.providers.async_rpc.async_make_post_request', new=fake_post_request):
+        w3 = Web3(AsyncHTTPProvider(URI))
+        result = await w3.manager.coro_request('vns_blockNumber', [])
+
+    assert result == 16
+
+
+@pytest.mark.asyncio
+async def test_async_is_connected_when_node_is_down():
+    provider = AsyncHTTPProvider('http://127.0.0.1:1')
+
+    assert await provider.coro_isConnected() is False
+
+
+def test_async_sessions_of_closed_loops_are_closed():
+    async def get_session():
+        return _get_async_session(URI)
+
+    loop = asyncio.new_event_loop()
+    session = loop.run_until_complete(get_session())
+    assert loop.run_until_complete(get_session()) is session
+    loop.close()
+
+    other_loop = asyncio.new_event_loop()
+    try:
+        other_session = other_loop.run_until_complete(get_session())
+    finally:
+        other_loop.close()
+    assert other_session is not session
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_provider_closes_its_session():
+    provider = AsyncHTTPProvider(URI)
+    session = _get_async_session(URI)
+    other_session = _get_async_session('http://othernode.local:8545')
+    await provider.close()
+
+    assert session.closed
+    assert not other_session.closed
+    assert _get_async_session(URI) is not session
+
+    await close_async_sessions()
+    assert other_session.closed
+
+
+def test_sync_is_connected_is_not_supported():
+    w3 = Web3(AsyncHTTPProvider(URI))
+
+    with pytest.raises(TypeError):
+        w3.isConnected()
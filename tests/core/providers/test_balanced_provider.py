@@ -0,0 +1,217 @@
+import pytest
+import threading
+import time
+
+from web3.exceptions import (
+    CannotHandleRequest,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.providers.balanced import (
+    LoadBalancedProvider,
+    is_hedgeable,
+)
+
+
+class FakeProvider(BaseProvider):
+    def __init__(self, name, block_number=1, fail=False, delay=0):
+        self.name = name
+        self.block_number = block_number
+        self.fail = fail
+        self.delay = delay
+        self.requests = []
+
+    def __str__(self):
+        return self.name
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("{0} is down".format(self.name))
+        if method == 'vns_blockNumber':
+            return {'result': hex(self.block_number)}
+        elif method == 'vns_newFilter':
+            return {'result': '0x{0}'.format(self.name)}
+        else:
+            return {'result': self.name}
+
+    def isConnected(self):
+        return not self.fail
+
+
+def test_requires_providers():
+    with pytest.raises(ValueError):
+        LoadBalancedProvider([])
+
+
+def test_fails_over_to_healthy_endpoint():
+    down = FakeProvider('down', fail=True)
+    up = FakeProvider('up')
+    provider = LoadBalancedProvider([down, up], head_refresh_interval=None)
+
+    for _ in range(5):
+        assert provider.make_request('vns_gasPrice', []) == {'result': 'up'}
+
+    # once it has failed, the broken endpoint is avoided
+    assert len(down.requests) == 1
+
+
+def test_raises_when_all_endpoints_fail():
+    provider = LoadBalancedProvider(
+        [FakeProvider('a', fail=True), FakeProvider('b', fail=True)],
+        head_refresh_interval=None,
+    )
+    with pytest.raises(CannotHandleRequest):
+        provider.make_request('vns_gasPrice', [])
+
+
+@pytest.mark.parametrize(
+    'method',
+    ('vns_sendTransaction', 'vns_sendRawTransaction', 'personal_sendTransaction'),
+)
+def test_transactions_do_not_fail_over(method):
+    down = FakeProvider('down', fail=True)
+    up = FakeProvider('up')
+    provider = LoadBalancedProvider([down, up], head_refresh_interval=None)
+    # make the failing endpoint look like the better one
+    provider.endpoints[1].latency = 0.5
+
+    with pytest.raises(ConnectionError):
+        provider.make_request(method, [{}])
+    assert up.requests == []
+
+
+def test_filter_requests_are_sticky():
+    first = FakeProvider('first')
+    second = FakeProvider('second')
+    provider = LoadBalancedProvider([first, second], head_refresh_interval=None)
+
+    filter_id = provider.make_request('vns_newFilter', [{}])['result']
+    owner = first if ('vns_newFilter', [{}]) in first.requests else second
+
+    for _ in range(5):
+        provider.make_request('vns_getFilterChanges', [filter_id])
+
+    local_filter_id = '0x{0}'.format(owner.name)
+    assert owner.requests.count(('vns_getFilterChanges', [local_filter_id])) == 5
+
+
+class SequentialFilterProvider(FakeProvider):
+    def make_request(self, method, params):
+        if method == 'vns_newFilter':
+            self.requests.append((method, params))
+            return {'result': '0x1'}
+        return super().make_request(method, params)
+
+
+def test_filter_ids_of_endpoints_do_not_collide(monkeypatch):
+    first = SequentialFilterProvider('first')
+    second = SequentialFilterProvider('second')
+    provider = LoadBalancedProvider([first, second], head_refresh_interval=None)
+    endpoints = {endpoint.provider: endpoint for endpoint in provider.endpoints}
+
+    filter_ids = {}
+    for node in (first, second):
+        monkeypatch.setattr(provider, '_choose_endpoint', lambda exclude=(): endpoints[node])
+        filter_ids[node] = provider.make_request('vns_newFilter', [{}])['result']
+    monkeypatch.undo()
+    assert filter_ids[first] != filter_ids[second]
+
+    assert provider.make_request('vns_getFilterChanges', [filter_ids[first]]) == {
+        'result': 'first',
+    }
+    assert provider.make_request('vns_uninstallFilter', [filter_ids[second]]) == {
+        'result': 'second',
+    }
+    assert first.requests[-1] == ('vns_getFilterChanges', ['0x1'])
+    assert second.requests[-1] == ('vns_uninstallFilter', ['0x1'])
+
+
+def test_lagging_endpoint_is_avoided():
+    lagging = FakeProvider('lagging', block_number=10)
+    current = FakeProvider('current', block_number=20)
+    provider = LoadBalancedProvider([lagging, current], head_refresh_interval=None)
+
+    for endpoint in provider.endpoints:
+        provider._update_head(endpoint, endpoint.provider.block_number)
+
+    for _ in range(5):
+        assert provider.make_request('vns_getBalance', ['0x0', 'latest']) == {'result': 'current'}
+    assert lagging.requests == []
+
+
+@pytest.mark.parametrize(
+    'method,expected',
+    (
+        ('vns_call', True),
+        ('vns_getBalance', True),
+        ('net_version', True),
+        ('vns_sendRawTransaction', False),
+        ('vns_sendTransaction', False),
+        ('vns_newFilter', False),
+        ('personal_listAccounts', False),
+    ),
+)
+def test_is_hedgeable(method, expected):
+    assert is_hedgeable(method) is expected
+
+
+def test_slow_request_is_hedged():
+    slow = FakeProvider('slow', delay=1)
+    fast = FakeProvider('fast')
+    provider = LoadBalancedProvider(
+        [slow, fast],
+        head_refresh_interval=None,
+        hedge_percentile=90,
+    )
+    provider._latencies.extend([0.01] * 20)
+    # make the slow endpoint look like the better one
+    provider.endpoints[1].latency = 0.5
+
+    start = time.monotonic()
+    assert provider.make_request('vns_call', [{}, 'latest']) == {'result': 'fast'}
+    assert time.monotonic() - start < 0.5
+    assert provider.hedged_requests == 1
+    assert provider.hedge_wins == 1
+
+
+def test_concurrent_primaries_are_not_queued():
+    provider = LoadBalancedProvider(
+        [FakeProvider('a', delay=0.05), FakeProvider('b', delay=0.05)],
+        head_refresh_interval=None,
+        hedge_percentile=90,
+        hedge_min_delay=0.5,
+    )
+    provider._latencies.extend([0.01] * 20)
+
+    # more requests than the workers of a default thread pool
+    threads = [
+        threading.Thread(target=provider.make_request, args=('vns_call', [{}, 'latest']))
+        for _ in range(64)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert provider.hedged_requests == 0
+
+
+def test_state_changing_request_is_not_hedged():
+    slow = FakeProvider('slow', delay=0.1)
+    provider = LoadBalancedProvider(
+        [slow, FakeProvider('fast')],
+        head_refresh_interval=None,
+        hedge_percentile=90,
+    )
+    provider._latencies.extend([0.01] * 20)
+    provider.endpoints[1].latency = 0.5
+
+    assert provider.make_request('vns_sendRawTransaction', ['0x']) == {'result': 'slow'}
+    assert provider.hedged_requests == 0
+
+
+def test_is_connected_if_any_endpoint_is():
+    provider = LoadBalancedProvider([FakeProvider('a', fail=True), FakeProvider('b')])
+    assert provider.isConnected()
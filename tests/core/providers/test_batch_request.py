@@ -0,0 +1,40 @@
+import json
+
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+
+
+def test_encode_batch_rpc_request():
+    provider = JSONBaseProvider()
+    request_ids, encoded = provider.encode_batch_rpc_request([
+        ('vns_blockNumber', []),
+        ('vns_getBalance', ['0x0', 'latest']),
+    ])
+
+    decoded = json.loads(encoded.decode())
+    assert [item['id'] for item in decoded] == request_ids
+    assert [item['method'] for item in decoded] == ['vns_blockNumber', 'vns_getBalance']
+    assert decoded[1]['params'] == ['0x0', 'latest']
+    assert len(set(request_ids)) == 2
+
+
+def test_decode_batch_rpc_response_matches_ids():
+    provider = JSONBaseProvider()
+    raw_response = b'[{"jsonrpc": "2.0", "id": 2, "result": "b"}, ' \
+                   b'{"jsonrpc": "2.0", "id": 1, "result": "a"}]'
+
+    responses = provider.decode_batch_rpc_response(raw_response, [1, 2, 3])
+
+    assert responses[0]['result'] == 'a'
+    assert responses[1]['result'] == 'b'
+    assert 'error' in responses[2]
+
+
+def test_decode_batch_rpc_response_with_batch_error():
+    provider = JSONBaseProvider()
+    raw_response = b'{"jsonrpc": "2.0", "id": null, "error": {"code": -32600}}'
+
+    responses = provider.decode_batch_rpc_response(raw_response, [1, 2])
+
+    assert [response['error'] for response in responses] == [{'code': -32600}] * 2
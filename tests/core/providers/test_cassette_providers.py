@@ -0,0 +1,79 @@
+import pytest
+import time
+
+from web3 import Web3
+from web3.exceptions import (
+    CannotHandleRequest,
+)
+from web3.providers import (
+    BaseProvider,
+    RecordingProvider,
+    ReplayProvider,
+)
+
+
+class CountingProvider(BaseProvider):
+    def __init__(self):
+        self.block_number = 0
+
+    def make_request(self, method, params):
+        if method == 'vns_blockNumber':
+            self.block_number += 1
+            return {'jsonrpc': '2.0', 'id': 0, 'result': hex(self.block_number)}
+        return {'jsonrpc': '2.0', 'id': 0, 'result': {'method': method, 'params': params}}
+
+    def isConnected(self):
+        return True
+
+
+@pytest.fixture
+def cassette_path(tmpdir):
+    return str(tmpdir.join('cassette.jsonl'))
+
+
+def test_replay_serves_recorded_responses(cassette_path):
+    recorder = Web3(RecordingProvider(CountingProvider(), cassette_path), middlewares=[])
+    recorded = [
+        recorder.manager.request_blocking('vns_blockNumber', []),
+        recorder.manager.request_blocking('vns_blockNumber', []),
+        recorder.manager.request_blocking('vns_getBalance', ['0x01', 'latest']),
+    ]
+
+    replayer = Web3(ReplayProvider(cassette_path), middlewares=[])
+    replayed = [
+        replayer.manager.request_blocking('vns_blockNumber', []),
+        replayer.manager.request_blocking('vns_blockNumber', []),
+        replayer.manager.request_blocking('vns_getBalance', ['0x01', 'latest']),
+    ]
+
+    assert replayed == recorded == ['0x1', '0x2', {
+        'method': 'vns_getBalance',
+        'params': ['0x01', 'latest'],
+    }]
+    # the last recorded response is repeated
+    assert replayer.manager.request_blocking('vns_blockNumber', []) == '0x2'
+
+
+def test_replay_of_batch(cassette_path):
+    recorder = RecordingProvider(CountingProvider(), cassette_path)
+    requests = [('vns_blockNumber', []), ('vns_getCode', ['0x01', 'latest'])]
+    recorded = recorder.make_batch_request(requests)
+
+    assert ReplayProvider(cassette_path).make_batch_request(requests) == recorded
+
+
+def test_replay_of_unrecorded_request(cassette_path):
+    RecordingProvider(CountingProvider(), cassette_path).make_request('vns_blockNumber', [])
+    provider = ReplayProvider(cassette_path)
+
+    with pytest.raises(CannotHandleRequest):
+        provider.make_request('vns_blockNumber', ['unexpected'])
+
+
+def test_replay_latency(cassette_path):
+    RecordingProvider(CountingProvider(), cassette_path).make_request('vns_blockNumber', [])
+    provider = ReplayProvider(cassette_path, latency=0.05)
+
+    start = time.monotonic()
+    provider.make_request('vns_blockNumber', [])
+    assert time.monotonic() - start >= 0.05
@@ -0,0 +1,71 @@
+import gc
+import threading
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from requests.adapters import (
+    HTTPAdapter,
+)
+
+from web3.providers.rpc import (
+    HTTPProvider,
+)
+
+
+def test_default_provider_uses_shared_session():
+    provider = HTTPProvider('http://127.0.0.1:8545')
+    assert provider.get_session() is None
+
+
+def test_session_kwargs_configure_adapter():
+    provider = HTTPProvider(
+        'http://127.0.0.1:8545',
+        session_kwargs={'pool_maxsize': 64, 'max_retries': 3, 'keep_alive': False},
+    )
+    session = provider.get_session()
+    assert session is provider.get_session()
+
+    adapter = session.get_adapter('http://127.0.0.1:8545')
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 64
+    assert adapter.max_retries.total == 3
+    assert session.headers['Connection'] == 'close'
+
+
+def test_per_thread_session():
+    provider = HTTPProvider('http://127.0.0.1:8545', per_thread_session=True)
+    main_session = provider.get_session()
+    assert main_session is provider.get_session()
+
+    other_sessions = []
+    thread = threading.Thread(target=lambda: other_sessions.append(provider.get_session()))
+    thread.start()
+    thread.join()
+
+    assert other_sessions[0] is not None
+    assert other_sessions[0] is not main_session
+
+
+
+@patch('web3.providers.rpc.create_session', side_effect=lambda **kwargs: Mock())
+def test_per_thread_session_is_closed_when_thread_ends(create_session_mock):
+    provider = HTTPProvider('http://127.0.0.1:8545', per_thread_session=True)
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(provider.get_session()))
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    assert sessions[0].close.call_count == 1
+
+
+@patch('web3.providers.rpc.create_session', side_effect=lambda **kwargs: Mock())
+def test_close_closes_sessions(create_session_mock):
+    provider = HTTPProvider('http://127.0.0.1:8545', per_thread_session=True)
+    session = provider.get_session()
+    provider.close()
+
+    assert session.close.call_count == 1
+    assert provider.get_session() is not session
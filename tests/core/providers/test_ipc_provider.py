@@ -1,3 +1,4 @@
+import json
 import os
 import pathlib
 import pytest
@@ -17,6 +18,7 @@ from web3.middleware import (
 )
 from web3.providers.ipc import (
     IPCProvider,
+    JSONFrameReader,
 )
 
 
@@ -86,6 +88,103 @@ def test_sync_waits_for_full_result(jsonrpc_ipc_pipe_path, serve_empty_result):
     provider._socket.sock.close()
 
 
+@pytest.fixture
+def serve_slow_and_fast_results(jsonrpc_ipc_pipe_path):
+    serv = socket.socket(socket.AF_UNIX)
+    serv.bind(jsonrpc_ipc_pipe_path)
+    serv.listen(2)
+
+    def reply(connection):
+        try:
+            request = json.loads(connection.recv(1024).decode())
+            if request['method'] == 'slow':
+                time.sleep(0.5)
+            connection.sendall(json.dumps({
+                'id': request['id'],
+                'result': request['method'],
+            }).encode())
+        finally:
+            connection.close()
+
+    def accept():
+        for _ in range(2):
+            connection, _ = serv.accept()
+            Thread(target=reply, args=(connection,), daemon=True).start()
+
+    thd = Thread(target=accept, daemon=True)
+    thd.start()
+    try:
+        yield
+    finally:
+        thd.join()
+        serv.close()
+
+
+def test_pooled_sockets_do_not_block_each_other(jsonrpc_ipc_pipe_path,
+                                                serve_slow_and_fast_results):
+    provider = IPCProvider(pathlib.Path(jsonrpc_ipc_pipe_path), timeout=3, pool_size=2)
+    finished = []
+
+    def request(method):
+        provider.make_request(method, [])
+        finished.append(method)
+
+    slow = Thread(target=request, args=('slow',))
+    slow.start()
+    time.sleep(0.1)
+    request('fast')
+    slow.join()
+
+    assert finished == ['fast', 'slow']
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        IPCProvider('~/foo', pool_size=0)
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 5, 7, 4096))
+def test_json_frame_reader_splits_documents(chunk_size):
+    documents = (
+        b'{"id": 1, "result": {"text": "a } ] string \\" with { [ delimiters"}}',
+        b'[{"id": 2, "result": "\\\\"}, {"id": 3, "result": null}]',
+        b'{"id": 4, "result": []}',
+        b'{"id": 5, "result": "x\\\\\\"y\\\\"}',
+    )
+    stream = b'\n'.join(documents) + b'\n'
+    reader = JSONFrameReader()
+    frames = []
+    for start in range(0, len(stream), chunk_size):
+        reader.feed(stream[start:start + chunk_size])
+        frames.extend(reader)
+
+    assert tuple(frames) == documents
+    assert reader.next_frame() is None
+
+
+def test_json_frame_reader_waits_for_complete_document():
+    reader = JSONFrameReader()
+    reader.feed(b'{"id": 1, "result": "}')
+    assert reader.next_frame() is None
+    reader.feed(b'"')
+    assert reader.next_frame() is None
+    reader.feed(b'}')
+    assert reader.next_frame() == b'{"id": 1, "result": "}"}'
+
+
+def test_json_frame_reader_resumes_within_long_strings():
+    document = b'{"id": 1, "result": "' + b'ab\\\\cd\\"' * 100000 + b'"}'
+    reader = JSONFrameReader()
+    for start in range(0, len(document), 1000):
+        reader.feed(document[start:start + 1000])
+        if start + 1000 < len(document):
+            assert reader.next_frame() is None
+            # the string is not scanned again from its opening quote
+            assert reader._scan_position == len(reader._buffer)
+
+    assert reader.next_frame() == document
+
+
 def test_web3_auto_gethdev():
     assert isinstance(w3.provider, IPCProvider)
     return_block_with_long_extra_data = construct_fixture_middleware({
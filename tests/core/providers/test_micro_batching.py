@@ -0,0 +1,117 @@
+import asyncio
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import pytest
+import threading
+
+from web3 import Web3
+from web3._utils.batching import (
+    BatchSizeHistogram,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+class RecordingProvider(BaseProvider):
+    def __init__(self):
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        with self._lock:
+            self.batches.append([(method, params)])
+        return {'result': params[0]}
+
+    def make_batch_request(self, requests):
+        with self._lock:
+            self.batches.append(list(requests))
+        return [{'result': params[0]} for _, params in requests]
+
+
+class AsyncRecordingProvider(RecordingProvider):
+    is_async = True
+
+    async def make_request(self, method, params):
+        return RecordingProvider.make_request(self, method, params)
+
+    async def make_batch_request(self, requests):
+        return RecordingProvider.make_batch_request(self, requests)
+
+
+def test_concurrent_requests_are_batched():
+    provider = RecordingProvider()
+    batcher = provider.enable_micro_batching(window=0.2, max_batch_size=100)
+    w3 = Web3(provider, middlewares=[])
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(
+            lambda value: w3.manager.request_blocking('fake_endpoint', [value]),
+            range(8),
+        ))
+
+    assert results == list(range(8))
+    assert len(provider.batches) == 1
+    assert batcher.histogram.counts == {8: 1}
+
+
+def test_full_batch_is_sent_without_waiting_for_window():
+    provider = RecordingProvider()
+    batcher = provider.enable_micro_batching(window=60, max_batch_size=4)
+    w3 = Web3(provider, middlewares=[])
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(
+            lambda value: w3.manager.request_blocking('fake_endpoint', [value]),
+            range(8),
+        ))
+
+    assert results == list(range(8))
+    assert [len(batch) for batch in provider.batches] == [4, 4]
+    assert batcher.histogram.snapshot() == [(1, 0), (2, 0), (4, 2)]
+
+
+def test_micro_batching_is_opt_in():
+    provider = RecordingProvider()
+    w3 = Web3(provider, middlewares=[])
+    w3.manager.request_blocking('fake_endpoint', [1])
+
+    provider.enable_micro_batching(window=0)
+    w3.manager.request_blocking('fake_endpoint', [2])
+    provider.disable_micro_batching()
+
+    assert provider.batches == [[('fake_endpoint', [1])], [('fake_endpoint', [2])]]
+
+
+def test_async_requests_are_batched():
+    provider = AsyncRecordingProvider()
+    batcher = provider.enable_micro_batching(window=0.05)
+    w3 = Web3(provider, middlewares=[])
+
+    async def make_requests():
+        return await asyncio.gather(*(
+            w3.manager.coro_request('fake_endpoint', [value]) for value in range(5)
+        ))
+
+    results = asyncio.get_event_loop().run_until_complete(make_requests())
+
+    assert results == list(range(5))
+    assert len(provider.batches) == 1
+    assert batcher.histogram.batches == 1
+    assert batcher.histogram.requests == 5
+
+
+@pytest.mark.parametrize(
+    'sizes,expected',
+    (
+        ([], []),
+        ([1, 1], [(1, 2)]),
+        ([1, 3, 4, 5], [(1, 1), (2, 0), (4, 2), (8, 1)]),
+    ),
+)
+def test_batch_size_histogram(sizes, expected):
+    histogram = BatchSizeHistogram()
+    for size in sizes:
+        histogram.record(size)
+    assert histogram.snapshot() == expected
@@ -0,0 +1,138 @@
+import asyncio
+import pytest
+import threading
+import time
+
+from web3 import Web3
+from web3._utils.scheduling import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    RequestScheduler,
+    TokenBucket,
+    request_priority,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+
+class RecordingProvider(BaseProvider):
+    def __init__(self):
+        self.methods = []
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        with self._lock:
+            self.methods.append(method)
+        return {'result': method}
+
+
+class AsyncRecordingProvider(RecordingProvider):
+    is_async = True
+
+    async def make_request(self, method, params):
+        return RecordingProvider.make_request(self, method, params)
+
+
+def test_token_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert 0 < bucket.take() <= 0.1
+
+
+@pytest.mark.parametrize('rate', (0, -1))
+def test_token_bucket_rejects_non_positive_rate(rate):
+    with pytest.raises(ValueError):
+        TokenBucket(rate)
+
+
+def test_rate_limit_spaces_out_requests():
+    provider = RecordingProvider()
+    provider.enable_rate_limiting(rate=20, burst=1)
+    w3 = Web3(provider, middlewares=[])
+
+    start = time.monotonic()
+    for _ in range(5):
+        w3.manager.request_blocking('vns_blockNumber', [])
+
+    assert time.monotonic() - start >= 0.19
+    assert provider.methods == ['vns_blockNumber'] * 5
+
+
+def test_rate_limiting_is_opt_in():
+    provider = RecordingProvider()
+    w3 = Web3(provider, middlewares=[])
+    w3.manager.request_blocking('vns_blockNumber', [])
+    assert provider.scheduler is None
+
+    provider.enable_rate_limiting(rate=1)
+    provider.disable_rate_limiting()
+    assert provider.scheduler is None
+
+
+def test_interactive_requests_jump_ahead_of_bulk_requests():
+    provider = RecordingProvider()
+    scheduler = provider.enable_rate_limiting(rate=10, burst=1)
+    w3 = Web3(provider, middlewares=[])
+    # use up the burst
+    w3.manager.request_blocking('vns_blockNumber', [])
+
+    bulk = [
+        threading.Thread(target=w3.manager.request_blocking, args=('vns_getLogs', [{}]))
+        for _ in range(3)
+    ]
+    for thread in bulk:
+        thread.start()
+    time.sleep(0.02)
+    interactive = threading.Thread(target=w3.manager.request_blocking, args=('vns_call', [{}]))
+    interactive.start()
+
+    for thread in bulk + [interactive]:
+        thread.join()
+
+    assert provider.methods == ['vns_blockNumber', 'vns_call'] + ['vns_getLogs'] * 3
+    snapshot = scheduler.snapshot()
+    assert snapshot['queue_depth'] == 0
+    assert snapshot['classes']['bulk']['requests'] == 3
+    assert snapshot['classes']['bulk']['max_queue_depth'] == 3
+    assert snapshot['classes']['bulk']['max_wait_time'] > 0.1
+
+
+def test_request_priority_overrides_method_class():
+    scheduler = RequestScheduler(rate=1)
+    assert scheduler.get_priority('default') != PRIORITY_LOW
+    assert scheduler.get_priority('bulk') == PRIORITY_LOW
+
+    with request_priority(PRIORITY_LOW):
+        assert scheduler.get_priority('default') == PRIORITY_LOW
+    with request_priority(PRIORITY_HIGH):
+        assert scheduler.get_priority('bulk') == PRIORITY_HIGH
+
+
+def test_class_limit_only_applies_to_its_class():
+    scheduler = RequestScheduler(class_limits={'bulk': (1, 1)})
+    scheduler.acquire('vns_getLogs')
+
+    start = time.monotonic()
+    for _ in range(10):
+        scheduler.acquire('vns_call')
+    assert time.monotonic() - start < 0.5
+    assert scheduler.snapshot()['classes']['default']['requests'] == 10
+
+
+def test_async_provider_is_rate_limited():
+    provider = AsyncRecordingProvider()
+    provider.enable_rate_limiting(rate=20, burst=1)
+    w3 = Web3(provider, middlewares=[])
+
+    async def make_requests():
+        return await asyncio.gather(*(
+            w3.manager.coro_request('vns_blockNumber', []) for _ in range(4)
+        ))
+
+    start = time.monotonic()
+    results = asyncio.get_event_loop().run_until_complete(make_requests())
+
+    assert results == ['vns_blockNumber'] * 4
+    assert time.monotonic() - start >= 0.14
@@ -1,12 +1,20 @@
 import asyncio
 from concurrent.futures import (
+    ThreadPoolExecutor,
     TimeoutError,
 )
+import json
 import pytest
+from queue import (
+    Queue,
+)
 from threading import (
     Thread,
 )
 
+from hexbytes import (
+    HexBytes,
+)
 import websockets
 
 from tests.utils import (
@@ -16,6 +24,9 @@ from web3 import Web3
 from web3.exceptions import (
     ValidationError,
 )
+from web3.providers.base import (
+    BaseProvider,
+)
 from web3.providers.websocket import (
     WebsocketProvider,
 )
@@ -57,6 +68,165 @@ def test_websocket_provider_timeout(w3):
         w3.vns.accounts
 
 
+@pytest.yield_fixture
+def start_delayed_echo_server(open_port):
+    event_loop = asyncio.new_event_loop()
+
+    def run_server():
+        async def respond(websocket, request):
+            # the first param is how long to wait before responding
+            await asyncio.sleep(request['params'][0])
+            await websocket.send(json.dumps({
+                'jsonrpc': '2.0',
+                'id': request['id'],
+                'result': request['params'],
+            }))
+
+        async def delayed_echo_server(websocket, path):
+            async for message in websocket:
+                asyncio.ensure_future(respond(websocket, json.loads(message)))
+        server = websockets.serve(delayed_echo_server, '127.0.0.1', open_port, loop=event_loop)
+        event_loop.run_until_complete(server)
+        event_loop.run_forever()
+
+    thd = Thread(target=run_server)
+    thd.start()
+    try:
+        yield
+    finally:
+        event_loop.call_soon_threadsafe(event_loop.stop)
+
+
+@pytest.fixture()
+def pipelined_provider(open_port, start_delayed_echo_server):
+    event_loop = asyncio.new_event_loop()
+    endpoint_uri = 'ws://127.0.0.1:{}'.format(open_port)
+    event_loop.run_until_complete(wait_for_ws(endpoint_uri, event_loop))
+    return WebsocketProvider(endpoint_uri, websocket_timeout=1)
+
+
+def test_websocket_provider_matches_out_of_order_responses(pipelined_provider):
+    delays = [0.3, 0.2, 0.1, 0]
+    with ThreadPoolExecutor(len(delays)) as executor:
+        responses = list(executor.map(
+            lambda delay: pipelined_provider.make_request('test_delay', [delay]),
+            delays,
+        ))
+
+    assert [response['result'] for response in responses] == [[delay] for delay in delays]
+
+
+def test_websocket_provider_survives_request_timeout(pipelined_provider):
+    pipelined_provider.websocket_timeout = 0.05
+    with pytest.raises(TimeoutError):
+        pipelined_provider.make_request('test_delay', [0.2])
+
+    response = pipelined_provider.make_request('test_delay', [0])
+    assert response['result'] == [0]
+
+
+TX_HASHES = ['0x' + '01' * 32, '0x' + '02' * 32]
+
+
+@pytest.yield_fixture
+def start_subscription_server(open_port):
+    event_loop = asyncio.new_event_loop()
+
+    def run_server():
+        async def subscription_server(websocket, path):
+            async for message in websocket:
+                request = json.loads(message)
+                if request['method'] == 'vns_subscribe':
+                    await websocket.send(json.dumps(
+                        {'jsonrpc': '2.0', 'id': request['id'], 'result': '0xabc'}
+                    ))
+                    for tx_hash in TX_HASHES:
+                        await websocket.send(json.dumps({
+                            'jsonrpc': '2.0',
+                            'method': 'vns_subscription',
+                            'params': {'subscription': '0xabc', 'result': tx_hash},
+                        }))
+                else:
+                    await websocket.send(json.dumps(
+                        {'jsonrpc': '2.0', 'id': request['id'], 'result': True}
+                    ))
+        server = websockets.serve(subscription_server, '127.0.0.1', open_port, loop=event_loop)
+        event_loop.run_until_complete(server)
+        event_loop.run_forever()
+
+    thd = Thread(target=run_server)
+    thd.start()
+    try:
+        yield
+    finally:
+        event_loop.call_soon_threadsafe(event_loop.stop)
+
+
+@pytest.fixture()
+def subscription_w3(open_port, start_subscription_server):
+    event_loop = asyncio.new_event_loop()
+    endpoint_uri = 'ws://127.0.0.1:{}'.format(open_port)
+    event_loop.run_until_complete(wait_for_ws(endpoint_uri, event_loop))
+    return Web3(WebsocketProvider(endpoint_uri, websocket_timeout=1))
+
+
+def test_websocket_subscription_iteration(subscription_w3):
+    subscription = subscription_w3.vns.subscribe('newPendingTransactions')
+    assert subscription.subscription_id == '0xabc'
+
+    entries = iter(subscription)
+    assert next(entries) == HexBytes(TX_HASHES[0])
+    assert next(entries) == HexBytes(TX_HASHES[1])
+
+    assert subscription.unsubscribe() is True
+    assert list(entries) == []
+
+
+def test_websocket_subscription_async_iteration(subscription_w3):
+    async def first_entries(subscription):
+        entries = []
+        async for entry in subscription:
+            entries.append(entry)
+            if len(entries) == len(TX_HASHES):
+                return entries
+
+    with subscription_w3.vns.subscribe('newPendingTransactions') as subscription:
+        entries = asyncio.new_event_loop().run_until_complete(first_entries(subscription))
+
+    assert entries == [HexBytes(tx_hash) for tx_hash in TX_HASHES]
+
+
+def test_websocket_subscription_callback(subscription_w3):
+    received = Queue()
+    subscription = subscription_w3.vns.subscribe(
+        'newPendingTransactions',
+        callback=received.put,
+    )
+    assert received.get(timeout=1) == HexBytes(TX_HASHES[0])
+    assert received.get(timeout=1) == HexBytes(TX_HASHES[1])
+    subscription.unsubscribe()
+
+
+def test_websocket_subscription_callback_survives_exceptions(subscription_w3):
+    received = Queue()
+
+    def callback(entry):
+        received.put(entry)
+        if entry == HexBytes(TX_HASHES[0]):
+            raise ValueError("callback failed")
+
+    subscription = subscription_w3.vns.subscribe('newPendingTransactions', callback=callback)
+    assert received.get(timeout=1) == HexBytes(TX_HASHES[0])
+    assert received.get(timeout=1) == HexBytes(TX_HASHES[1])
+    subscription.unsubscribe()
+
+
+def test_subscribe_requires_persistent_connection():
+    w3 = Web3(BaseProvider(), middlewares=[])
+    with pytest.raises(ValueError):
+        w3.vns.subscribe('newHeads')
+
+
 def test_restricted_websocket_kwargs():
     invalid_kwargs = {'uri': 'ws://127.0.0.1:8546'}
     re_exc_message = r'.*found: {0}*'.format(set(invalid_kwargs.keys()))
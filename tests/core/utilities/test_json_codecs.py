@@ -0,0 +1,101 @@
+import json
+import pytest
+
+from web3._utils.encoding import (
+    FriendlyJsonSerde,
+)
+from web3._utils.json_codecs import (
+    STDLIB_JSON_CODEC,
+    load_json_codec,
+)
+
+
+class LimitedCodec:
+    """
+    Stands in for a fast codec, which cannot handle large integers.
+    """
+    name = 'limited'
+    unsupported_errors = (OverflowError,)
+
+    def __init__(self):
+        self.calls = 0
+
+    def loads(self, data):
+        self.calls += 1
+        return json.loads(data, parse_int=self._parse_int)
+
+    def dumps(self, obj):
+        self.calls += 1
+        if any(isinstance(value, int) and value >= 2 ** 64 for value in obj.values()):
+            raise OverflowError("int too big")
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _parse_int(value):
+        if len(value) > 19:
+            raise ValueError("int too big")
+        return int(value)
+
+
+def test_stdlib_codec_is_always_available():
+    assert load_json_codec('json') is not None
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        load_json_codec('yaml')
+
+
+@pytest.mark.parametrize('codec', (STDLIB_JSON_CODEC, LimitedCodec()))
+def test_decode_from_bytes(codec):
+    assert FriendlyJsonSerde(codec).json_decode(b'{"result": "0x1"}') == {'result': '0x1'}
+
+
+def test_codec_is_used_when_it_can():
+    codec = LimitedCodec()
+    serde = FriendlyJsonSerde(codec)
+    assert serde.json_encode_bytes({'value': 1}) == b'{"value":1}'
+    assert serde.json_decode(b'{"value":1}') == {'value': 1}
+    assert codec.calls == 2
+
+
+@pytest.mark.parametrize('name', ('orjson', 'ujson'))
+@pytest.mark.parametrize('value', (2 ** 64, 2 ** 70, -2 ** 70, 123456789012345678901234567890))
+def test_falls_back_to_stdlib_for_wide_integers(name, value):
+    codec = load_json_codec(name)
+    if codec is None:
+        pytest.skip("{0} is not installed".format(name))
+
+    serde = FriendlyJsonSerde(codec)
+    document = {'value': value, 'values': [1, value]}
+    assert serde.json_encode_bytes(document) == json.dumps(document).encode('utf-8')
+    assert serde.json_decode(json.dumps(document).encode('utf-8')) == document
+    assert serde.json_decode(json.dumps(document)) == document
+
+
+def test_digits_within_strings_do_not_need_stdlib():
+    codec = load_json_codec('orjson')
+    if codec is None:
+        pytest.skip("orjson is not installed")
+
+    data = '0x' + '0' * 64
+    assert codec.loads(json.dumps({'data': data, 'topics': [data]})) == {
+        'data': data,
+        'topics': [data],
+    }
+
+
+def test_decode_errors_come_from_stdlib():
+    with pytest.raises(json.decoder.JSONDecodeError, match="Could not decode"):
+        FriendlyJsonSerde(LimitedCodec()).json_decode(b'{"result": ')
+
+
+@pytest.mark.parametrize('name', ('orjson', 'ujson'))
+def test_optional_codecs_match_stdlib(name):
+    codec = load_json_codec(name)
+    if codec is None:
+        pytest.skip("{0} is not installed".format(name))
+
+    payload = {'number': '0x1b4', 'transactions': [], 'uncles': [], 'size': 1024, 'ok': True}
+    assert codec.loads(codec.dumps(payload)) == payload
+    assert codec.loads(json.dumps(payload).encode('utf-8')) == payload
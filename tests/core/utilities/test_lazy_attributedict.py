@@ -0,0 +1,93 @@
+import pickle
+import pytest
+
+from web3.datastructures import (
+    AttributeDict,
+    LazyAttributeDict,
+)
+
+RAW = {
+    'number': '0x10',
+    'transactions': [{'value': '0x1'}, {'value': '0x2', 'nested': {'a': 1}}],
+}
+
+
+def to_integer(value):
+    return int(value, 16)
+
+
+def test_fields_are_converted_on_first_access():
+    calls = []
+
+    def formatter(value):
+        calls.append(value)
+        return to_integer(value)
+
+    lazy = LazyAttributeDict(RAW, {'number': formatter})
+    assert calls == []
+
+    assert lazy.number == 16
+    assert lazy['number'] == 16
+    assert calls == ['0x10']
+
+
+def test_nested_dicts_are_lazy():
+    lazy = LazyAttributeDict(RAW)
+
+    assert isinstance(lazy.transactions[1], LazyAttributeDict)
+    assert lazy.transactions[1].nested.a == 1
+
+
+def test_equal_to_eager_attributedict():
+    lazy = LazyAttributeDict(RAW, {'number': to_integer})
+    eager = AttributeDict.recursive(dict(RAW, number=16))
+
+    assert lazy == eager
+    assert eager == lazy
+    assert lazy != AttributeDict.recursive(RAW)
+    assert len(lazy) == 2
+    assert list(lazy) == ['number', 'transactions']
+    assert 'number' in lazy
+
+
+def test_hash_matches_attributedict():
+    raw = {'a': '0x1', 'b': 'text'}
+    assert hash(LazyAttributeDict(raw)) == hash(AttributeDict(raw))
+    assert len({LazyAttributeDict(raw), AttributeDict(raw)}) == 1
+
+
+def test_missing_fields():
+    lazy = LazyAttributeDict(RAW)
+    with pytest.raises(AttributeError):
+        lazy.missing
+    with pytest.raises(KeyError):
+        lazy['missing']
+
+
+def test_immutable():
+    lazy = LazyAttributeDict(RAW)
+    with pytest.raises(TypeError):
+        lazy.number = 1
+    with pytest.raises(TypeError):
+        lazy['number'] = 1
+
+
+def test_formatting_error_names_field():
+    lazy = LazyAttributeDict({'number': 'not hex'}, {'number': to_integer})
+    with pytest.raises(ValueError, match='number'):
+        lazy.number
+
+
+def test_formatting_error_keeps_original_exception():
+    lazy = LazyAttributeDict({'number': None}, {'number': to_integer})
+    with pytest.raises(ValueError, match='number') as excinfo:
+        lazy.number
+    assert isinstance(excinfo.value.__cause__, TypeError)
+
+
+def test_pickle_keeps_converted_values():
+    lazy = LazyAttributeDict(RAW, {'number': to_integer})
+    unpickled = pickle.loads(pickle.dumps(lazy))
+
+    assert unpickled == lazy
+    assert unpickled.number == 16
@@ -0,0 +1,77 @@
+import pickle
+import pytest
+
+from web3.datastructures import (
+    AttributeDict,
+    LogRecord,
+    TransactionRecord,
+)
+
+LOG = {
+    'address': '0xd3CdA913deB6f67967B99D67aCDFa1712C293601',
+    'logIndex': 3,
+    'topics': (b'\x01' * 32,),
+    'removed': False,
+}
+
+
+def test_fields_read_as_items_and_attributes():
+    log = LogRecord(LOG)
+
+    assert log.logIndex == 3
+    assert log['logIndex'] == 3
+    assert log.get('data') is None
+    assert dict(log) == LOG
+    assert len(log) == 4
+    assert 'topics' in log
+    assert 'data' not in log
+    assert list(log) == ['address', 'logIndex', 'removed', 'topics']
+
+
+def test_missing_fields():
+    log = LogRecord(LOG)
+    with pytest.raises(AttributeError):
+        log.data
+    with pytest.raises(KeyError):
+        log['data']
+
+
+def test_fields_outside_the_schema():
+    transaction = TransactionRecord({'from': '0x1', 'value': 1, 'creates': None})
+
+    assert transaction['from'] == '0x1'
+    assert transaction.creates is None
+    assert transaction['creates'] is None
+    assert dict(transaction) == {'from': '0x1', 'value': 1, 'creates': None}
+
+
+def test_no_instance_dict():
+    assert not hasattr(LogRecord(LOG), '__dict__')
+
+
+def test_immutable():
+    log = LogRecord(LOG)
+    with pytest.raises(TypeError):
+        log.logIndex = 4
+    with pytest.raises(TypeError):
+        log['logIndex'] = 4
+    with pytest.raises(TypeError):
+        del log.logIndex
+
+
+def test_equality_and_hash_match_attributedict():
+    log = LogRecord(LOG)
+
+    assert log == AttributeDict(LOG)
+    assert AttributeDict(LOG) == log
+    assert log == LOG
+    assert log != LogRecord(dict(LOG, logIndex=4))
+    assert hash(log) == hash(AttributeDict(LOG))
+
+
+def test_pickle():
+    transaction = TransactionRecord({'from': '0x1', 'creates': None})
+    unpickled = pickle.loads(pickle.dumps(transaction))
+
+    assert type(unpickled) is TransactionRecord
+    assert unpickled == transaction
@@ -0,0 +1,106 @@
+from web3 import Web3
+from web3._utils.transactions import (
+    fill_transaction_defaults,
+)
+from web3.providers import (
+    BaseProvider,
+    LoadBalancedProvider,
+    RecordingProvider,
+)
+from web3.providers.auto import (
+    AutoProvider,
+)
+
+
+class CountingProvider(BaseProvider):
+    def __init__(self, network_version='1'):
+        self.network_version = network_version
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        if method == 'net_version':
+            return {'result': self.network_version}
+        elif method == 'web3_clientVersion':
+            return {'result': 'Geth/v1.9.0'}
+        else:
+            return {'result': 21000}
+
+    def isConnected(self):
+        return True
+
+
+def test_metadata_is_looked_up_once():
+    provider = CountingProvider()
+    w3 = Web3(provider, middlewares=[])
+
+    assert w3.chain_metadata.network_version == '1'
+    assert w3.chain_metadata.chain_id == 1
+    assert w3.chain_metadata.client_version == 'Geth/v1.9.0'
+    assert w3.chain_metadata.chain_id == 1
+    assert provider.requests == ['net_version', 'web3_clientVersion']
+
+
+def test_transaction_defaults_use_metadata():
+    provider = CountingProvider()
+    w3 = Web3(provider, middlewares=[])
+    transaction = {'gas': 21000, 'gasPrice': 1}
+
+    assert fill_transaction_defaults(w3, transaction)['chainId'] == 1
+    assert fill_transaction_defaults(w3, transaction)['chainId'] == 1
+    assert provider.requests == ['net_version']
+
+
+def test_metadata_is_dropped_when_provider_changes():
+    w3 = Web3(CountingProvider('1'), middlewares=[])
+    assert w3.chain_metadata.chain_id == 1
+
+    w3.provider = CountingProvider('3')
+    assert w3.chain_metadata.chain_id == 3
+
+
+def test_metadata_is_dropped_after_disconnect():
+    provider = CountingProvider()
+    w3 = Web3(provider, middlewares=[])
+    assert w3.chain_metadata.chain_id == 1
+
+    provider.network_version = '5'
+    assert w3.chain_metadata.chain_id == 1
+    provider.disconnects += 1
+    assert w3.chain_metadata.chain_id == 5
+
+
+def test_metadata_is_dropped_when_auto_provider_switches():
+    providers = iter([CountingProvider('1'), CountingProvider('3')])
+    auto_provider = AutoProvider([lambda: next(providers)])
+    w3 = Web3(auto_provider, middlewares=[])
+    assert w3.chain_metadata.chain_id == 1
+
+    # AutoProvider looks for another provider after an IOError
+    auto_provider._get_active_provider(use_cache=False)
+    assert w3.chain_metadata.chain_id == 3
+
+
+def test_metadata_follows_disconnects_of_wrapped_providers(tmpdir):
+    balanced_provider = CountingProvider()
+    recorded_provider = CountingProvider()
+    for provider, wrapper in (
+        (balanced_provider, LoadBalancedProvider([balanced_provider], head_refresh_interval=None)),
+        (recorded_provider, RecordingProvider(recorded_provider, str(tmpdir.join('cassette')))),
+    ):
+        w3 = Web3(wrapper, middlewares=[])
+        assert w3.chain_metadata.chain_id == 1
+
+        provider.network_version = '5'
+        provider.disconnects += 1
+        assert w3.chain_metadata.chain_id == 5
+
+
+def test_clear():
+    provider = CountingProvider()
+    w3 = Web3(provider, middlewares=[])
+    assert w3.chain_metadata.chain_id == 1
+
+    w3.chain_metadata.clear()
+    assert w3.chain_metadata.chain_id == 1
+    assert provider.requests == ['net_version', 'net_version']
@@ -18,6 +18,9 @@ from web3.main import web3  # noqa: E402
 from web3.providers.rpc import (  # noqa: E402
     HTTPProvider,
 )
+from web3.providers.async_rpc import (  # noqa: E402
+    AsyncHTTPProvider,
+)
 from web3.providers.vns_tester import (  # noqa: E402
     EthereumTesterProvider,
 )
@@ -34,6 +37,7 @@ __all__ = [
     "__version__",
     "web3",
     "HTTPProvider",
+    "AsyncHTTPProvider",
     "IPCProvider",
     "WebsocketProvider",
     "TestRPCProvider",
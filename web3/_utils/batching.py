@@ -0,0 +1,375 @@
+"""
+Sending a group of requests to a provider as a single JSON-RPC batch, while
+still running every request through the full middleware onion.
+
+Batches are either made explicitly, with :class:`BatchCollector`, or formed
+automatically from the requests which independent callers make at about the
+same time, with :class:`MicroBatcher` and :class:`AsyncMicroBatcher`.
+"""
+import asyncio
+import collections
+import contextlib
+import threading
+import time
+
+from web3._utils.threads import (
+    spawn,
+)
+
+DEFAULT_BATCH_WORKERS = 64
+DEFAULT_MICRO_BATCH_WINDOW = 0.002
+DEFAULT_MAX_MICRO_BATCH_SIZE = 100
+
+
+_batch_state = threading.local()
+
+
+def get_batch_collector(provider):
+    """
+    Returns the :class:`BatchCollector` that the current thread is collecting
+    requests for, or ``None`` if the thread is not part of a batch for
+    ``provider``.
+    """
+    collector = getattr(_batch_state, 'collector', None)
+    if collector is not None and collector.provider is provider:
+        return collector
+    else:
+        return None
+
+
+@contextlib.contextmanager
+def waiting_outside_batch(provider):
+    """
+    Wraps a wait by the current thread for something other than the provider,
+    such as another thread's request.  A thread which is part of a batch counts
+    as idle while waiting, so that the requests queued by the other threads of
+    the batch are still flushed.
+    """
+    collector = get_batch_collector(provider)
+    if collector is None:
+        yield
+    else:
+        with collector.blocked():
+            yield
+
+
+class PendingRequest:
+    __slots__ = ('method', 'params', 'response', 'exception', 'is_done')
+
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        self.response = None
+        self.exception = None
+        self.is_done = False
+
+
+class BatchCollector:
+    """
+    Runs each request of a batch through ``request_func`` on a pool of worker
+    threads.  Whenever every busy worker is blocked waiting on the provider,
+    the requests they are waiting on are flushed to the provider in a single
+    call to ``provider.make_batch_request``.
+
+    Middlewares which answer a request without reaching the provider (eg: the
+    caching middlewares) never add it to a batch, and middlewares which make
+    additional requests of their own simply contribute them to the next flush.
+    """
+    def __init__(self, provider, max_workers=DEFAULT_BATCH_WORKERS):
+        if max_workers < 1:
+            raise ValueError("A batch needs at least one worker, got %r" % max_workers)
+        self.provider = provider
+        self.max_workers = max_workers
+        self._condition = threading.Condition()
+        self._queued = []
+        self._busy = 0
+
+    def run(self, request_func, requests):
+        """
+        @param request_func is the combined middleware function of the provider
+        @param requests is an iterable of ``(method, params)`` pairs
+        @returns a list of responses, in the same order as ``requests``
+        """
+        requests = list(requests)
+        outcomes = [None] * len(requests)
+        if not requests:
+            return []
+
+        entries = iter(enumerate(requests))
+        num_workers = min(self.max_workers, len(requests))
+        self._busy = num_workers
+        workers = [
+            spawn(self._work, request_func, entries, outcomes)
+            for _ in range(num_workers)
+        ]
+        for worker in workers:
+            worker.join()
+
+        for response, exception in outcomes:
+            if exception is not None:
+                raise exception
+        return [response for response, _ in outcomes]
+
+    def submit(self, method, params):
+        """
+        Queue a request for the next flush and block until its response is
+        available.
+        """
+        pending = PendingRequest(method, params)
+        with self._condition:
+            self._queued.append(pending)
+            self._busy -= 1
+            flushable = self._take_flushable()
+
+        if flushable:
+            self._flush(flushable)
+
+        with self._condition:
+            while not pending.is_done:
+                self._condition.wait()
+
+        if pending.exception is not None:
+            raise pending.exception
+        return pending.response
+
+    @contextlib.contextmanager
+    def blocked(self):
+        """
+        Marks the current worker as not busy for the duration of the block.
+        """
+        with self._condition:
+            self._busy -= 1
+            flushable = self._take_flushable()
+
+        if flushable:
+            self._flush(flushable)
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._busy += 1
+
+    def _work(self, request_func, entries, outcomes):
+        _batch_state.collector = self
+        try:
+            while True:
+                with self._condition:
+                    try:
+                        index, (method, params) = next(entries)
+                    except StopIteration:
+                        self._busy -= 1
+                        flushable = self._take_flushable()
+                        break
+
+                try:
+                    outcomes[index] = (request_func(method, params), None)
+                except Exception as exc:
+                    outcomes[index] = (None, exc)
+        finally:
+            _batch_state.collector = None
+
+        if flushable:
+            self._flush(flushable)
+
+    def _take_flushable(self):
+        # must be called with self._condition held
+        if self._busy == 0 and self._queued:
+            flushable, self._queued = self._queued, []
+            return flushable
+        else:
+            return None
+
+    def _flush(self, pending_requests):
+        try:
+            if len(pending_requests) == 1:
+                pending = pending_requests[0]
+                responses = [self.provider.make_request(pending.method, pending.params)]
+            else:
+                responses = self.provider.make_batch_request([
+                    (pending.method, pending.params) for pending in pending_requests
+                ])
+        except Exception as exc:
+            outcomes = [(None, exc)] * len(pending_requests)
+        else:
+            outcomes = [(response, None) for response in responses]
+
+        with self._condition:
+            for pending, (response, exception) in zip(pending_requests, outcomes):
+                pending.response = response
+                pending.exception = exception
+                pending.is_done = True
+            # the waiting workers are busy again as soon as their responses are
+            # delivered, not when they next get scheduled
+            self._busy += len(pending_requests)
+            self._condition.notify_all()
+
+
+class BatchSizeHistogram:
+    """
+    Counts the batches sent by size.
+    """
+    def __init__(self):
+        self.counts = collections.Counter()
+        self._lock = threading.Lock()
+
+    def record(self, size):
+        with self._lock:
+            self.counts[size] += 1
+
+    @property
+    def batches(self):
+        return sum(self.counts.values())
+
+    @property
+    def requests(self):
+        return sum(size * count for size, count in self.counts.items())
+
+    def snapshot(self):
+        """
+        Returns a list of ``(max_size, count)`` pairs, with the batches counted
+        in buckets of sizes up to powers of two.
+        """
+        with self._lock:
+            counts = dict(self.counts)
+        if not counts:
+            return []
+
+        buckets = []
+        bound = 1
+        while True:
+            buckets.append((bound, sum(
+                count for size, count in counts.items() if bound // 2 < size <= bound
+            )))
+            if bound >= max(counts):
+                return buckets
+            bound *= 2
+
+
+class MicroBatcher:
+    """
+    Sends the requests which threads make within ``window`` seconds of each
+    other as a single batch, of at most ``max_batch_size`` requests.
+
+    The first request of a batch waits for the window to pass, or for the batch
+    to fill up, and then sends it.  No background thread is involved.
+    """
+    def __init__(self,
+                 provider,
+                 window=DEFAULT_MICRO_BATCH_WINDOW,
+                 max_batch_size=DEFAULT_MAX_MICRO_BATCH_SIZE):
+        if max_batch_size < 1:
+            raise ValueError("A batch needs to hold at least one request, got %r" % max_batch_size)
+        self.provider = provider
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.histogram = BatchSizeHistogram()
+        self._condition = threading.Condition()
+        self._batch = []
+
+    def submit(self, method, params):
+        pending = PendingRequest(method, params)
+        flushable = None
+        with self._condition:
+            batch = self._batch
+            batch.append(pending)
+            if len(batch) >= self.max_batch_size:
+                self._batch = []
+                flushable = batch
+                self._condition.notify_all()
+            elif len(batch) == 1:
+                deadline = time.monotonic() + self.window
+                remaining = self.window
+                while self._batch is batch and remaining > 0:
+                    self._condition.wait(remaining)
+                    remaining = deadline - time.monotonic()
+                if self._batch is batch:
+                    self._batch = []
+                    flushable = batch
+
+        if flushable:
+            self._flush(flushable)
+
+        with self._condition:
+            while not pending.is_done:
+                self._condition.wait()
+
+        if pending.exception is not None:
+            raise pending.exception
+        return pending.response
+
+    def _flush(self, pending_requests):
+        self.histogram.record(len(pending_requests))
+        try:
+            if len(pending_requests) == 1:
+                pending = pending_requests[0]
+                responses = [self.provider.make_request(pending.method, pending.params)]
+            else:
+                responses = self.provider.make_batch_request([
+                    (pending.method, pending.params) for pending in pending_requests
+                ])
+        except Exception as exc:
+            outcomes = [(None, exc)] * len(pending_requests)
+        else:
+            outcomes = [(response, None) for response in responses]
+
+        with self._condition:
+            for pending, (response, exception) in zip(pending_requests, outcomes):
+                pending.response = response
+                pending.exception = exception
+                pending.is_done = True
+            self._condition.notify_all()
+
+
+class AsyncMicroBatcher:
+    """
+    The :class:`MicroBatcher` of providers whose ``make_request`` is a
+    coroutine, batching the requests of the coroutines of one event loop.
+    """
+    def __init__(self,
+                 provider,
+                 window=DEFAULT_MICRO_BATCH_WINDOW,
+                 max_batch_size=DEFAULT_MAX_MICRO_BATCH_SIZE):
+        if max_batch_size < 1:
+            raise ValueError("A batch needs to hold at least one request, got %r" % max_batch_size)
+        self.provider = provider
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.histogram = BatchSizeHistogram()
+        self._batch = []
+
+    async def submit(self, method, params):
+        loop = asyncio.get_event_loop()
+        response = loop.create_future()
+        batch = self._batch
+        batch.append((method, params, response))
+        if len(batch) >= self.max_batch_size:
+            self._batch = []
+            asyncio.ensure_future(self._flush(batch))
+        elif len(batch) == 1:
+            loop.call_later(self.window, self._flush_if_open, batch)
+        return await response
+
+    def _flush_if_open(self, batch):
+        if self._batch is batch:
+            self._batch = []
+            asyncio.ensure_future(self._flush(batch))
+
+    async def _flush(self, batch):
+        self.histogram.record(len(batch))
+        try:
+            if len(batch) == 1:
+                method, params, _ = batch[0]
+                responses = [await self.provider.make_request(method, params)]
+            else:
+                responses = await self.provider.make_batch_request([
+                    (method, params) for method, params, _ in batch
+                ])
+        except Exception as exc:
+            for _, _, response in batch:
+                if not response.done():
+                    response.set_exception(exc)
+        else:
+            for (_, _, response), result in zip(batch, responses):
+                if not response.done():
+                    response.set_result(result)
@@ -0,0 +1,64 @@
+"""
+The metadata of the node a :class:`~web3.Web3` is connected to, which does not
+change for as long as it stays connected.
+"""
+import threading
+
+NETWORK_VERSION_METHOD = 'net_version'
+CLIENT_VERSION_METHOD = 'web3_clientVersion'
+
+
+class ChainMetadata:
+    """
+    Looks up the network version, chain ID and client version of the node
+    once per connection, instead of for every transaction which is filled in
+    or validated and every name which is resolved.
+
+    The values are dropped when the provider of the ``web3`` is changed, or
+    when the provider reports that it reconnected to the node by counting up
+    its ``disconnects``.
+    """
+    def __init__(self, web3):
+        self.web3 = web3
+        self._connection = None
+        self._values = {}
+        self._lock = threading.Lock()
+
+    @property
+    def network_version(self):
+        return self._get(NETWORK_VERSION_METHOD)
+
+    @property
+    def chain_id(self):
+        return int(self.network_version)
+
+    @property
+    def client_version(self):
+        return self._get(CLIENT_VERSION_METHOD)
+
+    def clear(self):
+        with self._lock:
+            self._connection = None
+            self._values = {}
+
+    def _get_connection(self):
+        provider = self.web3.provider
+        return provider, getattr(provider, 'disconnects', 0)
+
+    def _get(self, method):
+        connection = self._get_connection()
+        with self._lock:
+            if self._connection != connection:
+                self._connection = connection
+                self._values = {}
+            elif method in self._values:
+                return self._values[method]
+
+        # the lock is not held during the request, so a concurrent lookup of
+        # the same value can make a request of its own
+        value = self.web3.manager.request_blocking(method, [])
+        if value is not None:
+            with self._lock:
+                if self._connection == connection:
+                    self._values[method] = value
+        return value
@@ -34,6 +34,10 @@ from web3._utils.abi import (
     size_of_type,
     sub_type_of_array_type,
 )
+from web3._utils.json_codecs import (
+    STDLIB_JSON_CODEC,
+    get_default_json_codec,
+)
 from web3._utils.toolz import (
     curry,
 )
@@ -229,7 +233,17 @@ class FriendlyJsonSerde:
     When encoding or decoding fails, this class collects
     information on which fields failed, to show more
     helpful information in the raised error messages.
+
+    The work is done by ``codec``, or the default codec of
+    :mod:`web3._utils.json_codecs`, with the standard library taking over
+    whenever the codec fails.
     """
+    def __init__(self, codec=None):
+        if codec is None:
+            self.codec = get_default_json_codec()
+        else:
+            self.codec = codec
+
     def _json_mapping_errors(self, mapping):
         for key, val in mapping.items():
             try:
@@ -259,6 +273,17 @@ class FriendlyJsonSerde:
                 raise full_exception
 
     def json_decode(self, json_str):
+        """
+        @param json_str may be text, or utf-8 encoded bytes
+        """
+        if self.codec is not STDLIB_JSON_CODEC:
+            try:
+                return self.codec.loads(json_str)
+            except (TypeError, ValueError):
+                # errors are reported (and values the codec does not support
+                # are decoded) by the standard library below
+                pass
+
         try:
             decoded = json.loads(json_str)
             return decoded
@@ -269,11 +294,33 @@ class FriendlyJsonSerde:
             raise json.decoder.JSONDecodeError(err_msg, exc.doc, exc.pos)
 
     def json_encode(self, obj, cls=None):
+        if cls is None and self.codec is not STDLIB_JSON_CODEC:
+            try:
+                return self.codec.dumps(obj).decode('utf-8')
+            except self.codec.unsupported_errors:
+                pass
+
         try:
             return self._friendly_json_encode(obj, cls=cls)
         except TypeError as exc:
             raise TypeError("Could not encode to JSON: {}".format(exc))
 
+    def json_encode_bytes(self, obj):
+        """
+        Encodes ``obj`` to utf-8 encoded bytes, without going through text when
+        the codec produces bytes itself.
+        """
+        if self.codec is not STDLIB_JSON_CODEC:
+            try:
+                return self.codec.dumps(obj)
+            except self.codec.unsupported_errors:
+                pass
+
+        try:
+            return self._friendly_json_encode(obj).encode('utf-8')
+        except TypeError as exc:
+            raise TypeError("Could not encode to JSON: {}".format(exc))
+
 
 def to_4byte_hex(hex_or_str_or_bytes):
     size_of_4bytes = 4 * 8
@@ -1,3 +1,6 @@
+from collections.abc import (
+    Mapping,
+)
 from contextlib import (
     contextmanager,
 )
@@ -25,6 +28,28 @@ def is_ens_name(value):
         return ENS.is_valid_name(value)
 
 
+# block identifiers, which only appear in the block number params of requests
+BLOCK_IDENTIFIERS = frozenset(('latest', 'earliest', 'pending'))
+
+
+def may_contain_ens_name(value):
+    """
+    Cheaply checks whether any string within the params of a request could be
+    an ENS name.  Hex strings, such as addresses, hashes and quantities, and
+    block identifiers cannot.
+    """
+    if isinstance(value, str):
+        if not value or value in BLOCK_IDENTIFIERS:
+            return False
+        return not (is_0x_prefixed(value) and is_hex(value))
+    elif isinstance(value, (list, tuple)):
+        return any(may_contain_ens_name(item) for item in value)
+    elif isinstance(value, Mapping):
+        return any(may_contain_ens_name(item) for item in value.values())
+    else:
+        return False
+
+
 def validate_name_has_address(ens, name):
     addr = ens.address(name)
     if addr:
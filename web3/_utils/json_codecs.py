@@ -0,0 +1,138 @@
+"""
+The JSON libraries used to encode requests and decode responses.
+
+``orjson`` and ``ujson`` are used when installed, as they are several times
+faster than the standard library on large responses, such as blocks with full
+transactions and log queries.  Anything they cannot handle, such as integers
+which do not fit in 64 bits, is passed on to the standard library, so the
+results do not depend on which codec is used.
+"""
+import json
+import os
+import re
+
+DEFAULT_JSON_CODECS = ('orjson', 'ujson', 'json')
+
+# a number of 20 digits or more may not fit in 64 bits, which orjson decodes
+# as a float without raising.  Digits within strings, such as the zeros of hex
+# encoded data, are not preceded by one of these characters.
+WIDE_INTEGER_BYTES_RE = re.compile(rb'[:,\[]\s*-?[0-9]{20}')
+WIDE_INTEGER_TEXT_RE = re.compile(r'[:,\[]\s*-?[0-9]{20}')
+
+
+def check_integer_width(data):
+    """
+    Raises ``ValueError`` if the JSON document ``data`` may hold an integer
+    which does not fit in 64 bits, so that the standard library decodes it.
+    """
+    if isinstance(data, str):
+        match = WIDE_INTEGER_TEXT_RE.search(data)
+    else:
+        match = WIDE_INTEGER_BYTES_RE.search(data)
+    if match is not None:
+        raise ValueError("JSON document may hold an integer wider than 64 bits")
+
+
+class StdlibJsonCodec:
+    name = 'json'
+    # errors the codec raises for values which the standard library may still
+    # be able to handle
+    unsupported_errors = ()
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode('utf-8')
+
+
+class OrjsonCodec:
+    name = 'orjson'
+    unsupported_errors = (TypeError, ValueError)
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        check_integer_width(data)
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj)
+
+
+class UjsonCodec:
+    name = 'ujson'
+    unsupported_errors = (TypeError, ValueError, OverflowError)
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        check_integer_width(data)
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, escape_forward_slashes=False).encode('utf-8')
+
+
+JSON_CODECS = {
+    'json': StdlibJsonCodec,
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+}
+
+STDLIB_JSON_CODEC = StdlibJsonCodec()
+
+_default_codec = None
+
+
+def load_json_codec(name):
+    """
+    Returns an instance of the codec called ``name``, or ``None`` if the
+    library it needs is not installed.
+    """
+    try:
+        codec_class = JSON_CODECS[name]
+    except KeyError:
+        raise ValueError("Unknown JSON codec {0!r}, expected one of {1}".format(
+            name,
+            sorted(JSON_CODECS),
+        ))
+    try:
+        return codec_class()
+    except ImportError:
+        return None
+
+
+def get_default_json_codec():
+    """
+    The codec set with :func:`set_default_json_codec`, or else the codec named
+    by the ``WEB3_JSON_CODEC`` environment variable, or else the fastest codec
+    installed.
+    """
+    global _default_codec
+    if _default_codec is None:
+        if os.environ.get('WEB3_JSON_CODEC'):
+            names = (os.environ['WEB3_JSON_CODEC'], 'json')
+        else:
+            names = DEFAULT_JSON_CODECS
+        _default_codec = next(filter(None, map(load_json_codec, names)))
+    return _default_codec
+
+
+def set_default_json_codec(codec):
+    """
+    @param codec is the name of a codec, or an object with ``name``,
+        ``unsupported_errors``, ``loads(bytes_or_text)`` and ``dumps(obj)``
+        returning bytes
+    """
+    global _default_codec
+    if isinstance(codec, str):
+        loaded = load_json_codec(codec)
+        if loaded is None:
+            raise ValueError("The library for the JSON codec {0!r} is not installed".format(codec))
+        codec = loaded
+    _default_codec = codec
@@ -0,0 +1,299 @@
+"""
+Metrics of the requests which providers send to each endpoint, and of the
+lookups of the cache middlewares.
+
+A :class:`MetricsCollector` is pulled from with ``snapshot()``, or with
+``to_text()`` for the text format read by Prometheus.
+"""
+import collections
+import threading
+import time
+
+from web3._utils.profiling import (
+    DEFAULT_LATENCY_BUCKETS,
+    LatencyHistogram,
+)
+
+
+def get_response_error_type(response):
+    """
+    The error type of a JSON-RPC error response, or ``None`` for any other
+    response.
+    """
+    if not isinstance(response, dict) or 'error' not in response:
+        return None
+    error = response['error']
+    code = error.get('code') if isinstance(error, dict) else None
+    if code is None:
+        return 'rpc_error'
+    else:
+        return 'rpc_error:{0}'.format(code)
+
+
+class RequestMetrics:
+    """
+    The requests for one method sent to one endpoint.
+    """
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.requests = 0
+        self.errors = collections.Counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.max_response_bytes = 0
+        self.latency = LatencyHistogram(buckets)
+
+    def snapshot(self):
+        return {
+            'requests': self.requests,
+            'errors': dict(self.errors),
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'max_response_bytes': self.max_response_bytes,
+            'latency': self.latency.snapshot(),
+        }
+
+
+class CacheMetrics:
+    """
+    The lookups of a cache middleware for one method.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def snapshot(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else None,
+        }
+
+
+class RequestMeasurement:
+    """
+    Records a request to ``endpoint`` when the block exits, with the error
+    type of any exception raised in it, or else of ``response``.  The block
+    sets ``request_bytes`` and ``response_bytes`` where they are known.
+    """
+    __slots__ = (
+        'collector',
+        'endpoint',
+        'method',
+        'request_bytes',
+        'response_bytes',
+        'response',
+        'start',
+    )
+
+    def __init__(self, collector, endpoint, method):
+        self.collector = collector
+        self.endpoint = endpoint
+        self.method = method
+        self.request_bytes = None
+        self.response_bytes = None
+        self.response = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        latency = time.perf_counter() - self.start
+        if exc_type is None:
+            error = get_response_error_type(self.response)
+        else:
+            error = exc_type.__name__
+        self.collector.record_request(
+            self.endpoint,
+            self.method,
+            latency,
+            self.request_bytes,
+            self.response_bytes,
+            error,
+        )
+
+
+class NullMeasurement:
+    """
+    Stands in for a :class:`RequestMeasurement` while metrics are disabled,
+    ignoring whatever is set on it.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+    def __setattr__(self, attr, value):
+        pass
+
+
+NULL_MEASUREMENT = NullMeasurement()
+
+
+def measure_request(collector, endpoint, method):
+    if collector is None:
+        return NULL_MEASUREMENT
+    else:
+        return RequestMeasurement(collector, endpoint, method)
+
+
+def record_cache_lookup(web3, cache, method, hit):
+    """
+    Records a lookup of the cache middleware named ``cache`` in the metrics of
+    ``web3``, if they are enabled.
+    """
+    collector = getattr(web3, 'metrics', None)
+    if collector is not None:
+        collector.record_cache_lookup(cache, method, hit)
+
+
+class MetricsCollector:
+    """
+    Counts the requests sent to each endpoint and their errors, by method,
+    with the bytes sent and received and a histogram of their latency, and
+    the hits and misses of each cache middleware.
+    """
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.requests = {}
+        self.caches = {}
+        self._lock = threading.Lock()
+
+    def record_request(self,
+                       endpoint,
+                       method,
+                       latency,
+                       request_bytes=None,
+                       response_bytes=None,
+                       error=None):
+        key = (endpoint, method)
+        with self._lock:
+            metrics = self.requests.get(key)
+            if metrics is None:
+                metrics = self.requests[key] = RequestMetrics(self.buckets)
+            metrics.requests += 1
+            if error is not None:
+                metrics.errors[error] += 1
+            if request_bytes is not None:
+                metrics.request_bytes += request_bytes
+            if response_bytes is not None:
+                metrics.response_bytes += response_bytes
+                metrics.max_response_bytes = max(metrics.max_response_bytes, response_bytes)
+            metrics.latency.record(latency)
+
+    def record_cache_lookup(self, cache, method, hit):
+        key = (cache, method)
+        with self._lock:
+            metrics = self.caches.get(key)
+            if metrics is None:
+                metrics = self.caches[key] = CacheMetrics()
+            if hit:
+                metrics.hits += 1
+            else:
+                metrics.misses += 1
+
+    def snapshot(self):
+        """
+        Returns a dict with the metrics of the requests to each ``endpoint``,
+        and of the lookups of each cache in ``caches``, both by method.
+        """
+        with self._lock:
+            endpoints = {}
+            for (endpoint, method), metrics in self.requests.items():
+                endpoints.setdefault(endpoint, {})[method] = metrics.snapshot()
+            caches = {}
+            for (cache, method), metrics in self.caches.items():
+                caches.setdefault(cache, {})[method] = metrics.snapshot()
+            return {'endpoints': endpoints, 'caches': caches}
+
+    def reset(self):
+        with self._lock:
+            self.requests = {}
+            self.caches = {}
+
+    def to_text(self):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def add_metric(name, metric_type, help_text, samples):
+            lines.append('# HELP {0} {1}'.format(name, help_text))
+            lines.append('# TYPE {0} {1}'.format(name, metric_type))
+            for suffix, labels, value in samples:
+                lines.append('{0}{1}{{{2}}} {3}'.format(
+                    name,
+                    suffix,
+                    ','.join('{0}="{1}"'.format(key, _escape_label(val)) for key, val in labels),
+                    _format_value(value),
+                ))
+
+        requests = [
+            ((('endpoint', endpoint), ('method', method)), metrics)
+            for endpoint, methods in sorted(snapshot['endpoints'].items())
+            for method, metrics in sorted(methods.items())
+        ]
+        add_metric('web3_requests_total', 'counter', 'Requests sent to each endpoint.', [
+            ('', labels, metrics['requests']) for labels, metrics in requests
+        ])
+        add_metric('web3_request_errors_total', 'counter', 'Requests which failed, by error.', [
+            ('', labels + (('error', error),), count)
+            for labels, metrics in requests
+            for error, count in sorted(metrics['errors'].items())
+        ])
+        add_metric('web3_request_bytes_total', 'counter', 'Bytes of the requests sent.', [
+            ('', labels, metrics['request_bytes']) for labels, metrics in requests
+        ])
+        add_metric('web3_response_bytes_total', 'counter', 'Bytes of the responses received.', [
+            ('', labels, metrics['response_bytes']) for labels, metrics in requests
+        ])
+        add_metric(
+            'web3_request_duration_seconds',
+            'histogram',
+            'Time from encoding each request to decoding its response.',
+            [
+                sample
+                for labels, metrics in requests
+                for sample in _histogram_samples(labels, metrics['latency'])
+            ],
+        )
+
+        lookups = [
+            ((('cache', cache), ('method', method)), metrics)
+            for cache, methods in sorted(snapshot['caches'].items())
+            for method, metrics in sorted(methods.items())
+        ]
+        add_metric('web3_cache_hits_total', 'counter', 'Requests answered by a cache.', [
+            ('', labels, metrics['hits']) for labels, metrics in lookups
+        ])
+        add_metric('web3_cache_misses_total', 'counter', 'Requests a cache could not answer.', [
+            ('', labels, metrics['misses']) for labels, metrics in lookups
+        ])
+        return '\n'.join(lines) + '\n'
+
+
+def _histogram_samples(labels, histogram):
+    # Prometheus buckets count every value up to their bound
+    cumulative = 0
+    for bound, count in histogram['buckets']:
+        cumulative += count
+        le = '+Inf' if bound is None else _format_value(bound)
+        yield ('_bucket', labels + (('le', le),), cumulative)
+    yield ('_sum', labels, histogram['total'])
+    yield ('_count', labels, histogram['count'])
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    else:
+        return str(value)
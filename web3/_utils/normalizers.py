@@ -172,7 +172,7 @@ def abi_ens_resolver(w3, type_str, val):
                 "Could not look up name %r because ENS is"
                 " set to None" % (val)
             )
-        elif int(w3.net.version) is not 1 and not isinstance(w3.ens, StaticENS):
+        elif not isinstance(w3.ens, StaticENS) and w3.chain_metadata.chain_id != 1:
             raise InvalidAddress(
                 "Could not look up name %r because web3 is"
                 " not connected to mainnet" % (val)
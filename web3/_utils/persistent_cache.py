@@ -0,0 +1,127 @@
+"""
+A cache of responses kept in an SQLite database, so that it outlives the
+process.  It only holds results which cannot change once the request names
+the block or transaction they belong to.
+"""
+import json
+import sqlite3
+import threading
+
+DEFAULT_PERSISTENT_CACHE_SIZE = 100000
+
+# once the cache holds more than its ``max_entries``, the oldest entries are
+# evicted down to this share of it, so that eviction is not needed on every
+# insertion
+EVICTION_TARGET = 0.9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    block_hash TEXT,
+    block_number INTEGER
+)
+"""
+
+BLOCK_NUMBER_INDEX = """
+CREATE INDEX IF NOT EXISTS responses_block_number ON responses (block_number)
+"""
+
+
+class PersistentResponseCache:
+    """
+    Responses stored by cache key in the SQLite database at ``path``, in
+    write-ahead log mode so that several processes can share it.  At most
+    ``max_entries`` responses are kept, evicting the oldest first.
+
+    A response may be stored with the hash and number of the block it
+    belongs to, so that it can be dropped by :meth:`remove_forked` once
+    another block is found at that height.
+    """
+    def __init__(self, path, max_entries=DEFAULT_PERSISTENT_CACHE_SIZE):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1, got %r" % max_entries)
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute(SCHEMA)
+            self._connection.execute(BLOCK_NUMBER_INDEX)
+            (self._size,) = self._connection.execute(
+                'SELECT COUNT(*) FROM responses'
+            ).fetchone()
+
+    def __len__(self):
+        return self._size
+
+    def get(self, key):
+        """
+        Returns the response stored under ``key``, or ``None``.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT response FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        else:
+            return json.loads(row[0])
+
+    def set(self, key, response, block_hash=None, block_number=None):
+        """
+        Stores ``response`` under ``key``.  Responses which cannot be encoded
+        as JSON are not stored.
+        """
+        try:
+            encoded = json.dumps(response, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return
+        with self._lock, self._connection:
+            # a response which is already stored cannot have changed
+            cursor = self._connection.execute(
+                'INSERT OR IGNORE INTO responses (key, response, block_hash, block_number) '
+                'VALUES (?, ?, ?, ?)',
+                (key, encoded, block_hash, block_number),
+            )
+            if cursor.rowcount:
+                self._size += 1
+            if self._size > self.max_entries:
+                self._evict()
+
+    def remove_forked(self, block_number, block_hash):
+        """
+        Drops the responses stored for a block at ``block_number`` other than
+        the one with ``block_hash``, which the chain has reorganized away.
+        Returns how many were dropped.
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                'DELETE FROM responses WHERE block_number = ? AND block_hash != ?',
+                (block_number, block_hash),
+            )
+            self._size -= cursor.rowcount
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses')
+            self._size = 0
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self):
+        (self._size,) = self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()
+        excess = self._size - max(int(self.max_entries * EVICTION_TARGET), 1)
+        if excess > 0:
+            # rows are inserted in rowid order, so the lowest are the oldest
+            self._connection.execute(
+                'DELETE FROM responses WHERE rowid IN '
+                '(SELECT rowid FROM responses ORDER BY rowid LIMIT ?)',
+                (excess,),
+            )
+            self._size -= excess
@@ -0,0 +1,184 @@
+"""
+Profiling where the time of each request goes: in each layer of the
+middleware onion, in the provider encoding the request and decoding the
+response, and in the provider's transport.
+
+The time of each stage is recorded by RPC method in a
+:class:`LatencyHistogram`.  Stages nest, and each records only its own time,
+not that of the stages within it, so that the time of a middleware does not
+include the time of the node.  A request which a middleware makes of its own
+is counted under its own method, and not in the time of the middleware.
+"""
+import bisect
+import threading
+import time
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0,
+    10.0,
+)
+
+# the stages of each request
+TOTAL_STAGE = 'total'
+MIDDLEWARE_STAGE_PREFIX = 'middleware:'
+ROUTE_STAGE = 'route'
+ENCODE_STAGE = 'encode'
+TRANSPORT_STAGE = 'transport'
+DECODE_STAGE = 'decode'
+
+# the method which the stages of a batch request are recorded under
+BATCH_METHOD = 'batch'
+
+
+_profiling_state = threading.local()
+
+
+class LatencyHistogram:
+    """
+    Counts durations in buckets, which are the upper bounds in seconds of
+    each bucket.  Durations above the last bound are counted in a final
+    bucket with no bound.  Not thread safe.
+    """
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self):
+        """
+        Returns a dict of the ``count``, ``total`` and ``max`` of the durations,
+        and of the ``buckets`` as a list of ``(max_seconds, count)`` pairs, with
+        ``None`` as the bound of the final bucket.
+        """
+        return {
+            'count': self.count,
+            'total': self.total,
+            'max': self.max,
+            'buckets': list(zip(self.buckets + (None,), self.counts)),
+        }
+
+
+class NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+NULL_TIMER = NullTimer()
+
+
+class StageTimer:
+    """
+    Records the time spent within the block, less the time of the stages
+    nested within it.  With ``nested=False``, records the whole time instead,
+    and is not subtracted from any enclosing stage.
+    """
+    __slots__ = ('profiler', 'method', 'stage', 'nested', 'start')
+
+    def __init__(self, profiler, method, stage, nested=True):
+        self.profiler = profiler
+        self.method = method
+        self.stage = stage
+        self.nested = nested
+
+    def __enter__(self):
+        if self.nested:
+            stack = getattr(_profiling_state, 'stack', None)
+            if stack is None:
+                stack = _profiling_state.stack = []
+            stack.append(0.0)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        if self.nested:
+            stack = _profiling_state.stack
+            nested_time = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            elapsed -= nested_time
+        self.profiler.record(self.method, self.stage, elapsed)
+
+
+def time_stage(profiler, method, stage):
+    """
+    Returns a context manager timing ``stage`` of a request for ``method``,
+    which does nothing if ``profiler`` is ``None``.
+    """
+    if profiler is None:
+        return NULL_TIMER
+    else:
+        return StageTimer(profiler, method, stage)
+
+
+class RequestProfiler:
+    """
+    The histograms of the time spent in each stage of the requests for each
+    RPC method.
+    """
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, stage, seconds):
+        key = (method, stage)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram(self.buckets)
+            histogram.record(seconds)
+
+    def time(self, method, stage, nested=True):
+        return StageTimer(self, method, stage, nested)
+
+    def profile_layer(self, stage, request_fn):
+        """
+        Wraps a layer of the middleware onion to record its time as ``stage``.
+        """
+        def profiled_request_fn(method, params):
+            with StageTimer(self, method, stage):
+                return request_fn(method, params)
+        return profiled_request_fn
+
+    def snapshot(self):
+        """
+        Returns a dict of each RPC method to a dict of each stage of its
+        requests to the snapshot of its histogram.
+        """
+        with self._lock:
+            snapshot = {}
+            for (method, stage), histogram in self.histograms.items():
+                snapshot.setdefault(method, {})[stage] = histogram.snapshot()
+            return snapshot
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+
+
+def get_middleware_name(name):
+    """
+    The stage name of a layer of the middleware onion, from its name in the
+    onion, or from the middleware itself if it was added without a name.
+    """
+    if isinstance(name, str):
+        return MIDDLEWARE_STAGE_PREFIX + name
+    else:
+        return MIDDLEWARE_STAGE_PREFIX + getattr(name, '__name__', repr(name))
@@ -1,5 +1,13 @@
+import asyncio
+
 import lru
 import requests
+from requests.adapters import (
+    DEFAULT_POOLBLOCK,
+    DEFAULT_POOLSIZE,
+    DEFAULT_RETRIES,
+    HTTPAdapter,
+)
 
 from web3._utils.caching import (
     generate_cache_key,
@@ -20,10 +28,99 @@ def _get_session(*args, **kwargs):
     return _session_cache[cache_key]
 
 
-def make_post_request(endpoint_uri, data, *args, **kwargs):
+def create_session(pool_connections=DEFAULT_POOLSIZE,
+                   pool_maxsize=DEFAULT_POOLSIZE,
+                   pool_block=DEFAULT_POOLBLOCK,
+                   max_retries=DEFAULT_RETRIES,
+                   keep_alive=True):
+    """
+    Creates a ``requests.Session`` whose connection pools are configured with
+    the given settings, which are passed on to its ``HTTPAdapter``.
+
+    * ``pool_connections`` is the number of hosts to keep connection pools for
+    * ``pool_maxsize`` is the number of connections kept open to each host
+    * ``pool_block`` makes requests wait for a free connection rather than open
+      a connection which is discarded afterwards once the pool is full
+    * ``max_retries`` is an int or a ``urllib3.util.retry.Retry``
+    * ``keep_alive=False`` closes each connection after its response
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=max_retries,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def make_post_request(endpoint_uri, data, *args, session=None, **kwargs):
     kwargs.setdefault('timeout', 10)
-    session = _get_session(endpoint_uri)
+    if session is None:
+        session = _get_session(endpoint_uri)
     response = session.post(endpoint_uri, data=data, *args, **kwargs)
     response.raise_for_status()
 
     return response.content
+
+
+# the sessions of each event loop by endpoint, as aiohttp sessions are bound to
+# the loop they were created in
+_async_session_cache = {}
+
+
+def _remove_closed_loops():
+    for loop in [loop for loop in _async_session_cache if loop.is_closed()]:
+        for session in _async_session_cache.pop(loop).values():
+            if not session.closed:
+                try:
+                    # closes the connections without the loop, which is closed
+                    session.connector.close()
+                except Exception:
+                    pass
+
+
+def _get_async_session(endpoint_uri):
+    import aiohttp
+
+    loop = asyncio.get_event_loop()
+    sessions = _async_session_cache.get(loop)
+    if sessions is None:
+        # the sessions of loops which were closed without close_async_sessions()
+        # are closed when a new loop makes its first request
+        _remove_closed_loops()
+        sessions = _async_session_cache[loop] = {}
+    session = sessions.get(endpoint_uri)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(raise_for_status=True)
+        sessions[endpoint_uri] = session
+    return session
+
+
+async def close_async_sessions(endpoint_uri=None):
+    """
+    Closes the sessions of the running event loop, or only its session for
+    ``endpoint_uri``.  Should be awaited before the loop is closed.
+    """
+    loop = asyncio.get_event_loop()
+    sessions = _async_session_cache.get(loop, {})
+    if endpoint_uri is None:
+        closing = list(sessions.values())
+        _async_session_cache.pop(loop, None)
+    else:
+        closing = [sessions.pop(endpoint_uri)] if endpoint_uri in sessions else []
+    for session in closing:
+        await session.close()
+
+
+async def async_make_post_request(endpoint_uri, data, *args, **kwargs):
+    import aiohttp
+
+    kwargs.setdefault('timeout', aiohttp.ClientTimeout(total=10))
+    session = _get_async_session(endpoint_uri)
+    async with session.post(endpoint_uri, data=data, *args, **kwargs) as response:
+        return await response.read()
@@ -0,0 +1,53 @@
+"""
+Overriding the ``result_format`` of a Web3 instance for the requests made by
+the current thread within a block.
+
+Middlewares may make requests of their own while handling a request, such as
+a gas price strategy reading recent blocks.  An override only applies to the
+requests made directly within the block, so that those nested requests still
+get the results the middleware expects.
+"""
+import contextlib
+import threading
+
+_result_format_state = threading.local()
+
+
+def get_request_depth():
+    return getattr(_result_format_state, 'depth', 0)
+
+
+@contextlib.contextmanager
+def making_request():
+    """
+    Wraps each request made by the request manager, to keep track of how
+    deeply requests are nested.
+    """
+    _result_format_state.depth = get_request_depth() + 1
+    try:
+        yield
+    finally:
+        _result_format_state.depth -= 1
+
+
+@contextlib.contextmanager
+def result_format_override(web3, result_format):
+    previous = getattr(_result_format_state, 'override', None)
+    _result_format_state.override = (web3, result_format, get_request_depth() + 1)
+    try:
+        yield
+    finally:
+        _result_format_state.override = previous
+
+
+def get_result_format_override(web3):
+    """
+    Returns the result format which the current request of the thread to
+    ``web3`` is overridden to, or ``None``.
+    """
+    override = getattr(_result_format_state, 'override', None)
+    if override is not None:
+        override_web3, result_format, depth = override
+        if override_web3 is web3 and depth == get_request_depth():
+            return result_format
+    return None
@@ -0,0 +1,281 @@
+"""
+Client-side rate limiting of the requests sent to a provider.
+
+A :class:`RequestScheduler` holds every request back until the token buckets
+of the provider and of the request's method class allow it to be sent.  The
+requests waiting on a bucket are let through in order of priority, so that
+interactive requests are not stuck behind a queue of bulk log scans.
+"""
+import asyncio
+import contextlib
+import heapq
+import itertools
+import threading
+import time
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+DEFAULT_METHOD_CLASS = 'default'
+DEFAULT_METHOD_CLASSES = {
+    'vns_getLogs': 'bulk',
+    'vns_getFilterLogs': 'bulk',
+}
+DEFAULT_CLASS_PRIORITIES = {
+    'bulk': PRIORITY_LOW,
+}
+
+# how often coroutines check whether they are next in line for a token
+ASYNC_POLL_INTERVAL = 0.005
+
+
+_priority_state = threading.local()
+
+
+@contextlib.contextmanager
+def request_priority(priority):
+    """
+    Sends the requests made by the current thread within the block with
+    ``priority``, whatever their method class.
+    """
+    previous = getattr(_priority_state, 'priority', None)
+    _priority_state.priority = priority
+    try:
+        yield
+    finally:
+        _priority_state.priority = previous
+
+
+class TokenBucket:
+    """
+    Allows ``rate`` requests per second on average, and bursts of up to
+    ``burst`` requests.  Not thread safe.
+    """
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("The rate limit must be positive, got %r" % rate)
+        self.rate = rate
+        self.burst = max(rate, 1) if burst is None else burst
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        """
+        Takes a token if one is available and returns 0, or else returns the
+        number of seconds until one will be.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        else:
+            return (1 - self.tokens) / self.rate
+
+
+class PriorityQueue:
+    """
+    The requests waiting for a token from ``bucket``.  Only the request at the
+    front of the queue takes tokens, so that requests are let through in order
+    of priority, and in order of arrival within a priority.
+    """
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self._condition = threading.Condition()
+        self._waiting = []
+        self._counter = itertools.count()
+
+    @property
+    def depth(self):
+        return len(self._waiting)
+
+    def wait(self, priority):
+        entry = self._push(priority)
+        try:
+            with self._condition:
+                while True:
+                    delay = self._poll(entry)
+                    if delay == 0:
+                        return
+                    self._condition.wait(delay)
+        except BaseException:
+            self._remove(entry)
+            raise
+
+    async def coro_wait(self, priority):
+        entry = self._push(priority)
+        try:
+            while True:
+                with self._condition:
+                    delay = self._poll(entry)
+                if delay == 0:
+                    return
+                await asyncio.sleep(delay or ASYNC_POLL_INTERVAL)
+        except BaseException:
+            self._remove(entry)
+            raise
+
+    def _push(self, priority):
+        entry = (priority, next(self._counter))
+        with self._condition:
+            heapq.heappush(self._waiting, entry)
+            # the request at the front may no longer be next in line
+            self._condition.notify_all()
+        return entry
+
+    def _poll(self, entry):
+        # must be called with self._condition held.  Returns 0 once the entry
+        # has taken a token, the seconds until the next token if the entry is
+        # at the front of the queue, or else None.
+        if self._waiting[0] != entry:
+            return None
+        delay = self.bucket.take()
+        if delay == 0:
+            heapq.heappop(self._waiting)
+            self._condition.notify_all()
+        return delay
+
+    def _remove(self, entry):
+        with self._condition:
+            if entry in self._waiting:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+
+
+class MethodClassStats:
+    """
+    The requests of a method class let through by a :class:`RequestScheduler`,
+    and the time they spent waiting.
+    """
+    def __init__(self):
+        self.requests = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def snapshot(self):
+        return {
+            'requests': self.requests,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'wait_time': self.wait_time,
+            'max_wait_time': self.max_wait_time,
+        }
+
+
+class RequestScheduler:
+    """
+    Limits the requests to a provider to ``rate`` per second, with bursts of up
+    to ``burst`` requests, and the requests of each method class to the limits
+    in ``class_limits``.
+
+    :param class_limits: A dict of method class names to either a rate, or a
+        ``(rate, burst)`` tuple.
+    :param method_classes: A dict of method names to their method class.  Any
+        other method is in the ``'default'`` class.
+    :param class_priorities: A dict of method class names to the priority
+        their requests are sent with, one of ``PRIORITY_HIGH``,
+        ``PRIORITY_NORMAL`` (the default) and ``PRIORITY_LOW``.
+    """
+    def __init__(self,
+                 rate=None,
+                 burst=None,
+                 class_limits=None,
+                 method_classes=DEFAULT_METHOD_CLASSES,
+                 class_priorities=DEFAULT_CLASS_PRIORITIES):
+        if rate is None:
+            self.queue = None
+        else:
+            self.queue = PriorityQueue(TokenBucket(rate, burst))
+
+        self.class_queues = {}
+        for method_class, limit in (class_limits or {}).items():
+            if isinstance(limit, tuple):
+                bucket = TokenBucket(*limit)
+            else:
+                bucket = TokenBucket(limit)
+            self.class_queues[method_class] = PriorityQueue(bucket)
+
+        self.method_classes = method_classes
+        self.class_priorities = class_priorities
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+
+    def get_method_class(self, method):
+        return self.method_classes.get(method, DEFAULT_METHOD_CLASS)
+
+    def get_priority(self, method_class):
+        priority = getattr(_priority_state, 'priority', None)
+        if priority is None:
+            return self.class_priorities.get(method_class, PRIORITY_NORMAL)
+        else:
+            return priority
+
+    def acquire(self, method):
+        """
+        Blocks until a request for ``method`` may be sent.
+        """
+        method_class = self.get_method_class(method)
+        priority = self.get_priority(method_class)
+        start = self._start_waiting(method_class)
+        try:
+            for queue in self._get_queues(method_class):
+                queue.wait(priority)
+        finally:
+            self._stop_waiting(method_class, start)
+
+    async def coro_acquire(self, method):
+        method_class = self.get_method_class(method)
+        priority = self.get_priority(method_class)
+        start = self._start_waiting(method_class)
+        try:
+            for queue in self._get_queues(method_class):
+                await queue.coro_wait(priority)
+        finally:
+            self._stop_waiting(method_class, start)
+
+    def snapshot(self):
+        """
+        Returns a dict of the queue depth and wait times of each method class,
+        and of the requests waiting on the provider's limit.
+        """
+        with self._stats_lock:
+            return {
+                'queue_depth': sum(stats.queue_depth for stats in self.stats.values()),
+                'classes': {
+                    method_class: stats.snapshot()
+                    for method_class, stats in self.stats.items()
+                },
+            }
+
+    def _get_queues(self, method_class):
+        # the class limit is waited on first, so that requests held back by it
+        # do not block the queue of the provider's limit
+        queues = []
+        if method_class in self.class_queues:
+            queues.append(self.class_queues[method_class])
+        if self.queue is not None:
+            queues.append(self.queue)
+        return queues
+
+    def _start_waiting(self, method_class):
+        with self._stats_lock:
+            stats = self.stats.get(method_class)
+            if stats is None:
+                stats = self.stats[method_class] = MethodClassStats()
+            stats.queue_depth += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        return time.monotonic()
+
+    def _stop_waiting(self, method_class, start):
+        wait_time = time.monotonic() - start
+        with self._stats_lock:
+            stats = self.stats[method_class]
+            stats.queue_depth -= 1
+            stats.requests += 1
+            stats.wait_time += wait_time
+            stats.max_wait_time = max(stats.max_wait_time, wait_time)
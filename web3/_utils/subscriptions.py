@@ -0,0 +1,170 @@
+"""
+Push subscriptions (``vns_subscribe``) over a persistent connection.
+
+The provider's connection calls :meth:`Subscription.deliver` for every
+notification the node sends for the subscription.  Notifications are handed to
+the subscriber either through a callback, which runs on a thread owned by the
+subscription, or by iterating over the subscription, synchronously or with
+``async for``.
+"""
+import asyncio
+import logging
+import queue
+import threading
+
+from vns_utils import (
+    is_dict,
+)
+
+from web3._utils.threads import (
+    spawn,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.middleware.pythonic import (
+    PYTHONIC_SUBSCRIPTION_FORMATTERS,
+)
+
+logger = logging.getLogger("web3._utils.subscriptions")
+
+
+class SubscriptionClosed:
+    """
+    Sentinel queued once a subscription is closed, carrying the exception which
+    closed it, if any.
+    """
+    def __init__(self, exception=None):
+        self.exception = exception
+
+
+class Subscription:
+    subscription_id = None
+    subscription_type = None
+    callback = None
+    closed = False
+
+    def __init__(self, web3, subscription_type, callback=None):
+        self.web3 = web3
+        self.subscription_type = subscription_type
+        self.callback = callback
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._async_queue = None
+        self._async_loop = None
+        self._formatters = get_subscription_formatters(web3, subscription_type)
+
+        if callback is not None:
+            self._callback_thread = spawn(self._run_callbacks)
+
+    def __str__(self):
+        return "Subscription {0} for {1}".format(self.subscription_id, self.subscription_type)
+
+    def format_entry(self, entry):
+        for formatter in self._formatters:
+            entry = formatter(entry)
+        return entry
+
+    def deliver(self, result):
+        """
+        Called by the provider with each raw result pushed by the node.
+        """
+        self._put(self.format_entry(result))
+
+    def close(self, exception=None):
+        """
+        Called by the provider when no more results will be delivered, with the
+        exception which broke the connection, if any.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+        self._put(SubscriptionClosed(exception))
+
+    def unsubscribe(self):
+        if self.closed:
+            return False
+        try:
+            return self.web3.vns.unsubscribe(self.subscription_id)
+        finally:
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unsubscribe()
+
+    def _put(self, entry):
+        with self._lock:
+            if self._async_queue is not None:
+                self._async_loop.call_soon_threadsafe(self._async_queue.put_nowait, entry)
+            else:
+                self._queue.put(entry)
+
+    def _run_callbacks(self):
+        for entry in self:
+            try:
+                self.callback(entry)
+            except Exception:
+                logger.exception("Callback of %s raised on %r", self, entry)
+
+    def __iter__(self):
+        while True:
+            entry = self._queue.get()
+            if isinstance(entry, SubscriptionClosed):
+                # leave the sentinel for any other consumer
+                self._queue.put(entry)
+                if entry.exception is not None:
+                    raise entry.exception
+                return
+            yield entry
+
+    def __aiter__(self):
+        with self._lock:
+            if self._async_queue is None:
+                if self.callback is not None:
+                    raise TypeError("Cannot iterate over a subscription which has a callback")
+                # the queue binds to the loop it is created in, so this must run
+                # inside the loop iterating over the subscription
+                loop = asyncio.get_event_loop()
+                if not loop.is_running():
+                    raise RuntimeError(
+                        "Subscriptions can only be iterated asynchronously in a running loop"
+                    )
+                self._async_loop = loop
+                self._async_queue = asyncio.Queue()
+                while not self._queue.empty():
+                    self._async_queue.put_nowait(self._queue.get_nowait())
+        return self
+
+    async def __anext__(self):
+        entry = await self._async_queue.get()
+        if isinstance(entry, SubscriptionClosed):
+            self._async_queue.put_nowait(entry)
+            if entry.exception is not None:
+                raise entry.exception
+            raise StopAsyncIteration
+        return entry
+
+
+def get_subscription_formatters(web3, subscription_type):
+    """
+    The formatters applied to pushed results mirror the result formatting of
+    the middlewares installed on ``web3``.
+    """
+    formatters = []
+    if 'pythonic' in web3.middleware_onion:
+        if subscription_type in PYTHONIC_SUBSCRIPTION_FORMATTERS:
+            formatters.append(PYTHONIC_SUBSCRIPTION_FORMATTERS[subscription_type])
+    if 'attrdict' in web3.middleware_onion:
+        formatters.append(to_attrdict_if_dict)
+    return formatters
+
+
+def to_attrdict_if_dict(value):
+    if is_dict(value) and not isinstance(value, AttributeDict):
+        return AttributeDict.recursive(value)
+    else:
+        return value
@@ -28,7 +28,7 @@ TRANSACTION_DEFAULTS = {
     'data': b'',
     'gas': lambda web3, tx: web3.vns.estimateGas(tx),
     'gasPrice': lambda web3, tx: web3.vns.generateGasPrice(tx) or web3.vns.gasPrice,
-    'chainId': lambda web3, tx: int(web3.net.version),
+    'chainId': lambda web3, tx: web3.chain_metadata.chain_id,
 }
 
 
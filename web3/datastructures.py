@@ -15,6 +15,9 @@ from vns_utils import (
 from web3._utils.formatters import (
     recursive_map,
 )
+from web3.exceptions import (
+    FieldFormattingError,
+)
 
 # Hashable must be immutable:
 # "the implementation of hashable collections requires that a key's hash value is immutable"
@@ -98,11 +101,282 @@ class AttributeDict(ReadableAttributeDict, Hashable):
             return False
 
 
+class LazyAttributeDict(AttributeDict):
+    """
+    An ``AttributeDict`` over a decoded JSON-RPC result, which only converts
+    a field the first time it is read, and keeps the converted value.  Nested
+    dicts become ``LazyAttributeDict`` themselves, and ``formatters`` may map
+    field names to a formatter to apply on conversion.
+
+    Reads, hashing and equality behave as for an ``AttributeDict`` of the
+    fully converted result.
+    """
+    __slots__ = ('_raw', '_formatters')
+
+    def __init__(self, dictionary, formatters=None):
+        object.__setattr__(self, '_raw', dictionary)
+        object.__setattr__(self, '_formatters', formatters)
+
+    def __getitem__(self, key):
+        try:
+            return self.__dict__[key]
+        except KeyError:
+            return self._convert(key)
+
+    def __getattr__(self, attr):
+        # only called for attributes which are not set yet
+        if attr in LazyAttributeDict.__slots__:
+            raise AttributeError(attr)
+        try:
+            return self._convert(attr)
+        except KeyError:
+            raise AttributeError(
+                "%r object has no attribute %r" % (self.__class__.__name__, attr)
+            ) from None
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(%r)" % dict(self)
+
+    def _repr_pretty_(self, builder, cycle):
+        builder.text(self.__class__.__name__ + "(")
+        if cycle:
+            builder.text("<cycle>")
+        else:
+            builder.pretty(dict(self))
+        builder.text(")")
+
+    def __hash__(self):
+        return hash(tuple(sorted(self.items())))
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        else:
+            return False
+
+    def __reduce__(self):
+        # the formatters may not be picklable, so the converted fields are
+        return (self.__class__, (dict(self),))
+
+    def _convert(self, key):
+        value = self._raw[key]
+        formatter = self._formatters.get(key) if self._formatters else None
+        if formatter is None:
+            converted = self.recursive(value)
+        else:
+            try:
+                converted = formatter(value)
+            except FieldFormattingError as exc:
+                exc.prepend(key)
+                raise
+            except (TypeError, ValueError) as exc:
+                raise FieldFormattingError(key) from exc
+        self.__dict__[key] = converted
+        return converted
+
+    @classmethod
+    def recursive(cls, value):
+        if isinstance(value, AttributeDict):
+            return value
+        elif isinstance(value, Mapping):
+            return cls(value)
+        elif isinstance(value, (list, tuple)):
+            return type(value)(cls.recursive(item) for item in value)
+        else:
+            return value
+
+
+_MISSING = object()
+
+
+class Record(Mapping, Hashable):
+    """
+    An immutable record with a slot for each of the well known ``_fields`` of
+    a JSON-RPC result, which takes far less memory than an ``AttributeDict``
+    of the same result.  Any other fields are kept in a dict of their own.
+
+    Fields are read as attributes or items, like an ``AttributeDict``, and
+    hashing and equality are those of an ``AttributeDict`` of the same fields.
+    Iteration is in the order of ``_fields``, followed by any other fields.
+    """
+    __slots__ = ('_extra',)
+    _fields = ()
+    _field_set = frozenset()
+
+    def __init__(self, dictionary):
+        extra = None
+        for key, value in dictionary.items():
+            if key in self._field_set:
+                object.__setattr__(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        object.__setattr__(self, '_extra', extra)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls._fields)
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __getattr__(self, attr):
+        # only called for fields which are not set, and for the other fields
+        extra = object.__getattribute__(self, '_extra')
+        if extra is not None and attr in extra:
+            return extra[attr]
+        raise AttributeError("%r object has no attribute %r" % (self.__class__.__name__, attr))
+
+    def __setattr__(self, attr, val):
+        raise TypeError('This data is immutable -- create a copy instead of modifying')
+
+    def __delattr__(self, key):
+        raise TypeError('This data is immutable -- create a copy instead of modifying')
+
+    def __iter__(self):
+        for field in self._fields:
+            if getattr(self, field, _MISSING) is not _MISSING:
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        if key in self._field_set:
+            return getattr(self, key, _MISSING) is not _MISSING
+        else:
+            return self._extra is not None and key in self._extra
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(%r)" % dict(self)
+
+    def _repr_pretty_(self, builder, cycle):
+        builder.text(self.__class__.__name__ + "(")
+        if cycle:
+            builder.text("<cycle>")
+        else:
+            builder.pretty(dict(self))
+        builder.text(")")
+
+    def __hash__(self):
+        return hash(tuple(sorted(self.items())))
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        else:
+            return False
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+class TransactionRecord(Record):
+    _fields = (
+        'blockHash',
+        'blockNumber',
+        'from',
+        'gas',
+        'gasPrice',
+        'hash',
+        'input',
+        'nonce',
+        'to',
+        'transactionIndex',
+        'value',
+        'v',
+        'r',
+        's',
+    )
+    __slots__ = _fields
+
+
+class LogRecord(Record):
+    _fields = (
+        'address',
+        'blockHash',
+        'blockNumber',
+        'data',
+        'logIndex',
+        'removed',
+        'topics',
+        'transactionHash',
+        'transactionIndex',
+    )
+    __slots__ = _fields
+
+
+class ReceiptRecord(Record):
+    _fields = (
+        'blockHash',
+        'blockNumber',
+        'contractAddress',
+        'cumulativeGasUsed',
+        'from',
+        'gasUsed',
+        'logs',
+        'logsBloom',
+        'root',
+        'status',
+        'to',
+        'transactionHash',
+        'transactionIndex',
+    )
+    __slots__ = _fields
+
+
+class BlockRecord(Record):
+    _fields = (
+        'difficulty',
+        'extraData',
+        'gasLimit',
+        'gasUsed',
+        'hash',
+        'logsBloom',
+        'miner',
+        'mixHash',
+        'nonce',
+        'number',
+        'parentHash',
+        'receiptsRoot',
+        'sha3Uncles',
+        'size',
+        'stateRoot',
+        'timestamp',
+        'totalDifficulty',
+        'transactions',
+        'transactionsRoot',
+        'uncles',
+    )
+    __slots__ = _fields
+
+
 class NamedElementOnion(Mapping):
     """
     Add layers to an onion-shaped structure. Optionally, inject to a specific layer.
     This structure is iterable, where the outermost layer is first, and innermost is last.
     """
+    _elements = None
 
     def __init__(self, init_elements, valid_element=callable):
         self._queue = OrderedDict()
@@ -123,6 +397,25 @@ class NamedElementOnion(Mapping):
                 raise ValueError("You can't add the same name again, use replace instead")
 
         self._queue[name] = element
+        self._elements = None
+
+    @property
+    def elements(self):
+        """
+        A tuple of the elements, outermost first.  It is only rebuilt after
+        the onion changes, so the same tuple is returned until then.
+        """
+        if self._elements is None:
+            self._elements = tuple(self)
+        return self._elements
+
+    @property
+    def names(self):
+        """
+        A tuple of the names of the elements, in the order of ``elements``.
+        An element added without a name is its own name.
+        """
+        return tuple(reversed(list(self._queue)))
 
     def inject(self, element, name=None, layer=None):
         """
@@ -150,6 +443,7 @@ class NamedElementOnion(Mapping):
             if name is None:
                 name = element
             self._queue.move_to_end(name, last=False)
+            self._elements = None
         elif layer == len(self._queue):
             return
         else:
@@ -157,6 +451,7 @@ class NamedElementOnion(Mapping):
 
     def clear(self):
         self._queue.clear()
+        self._elements = None
 
     def replace(self, old, new):
         if old not in self._queue:
@@ -167,12 +462,14 @@ class NamedElementOnion(Mapping):
             self._replace_with_new_name(old, new)
         else:
             self._queue[old] = new
+        self._elements = None
         return to_be_replaced
 
     def remove(self, old):
         if old not in self._queue:
             raise ValueError("You can only remove something that has been added")
         del self._queue[old]
+        self._elements = None
 
     def _replace_with_new_name(self, old, new):
         self._queue[new] = new
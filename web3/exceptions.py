@@ -26,6 +26,38 @@ class CannotHandleRequest(Exception):
     pass
 
 
+class CircuitBreakerOpen(IOError):
+    """
+    Raised when a request is failed without being sent, because the endpoint
+    has been failing and its circuit breaker is open.
+    """
+    pass
+
+
+class FieldFormattingError(ValueError):
+    """
+    Raised when a field of a result cannot be formatted.  ``path`` names the
+    field, such as ``transactions[3].value``, and the error raised by its
+    formatter is the ``__cause__``.
+    """
+    def __init__(self, path):
+        super().__init__(path)
+        self.path = path
+
+    def __str__(self):
+        return "Could not format field %r" % self.path
+
+    def prepend(self, part):
+        """
+        Adds the key or ``[index]`` of an enclosing value to the path.
+        """
+        if self.path.startswith('['):
+            self.path = part + self.path
+        else:
+            self.path = part + '.' + self.path
+        self.args = (self.path,)
+
+
 class InvalidAddress(ValueError):
     """
     The supplied address does not have a valid checksum, as defined in EIP-55
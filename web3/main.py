@@ -17,6 +17,9 @@ from ens import ENS
 from web3._utils.abi import (
     map_abi_data,
 )
+from web3._utils.chain_metadata import (
+    ChainMetadata,
+)
 from web3._utils.decorators import (
     combomethod,
     deprecated_for,
@@ -38,6 +41,9 @@ from web3._utils.module import (
 from web3._utils.normalizers import (
     abi_ens_resolver,
 )
+from web3._utils.result_formats import (
+    result_format_override,
+)
 from web3.vns import (
     Bbbbbbbb,
 )
@@ -55,6 +61,10 @@ from web3.iban import (
 from web3.manager import (
     RequestManager as DefaultRequestManager,
 )
+from web3.middleware.attrdict import (
+    DEFAULT_RESULT_FORMAT,
+    validate_result_format,
+)
 from web3.net import (
     Net,
 )
@@ -66,6 +76,9 @@ from web3.parity import (
 from web3.providers.vns_tester import (
     EthereumTesterProvider,
 )
+from web3.providers.async_rpc import (
+    AsyncHTTPProvider,
+)
 from web3.providers.ipc import (
     IPCProvider,
 )
@@ -106,6 +119,7 @@ def get_default_modules():
 class Web3:
     # Providers
     HTTPProvider = HTTPProvider
+    AsyncHTTPProvider = AsyncHTTPProvider
     IPCProvider = IPCProvider
     EthereumTesterProvider = EthereumTesterProvider
     WebsocketProvider = WebsocketProvider
@@ -134,6 +148,7 @@ class Web3:
 
     def __init__(self, provider=None, middlewares=None, modules=None, ens=empty):
         self.manager = self.RequestManager(self, provider, middlewares)
+        self.chain_metadata = ChainMetadata(self)
 
         if modules is None:
             modules = get_default_modules()
@@ -142,10 +157,47 @@ class Web3:
 
         self.ens = ens
 
+    _result_format = DEFAULT_RESULT_FORMAT
+
     @property
     def middleware_onion(self):
         return self.manager.middleware_onion
 
+    @property
+    def result_format(self):
+        """
+        How the attrdict middleware represents results: ``'attrdict'`` for an
+        ``AttributeDict``, ``'lazy'`` for a ``LazyAttributeDict``, which
+        only converts the fields which are read, ``'records'`` for compact
+        ``Record`` objects of blocks, transactions, receipts and logs, or
+        ``'raw'`` for the results as decoded from the responses, without the
+        formatting of the pythonic middleware.
+        """
+        return self._result_format
+
+    @result_format.setter
+    def result_format(self, result_format):
+        validate_result_format(result_format)
+        self._result_format = result_format
+
+    def using_result_format(self, result_format):
+        """
+        Returns a context manager which overrides the ``result_format`` for the
+        requests made by the current thread within the block.  The requests
+        which middlewares make of their own are not affected.
+        """
+        validate_result_format(result_format)
+        return result_format_override(self, result_format)
+
+    @property
+    def metrics(self):
+        """
+        The :class:`~web3._utils.metrics.MetricsCollector` of the requests made
+        through this instance, or ``None`` unless enabled with
+        :meth:`~web3.manager.RequestManager.enable_metrics`.
+        """
+        return self.manager.metrics
+
     @property
     def provider(self):
         return self.manager.provider
@@ -218,6 +270,12 @@ class Web3:
     def isConnected(self):
         return self.provider.isConnected()
 
+    async def coro_isConnected(self):
+        """
+        Like :meth:`isConnected`, for asynchronous providers.
+        """
+        return await self.provider.coro_isConnected()
+
     @property
     def ens(self):
         if self._ens is empty:
@@ -1,9 +1,23 @@
 import logging
 import uuid
 
+from web3._utils.batching import (
+    BatchCollector,
+)
 from web3._utils.decorators import (
     deprecated_for,
 )
+from web3._utils.metrics import (
+    MetricsCollector,
+)
+from web3._utils.profiling import (
+    DEFAULT_LATENCY_BUCKETS,
+    TOTAL_STAGE,
+    RequestProfiler,
+)
+from web3._utils.result_formats import (
+    making_request,
+)
 from web3._utils.threads import (
     spawn,
 )
@@ -12,6 +26,11 @@ from web3.datastructures import (
 )
 from web3.middleware import (
     abi_middleware,
+    async_abi_middleware,
+    async_attrdict_middleware,
+    async_normalize_errors_middleware,
+    async_pythonic_middleware,
+    async_request_parameter_normalizer,
     attrdict_middleware,
     gas_price_strategy_middleware,
     name_to_address_middleware,
@@ -32,17 +51,22 @@ class RequestManager:
         self.web3 = web3
         self.pending_requests = {}
 
-        if middlewares is None:
-            middlewares = self.default_middlewares(web3)
-
-        self.middleware_onion = NamedElementOnion(middlewares)
-
         if provider is None:
             self.provider = AutoProvider()
         else:
             self.provider = provider
 
+        if middlewares is None:
+            if getattr(self.provider, 'is_async', False):
+                middlewares = self.async_default_middlewares(web3)
+            else:
+                middlewares = self.default_middlewares(web3)
+
+        self.middleware_onion = NamedElementOnion(middlewares)
+
     web3 = None
+    profiler = None
+    metrics = None
     _provider = None
 
     @property
@@ -51,8 +75,50 @@ class RequestManager:
 
     @provider.setter
     def provider(self, provider):
+        if self.profiler is not None:
+            if self._provider is not None:
+                self._provider.profiler = None
+            provider.profiler = self.profiler
+        if self.metrics is not None:
+            if self._provider is not None:
+                self._provider.metrics = None
+            provider.metrics = self.metrics
         self._provider = provider
 
+    def enable_profiling(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        """
+        Records the time spent in each layer of the middleware onion, and in
+        the provider encoding requests, sending them and decoding responses,
+        by RPC method.  Returns the
+        :class:`~web3._utils.profiling.RequestProfiler`, whose ``snapshot()``
+        returns the histograms of each stage.
+
+        Only the middlewares of synchronous providers are profiled.
+        """
+        self.profiler = RequestProfiler(buckets)
+        self.provider.profiler = self.profiler
+        return self.profiler
+
+    def disable_profiling(self):
+        self.profiler = None
+        self.provider.profiler = None
+
+    def enable_metrics(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        """
+        Counts the requests the provider sends to each endpoint, with their
+        errors, sizes and latency, and the hits and misses of the cache
+        middlewares, by RPC method.  Returns the
+        :class:`~web3._utils.metrics.MetricsCollector`, whose ``snapshot()``
+        and ``to_text()`` export the metrics.
+        """
+        self.metrics = MetricsCollector(buckets)
+        self.provider.metrics = self.metrics
+        return self.metrics
+
+    def disable_metrics(self):
+        self.metrics = None
+        self.provider.metrics = None
+
     @staticmethod
     def default_middlewares(web3):
         """
@@ -70,20 +136,41 @@ class RequestManager:
             (abi_middleware, 'abi'),
         ]
 
+    @staticmethod
+    def async_default_middlewares(web3):
+        """
+        List the default middlewares for the request manager when the provider
+        is asynchronous.  Middlewares which need to make blocking calls back
+        into web3 (name resolution, gas price strategies and chain id
+        validation) are not included.
+        """
+        return [
+            (async_request_parameter_normalizer, 'request_param_normalizer'),
+            (async_attrdict_middleware, 'attrdict'),
+            (async_pythonic_middleware, 'pythonic'),
+            (async_normalize_errors_middleware, 'normalize_errors'),
+            (async_abi_middleware, 'abi'),
+        ]
+
     #
     # Provider requests and response
     #
     def _make_request(self, method, params):
-        request_func = self.provider.request_func(
-            self.web3,
-            tuple(self.middleware_onion))
+        request_func = self.provider.request_func(self.web3, self.middleware_onion)
         self.logger.debug("Making request. Method: %s", method)
-        return request_func(method, params)
+        with making_request():
+            if self.profiler is None:
+                return request_func(method, params)
+            with self.profiler.time(method, TOTAL_STAGE, nested=False):
+                return request_func(method, params)
+
+    def _make_batch_request(self, requests):
+        request_func = self.provider.request_func(self.web3, self.middleware_onion)
+        self.logger.debug("Making batch request. Size: %d", len(requests))
+        return BatchCollector(self.provider).run(request_func, requests)
 
     async def _coro_make_request(self, method, params):
-        request_func = self.provider.request_func(
-            self.web3,
-            tuple(self.middleware_onion))
+        request_func = self.provider.request_func(self.web3, self.middleware_onion)
         self.logger.debug("Making request. Method: %s", method)
         return await request_func(method, params)
 
@@ -98,6 +185,23 @@ class RequestManager:
 
         return response['result']
 
+    def request_batch(self, requests):
+        """
+        Make a batch of synchronous requests using the provider.
+
+        ``requests`` is a list of ``(method, params)`` pairs.  Every request
+        passes through the full middleware onion, and the requests which reach
+        the provider are sent together as a single JSON-RPC batch.  Returns
+        the results in the same order as ``requests``.
+        """
+        responses = self._make_batch_request(list(requests))
+
+        for response in responses:
+            if "error" in response:
+                raise ValueError(response["error"])
+
+        return [response['result'] for response in responses]
+
     async def coro_request(self, method, params):
         """
         Couroutine for making a request using the provider
@@ -2,18 +2,25 @@ import functools
 
 from .abi import (  # noqa: F401
     abi_middleware,
+    async_abi_middleware,
 )
 from .attrdict import (  # noqa: F401
+    async_attrdict_middleware,
     attrdict_middleware,
 )
 from .cache import (  # noqa: F401
     construct_simple_cache_middleware,
     construct_time_based_cache_middleware,
     construct_latest_block_based_cache_middleware,
+    construct_persistent_cache_middleware,
     _simple_cache_middleware as simple_cache_middleware,
     _time_based_cache_middleware as time_based_cache_middleware,
     _latest_block_based_cache_middleware as latest_block_based_cache_middleware,
 )
+from .coalesce import (  # noqa: F401
+    construct_request_coalescing_middleware,
+    request_coalescing_middleware,
+)
 from .exception_handling import (  # noqa: F401
     construct_exception_handler_middleware,
 )
@@ -26,6 +33,7 @@ from .fixture import (  # noqa: F401
     construct_error_generator_middleware,
 )
 from .formatting import (  # noqa: F401
+    async_construct_formatting_middleware,
     construct_formatting_middleware,
 )
 from .gas_price_strategy import (  # noqa: F401
@@ -35,12 +43,15 @@ from .names import (  # noqa: F401
     name_to_address_middleware,
 )
 from .normalize_errors import (  # noqa: F401
+    async_normalize_errors_middleware,
     normalize_errors_middleware,
 )
 from .normalize_request_parameters import (  # noqa: F401
+    async_request_parameter_normalizer,
     request_parameter_normalizer,
 )
 from .pythonic import (  # noqa: F401
+    async_pythonic_middleware,
     pythonic_middleware,
 )
 from .stalecheck import (  # noqa: F401
@@ -48,7 +59,10 @@ from .stalecheck import (  # noqa: F401
 )
 
 from .exception_retry_request import (  # noqa: F401
-    http_retry_request_middleware
+    RetryPolicy,
+    async_http_retry_request_middleware,
+    construct_http_retry_request_middleware,
+    http_retry_request_middleware,
 )
 
 from .geth_poa import (  # noqa: F401
@@ -64,13 +78,80 @@ from .signing import (  # noqa: F401
 )
 
 
-def combine_middlewares(middlewares, web3, provider_request_fn):
+def combine_middlewares(middlewares, web3, provider_request_fn, profiler=None, names=None):
     """
     Returns a callable function which will call the provider.provider_request
     function wrapped with all of the middlewares.
+
+    With a :class:`~web3._utils.profiling.RequestProfiler`, the time spent in
+    each middleware is recorded under its stage name in ``names``.
+    """
+    if profiler is None:
+        return functools.reduce(
+            lambda request_fn, middleware: middleware(request_fn, web3),
+            reversed(middlewares),
+            provider_request_fn,
+        )
+
+    request_fn = provider_request_fn
+    for middleware, name in reversed(tuple(zip(middlewares, names))):
+        request_fn = profiler.profile_layer(name, middleware(request_fn, web3))
+    return request_fn
+
+
+def handles_method(middleware, method):
+    """
+    Whether ``middleware`` needs to see requests for ``method``.  Middlewares
+    may declare the methods they act on in a ``handles_methods`` attribute,
+    and are skipped for any other method.
+    """
+    handles_methods = getattr(middleware, 'handles_methods', None)
+    return handles_methods is None or method in handles_methods
+
+
+def compile_middlewares(middlewares, web3, provider_request_fn, profiler=None, names=None):
     """
-    return functools.reduce(
-        lambda request_fn, middleware: middleware(request_fn, web3),
-        reversed(middlewares),
-        provider_request_fn,
-    )
+    Like :func:`combine_middlewares`, but a request skips the middlewares
+    which do not handle its method.  Each middleware is set up once and
+    shares its state across all methods.  Its inner request function passes
+    each request on to the next middleware which handles that request's
+    method, so requests which a middleware makes of its inner layers go
+    through the middlewares of their own method.
+    """
+    middlewares = tuple(middlewares)
+    if profiler is not None:
+        names = tuple(names)
+    # the request function of each middleware, followed by the provider's
+    layer_fns = [None] * len(middlewares) + [provider_request_fn]
+    # for each layer, the request function of the first layer from it onwards
+    # which handles each method
+    routes = [{} for _ in layer_fns]
+
+    def get_route(index, method):
+        for layer in range(index, len(middlewares)):
+            if handles_method(middlewares[layer], method):
+                route = layer_fns[layer]
+                break
+        else:
+            route = provider_request_fn
+        routes[index][method] = route
+        return route
+
+    def route_from(index):
+        layer_routes = routes[index]
+
+        def request_fn(method, params):
+            try:
+                route = layer_routes[method]
+            except KeyError:
+                route = get_route(index, method)
+            return route(method, params)
+        return request_fn
+
+    for index in reversed(range(len(middlewares))):
+        layer_fn = middlewares[index](route_from(index + 1), web3)
+        if profiler is not None:
+            layer_fn = profiler.profile_layer(names[index], layer_fn)
+        layer_fns[index] = layer_fn
+
+    return route_from(0)
@@ -10,6 +10,7 @@ from web3._utils.rpc_abi import (
 )
 
 from .formatting import (
+    async_construct_formatting_middleware,
     construct_formatting_middleware,
 )
 
@@ -24,3 +25,8 @@ STANDARD_NORMALIZERS = [
 abi_middleware = construct_formatting_middleware(
     request_formatters=abi_request_formatters(STANDARD_NORMALIZERS, RPC_ABIS)
 )
+
+
+async_abi_middleware = async_construct_formatting_middleware(
+    request_formatters=abi_request_formatters(STANDARD_NORMALIZERS, RPC_ABIS)
+)
@@ -2,27 +2,70 @@ from vns_utils import (
     is_dict,
 )
 
+from web3._utils.result_formats import (
+    get_result_format_override,
+)
 from web3._utils.toolz import (
     assoc,
 )
 from web3.datastructures import (
     AttributeDict,
+    LazyAttributeDict,
+    Record,
 )
 
+DEFAULT_RESULT_FORMAT = 'attrdict'
+# the classes which results are converted to, by the ``result_format`` of Web3.
+# With ``'records'``, the pythonic middleware makes records of the results it
+# knows the shape of, and any other result is an AttributeDict.  With
+# ``'raw'``, results are left as they were decoded from the response.
+RESULT_FORMATS = {
+    'attrdict': AttributeDict,
+    'lazy': LazyAttributeDict,
+    'records': AttributeDict,
+    'raw': None,
+}
+
+
+def validate_result_format(result_format):
+    if result_format not in RESULT_FORMATS:
+        raise ValueError("Unknown result format {0!r}, expected one of {1}".format(
+            result_format,
+            sorted(RESULT_FORMATS),
+        ))
+
+
+def get_result_format(web3):
+    result_format = get_result_format_override(web3)
+    if result_format is None:
+        return getattr(web3, 'result_format', DEFAULT_RESULT_FORMAT)
+    else:
+        return result_format
+
+
+def _convert_result(web3, response):
+    if 'result' in response:
+        result = response['result']
+        if is_dict(result) and not isinstance(result, (AttributeDict, Record)):
+            result_class = RESULT_FORMATS[get_result_format(web3)]
+            if result_class is not None:
+                return assoc(response, 'result', result_class.recursive(result))
+    return response
+
 
 def attrdict_middleware(make_request, web3):
     """
-    Converts any result which is a dictionary into an a
+    Converts any result which is a dictionary into an AttributeDict
     """
     def middleware(method, params):
-        response = make_request(method, params)
-
-        if 'result' in response:
-            result = response['result']
-            if is_dict(result) and not isinstance(result, AttributeDict):
-                return assoc(response, 'result', AttributeDict.recursive(result))
-            else:
-                return response
-        else:
-            return response
+        return _convert_result(web3, make_request(method, params))
+    return middleware
+
+
+def async_attrdict_middleware(make_request, web3):
+    """
+    Converts any result which is a dictionary into an AttributeDict
+    """
+    async def middleware(method, params):
+        return _convert_result(web3, await make_request(method, params))
     return middleware
@@ -7,6 +7,13 @@ import lru
 from web3._utils.caching import (
     generate_cache_key,
 )
+from web3._utils.metrics import (
+    record_cache_lookup,
+)
+from web3._utils.persistent_cache import (
+    DEFAULT_PERSISTENT_CACHE_SIZE,
+    PersistentResponseCache,
+)
 
 SIMPLE_CACHE_RPC_WHITELIST = {
     'web3_clientVersion',
@@ -96,10 +103,12 @@ def construct_simple_cache_middleware(
                 if lock_acquired and method in rpc_whitelist:
                     cache_key = generate_cache_key((method, params))
                     if cache_key not in cache:
+                        record_cache_lookup(web3, 'simple_cache', method, hit=False)
                         response = make_request(method, params)
                         if should_cache_fn(method, params, response):
                             cache[cache_key] = response
                         return response
+                    record_cache_lookup(web3, 'simple_cache', method, hit=True)
                     return cache[cache_key]
                 else:
                     return make_request(method, params)
@@ -107,6 +116,7 @@ def construct_simple_cache_middleware(
                 if lock_acquired:
                     lock.release()
         return middleware
+    simple_cache_middleware.handles_methods = rpc_whitelist
     return simple_cache_middleware
 
 
@@ -200,11 +210,13 @@ def construct_time_based_cache_middleware(
                         cached_for = time.time() - cached_at
 
                         if cached_for <= cache_expire_seconds:
+                            record_cache_lookup(web3, 'time_based_cache', method, hit=True)
                             return cached_response
                         else:
                             del cache[cache_key]
 
                     # cache either missed or expired so make the request.
+                    record_cache_lookup(web3, 'time_based_cache', method, hit=False)
                     response = make_request(method, params)
 
                     if should_cache_fn(method, params, response):
@@ -217,6 +229,7 @@ def construct_time_based_cache_middleware(
                 if lock_acquired:
                     lock.release()
         return middleware
+    time_based_cache_middleware.handles_methods = rpc_whitelist
     return time_based_cache_middleware
 
 
@@ -380,8 +393,10 @@ def construct_latest_block_based_cache_middleware(
                     latest_block_hash = block_info['latest_block']['hash']
                     cache_key = generate_cache_key((latest_block_hash, method, params))
                     if cache_key in cache:
+                        record_cache_lookup(web3, 'latest_block_based_cache', method, hit=True)
                         return cache[cache_key]
 
+                    record_cache_lookup(web3, 'latest_block_based_cache', method, hit=False)
                     response = make_request(method, params)
                     if should_cache_fn(method, params, response):
                         cache[cache_key] = response
@@ -399,3 +414,162 @@ _latest_block_based_cache_middleware = construct_latest_block_based_cache_middle
     cache_class=functools.partial(lru.LRU, 256),
     rpc_whitelist=BLOCK_NUMBER_RPC_WHITELIST,
 )
+
+
+PERSISTENT_CACHE_RPC_WHITELIST = {
+    'vns_getBlockByHash',
+    'vns_getBlockTransactionCountByHash',
+    'vns_getUncleCountByBlockHash',
+    'vns_getUncleByBlockHashAndIndex',
+    'vns_getTransactionByBlockHashAndIndex',
+    'vns_getTransactionByHash',
+    'vns_getTransactionReceipt',
+    'vns_getLogs',
+}
+
+# the results of these methods belong to the block named by their first param
+BLOCK_HASH_RPC_METHODS = {
+    'vns_getBlockByHash',
+    'vns_getBlockTransactionCountByHash',
+    'vns_getUncleCountByBlockHash',
+    'vns_getUncleByBlockHashAndIndex',
+    'vns_getTransactionByBlockHashAndIndex',
+}
+
+# the results of these methods name the block of a transaction, which a reorg
+# can change
+TRANSACTION_HASH_RPC_METHODS = {
+    'vns_getTransactionByHash',
+    'vns_getTransactionReceipt',
+}
+
+# how far below the head the block of a transaction must be before the
+# transaction and its receipt are cached
+DEFAULT_PERSISTENT_CACHE_CONFIRMATIONS = 12
+
+
+def _to_block_number(value):
+    if isinstance(value, str):
+        return int(value, 16)
+    else:
+        return value
+
+
+def _get_cacheable_block(method, params, response):
+    """
+    Returns ``(cacheable, block_hash, block_number)`` for the response to a
+    request.  Only transactions and receipts are stored with the number of
+    their block, since a reorg can move them to another block under the same
+    key.  Logs are only cacheable when requested by ``blockHash``.
+    """
+    if method in BLOCK_HASH_RPC_METHODS:
+        return True, params[0], None
+    elif method == 'vns_getLogs':
+        log_filter = params[0] if params else None
+        if isinstance(log_filter, dict) and log_filter.get('blockHash') is not None:
+            return True, log_filter['blockHash'], None
+    elif method in TRANSACTION_HASH_RPC_METHODS:
+        result = response['result']
+        if isinstance(result, dict) and result.get('blockHash') is not None:
+            return True, result['blockHash'], _to_block_number(result['blockNumber'])
+    return False, None, None
+
+
+def construct_persistent_cache_middleware(
+        path,
+        max_entries=DEFAULT_PERSISTENT_CACHE_SIZE,
+        rpc_whitelist=PERSISTENT_CACHE_RPC_WHITELIST,
+        should_cache_fn=_should_cache,
+        confirmations=DEFAULT_PERSISTENT_CACHE_CONFIRMATIONS):
+    """
+    Constructs a middleware which caches responses which cannot change once
+    the request names their block or transaction by hash, in an SQLite
+    database at ``path`` which outlives the process.
+
+    A reorg can move a transaction to another block without changing its
+    hash, so transactions and receipts are only cached once their block is
+    ``confirmations`` blocks below the head, which is requested with
+    ``vns_blockNumber`` unless a higher block has already been seen.  Cached
+    transactions and receipts are correct unless the chain reorganizes
+    deeper than that, and even then are dropped as soon as a
+    ``vns_getBlockByNumber`` response passing through the middleware shows
+    another block at their height.
+
+    The responses are stored as the provider returns them, so the middleware
+    belongs in the innermost layer of the onion.  The
+    :class:`~web3._utils.persistent_cache.PersistentResponseCache` is
+    available as the ``cache`` attribute of the middleware.
+
+    :param path: The path of the SQLite database, which is created if missing.
+    :param max_entries: The number of responses kept before the oldest are evicted.
+    :param rpc_whitelist: A set of RPC methods which may have their responses cached.
+    :param should_cache_fn: A callable which accepts ``method`` ``params`` and
+        ``response`` and returns a boolean as to whether the response should be
+        cached.
+    :param confirmations: How many blocks the block of a transaction must be
+        below the head before the transaction and its receipt are cached.
+    """
+    # opened once, rather than whenever the middleware onion is rebuilt
+    cache = PersistentResponseCache(path, max_entries)
+    # the highest block number seen, so that the head is only requested for
+    # transactions which may not have enough confirmations yet
+    head = {'block_number': -1}
+    head_lock = threading.Lock()
+
+    def update_head(block_number):
+        with head_lock:
+            head['block_number'] = max(head['block_number'], block_number)
+
+    def persistent_cache_middleware(make_request, web3):
+        def is_confirmed(block_number):
+            if block_number + confirmations <= head['block_number']:
+                return True
+            response = make_request('vns_blockNumber', [])
+            if response.get('result') is None:
+                return False
+            update_head(_to_block_number(response['result']))
+            return block_number + confirmations <= head['block_number']
+
+        def middleware(method, params):
+            if method == 'vns_blockNumber':
+                response = make_request(method, params)
+                if response.get('result') is not None:
+                    update_head(_to_block_number(response['result']))
+                return response
+            elif method == 'vns_getBlockByNumber':
+                response = make_request(method, params)
+                block = response.get('result')
+                if isinstance(block, dict) and block.get('hash') is not None:
+                    block_number = _to_block_number(block['number'])
+                    update_head(block_number)
+                    cache.remove_forked(block_number, block['hash'])
+                return response
+            elif method not in rpc_whitelist:
+                return make_request(method, params)
+
+            cache_key = generate_cache_key((method, params))
+            cached_response = cache.get(cache_key)
+            if cached_response is not None:
+                record_cache_lookup(web3, 'persistent_cache', method, hit=True)
+                return cached_response
+
+            record_cache_lookup(web3, 'persistent_cache', method, hit=False)
+            response = make_request(method, params)
+            if should_cache_fn(method, params, response):
+                cacheable, block_hash, block_number = _get_cacheable_block(
+                    method,
+                    params,
+                    response,
+                )
+                if block_number is not None and not is_confirmed(block_number):
+                    cacheable = False
+                if cacheable:
+                    cache.set(cache_key, response, block_hash, block_number)
+            return response
+        return middleware
+    persistent_cache_middleware.handles_methods = frozenset(rpc_whitelist) | {
+        'vns_blockNumber',
+        'vns_getBlockByNumber',
+    }
+    persistent_cache_middleware.cache = cache
+    return persistent_cache_middleware
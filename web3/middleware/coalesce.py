@@ -0,0 +1,106 @@
+import threading
+
+from web3._utils.batching import (
+    waiting_outside_batch,
+)
+from web3._utils.caching import (
+    generate_cache_key,
+)
+
+COALESCING_RPC_WHITELIST = {
+    'web3_clientVersion',
+    'net_version',
+    'net_peerCount',
+    'vns_protocolVersion',
+    'vns_chainId',
+    'vns_syncing',
+    'vns_coinbase',
+    'vns_mining',
+    'vns_hashrate',
+    'vns_gasPrice',
+    'vns_accounts',
+    'vns_blockNumber',
+    'vns_getBalance',
+    'vns_getStorageAt',
+    'vns_getTransactionCount',
+    'vns_getBlockTransactionCountByHash',
+    'vns_getBlockTransactionCountByNumber',
+    'vns_getUncleCountByBlockHash',
+    'vns_getUncleCountByBlockNumber',
+    'vns_getCode',
+    'vns_call',
+    'vns_estimateGas',
+    'vns_getBlockByHash',
+    'vns_getBlockByNumber',
+    'vns_getTransactionByHash',
+    'vns_getTransactionByBlockHashAndIndex',
+    'vns_getTransactionByBlockNumberAndIndex',
+    'vns_getTransactionReceipt',
+    'vns_getUncleByBlockHashAndIndex',
+    'vns_getUncleByBlockNumberAndIndex',
+    'vns_getLogs',
+}
+
+
+class InFlightRequest:
+    __slots__ = ('done', 'response', 'exception')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.exception = None
+
+
+def construct_request_coalescing_middleware(rpc_whitelist=COALESCING_RPC_WHITELIST):
+    """
+    Constructs a middleware which sends identical requests made at the same
+    time only once.  While a request is in flight, any other request with the
+    same ``method`` and ``params`` waits for it and gets the same response, or
+    the same exception.  Unlike the cache middlewares, nothing is kept once the
+    request completes.
+
+    :param rpc_whitelist: A set of RPC methods which may be coalesced.  These
+        should not have side effects.
+    """
+    def request_coalescing_middleware(make_request, web3):
+        in_flight = {}
+        lock = threading.Lock()
+
+        def middleware(method, params):
+            if method not in rpc_whitelist:
+                return make_request(method, params)
+
+            try:
+                key = generate_cache_key((method, params))
+            except TypeError:
+                return make_request(method, params)
+
+            with lock:
+                request = in_flight.get(key)
+                is_leader = request is None
+                if is_leader:
+                    request = in_flight[key] = InFlightRequest()
+
+            if not is_leader:
+                with waiting_outside_batch(web3.provider):
+                    request.done.wait()
+                if request.exception is not None:
+                    raise request.exception
+                return request.response
+
+            try:
+                request.response = make_request(method, params)
+                return request.response
+            except Exception as exc:
+                request.exception = exc
+                raise
+            finally:
+                with lock:
+                    del in_flight[key]
+                request.done.set()
+        return middleware
+    request_coalescing_middleware.handles_methods = rpc_whitelist
+    return request_coalescing_middleware
+
+
+request_coalescing_middleware = construct_request_coalescing_middleware()
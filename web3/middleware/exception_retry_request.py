@@ -1,3 +1,9 @@
+import asyncio
+import email.utils
+import random
+import threading
+import time
+
 from requests.exceptions import (
     ConnectionError,
     HTTPError,
@@ -5,6 +11,10 @@ from requests.exceptions import (
     TooManyRedirects,
 )
 
+from web3.exceptions import (
+    CircuitBreakerOpen,
+)
+
 whitelist = [
     'admin',
     'shh',
@@ -68,29 +78,299 @@ def check_if_retry_on_failure(method):
         return False
 
 
-def exception_retry_middleware(make_request, web3, errors, retries=5):
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive failures, failing requests
+    fast for ``reset_timeout`` seconds.  After that a single trial request is
+    let through, which closes the breaker if it succeeds and opens it again if
+    it fails.
+    """
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_progress = False
+
+    def allow_request(self):
+        if self.opened_at is None:
+            return True
+        elif self._trial_in_progress:
+            return False
+        elif time.monotonic() - self.opened_at >= self.reset_timeout:
+            self._trial_in_progress = True
+            return True
+        else:
+            return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_progress = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._trial_in_progress or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._trial_in_progress = False
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    * ``retries`` is the most attempts made for a single request
+    * retries wait an exponentially growing delay, starting at ``backoff`` and
+      capped at ``max_backoff`` seconds, with full jitter
+    * a ``Retry-After`` header of a 429 or 503 response is honoured, up to
+      ``max_backoff`` seconds
+    * the retry budget allows ``budget_ratio`` retries per request on top of a
+      reserve of ``budget_min_retries``, so that retries stop when most
+      requests are failing
+    * each endpoint has a :class:`CircuitBreaker`, which opens after
+      ``failure_threshold`` consecutive failures for ``reset_timeout`` seconds
+
+    A policy may be shared by several providers; its budget is shared, while
+    each endpoint uri gets its own circuit breaker.
+    """
+    def __init__(self,
+                 retries=5,
+                 backoff=0.1,
+                 max_backoff=10,
+                 jitter=True,
+                 budget_ratio=0.2,
+                 budget_min_retries=10,
+                 failure_threshold=10,
+                 reset_timeout=30):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._budget = float(budget_min_retries)
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self._budget = min(
+                self._budget + self.budget_ratio,
+                max(self.budget_min_retries, 1),
+            )
+
+    def check_circuit(self, endpoint):
+        with self._lock:
+            breaker = self._get_breaker(endpoint)
+            if not breaker.allow_request():
+                raise CircuitBreakerOpen(
+                    "Not sending request to {0}, which failed the last {1} "
+                    "requests".format(endpoint, breaker.failures)
+                )
+
+    def record_success(self, endpoint):
+        with self._lock:
+            self._get_breaker(endpoint).record_success()
+
+    def record_failure(self, endpoint):
+        with self._lock:
+            self._get_breaker(endpoint).record_failure()
+
+    def get_retry_delay(self, attempt, exception):
+        """
+        Returns the seconds to wait before retrying after ``attempt`` (counting
+        from 1) failed with ``exception``, or ``None`` to not retry.
+        """
+        if attempt >= self.retries:
+            return None
+        with self._lock:
+            if self._budget < 1:
+                return None
+            self._budget -= 1
+
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        retry_after = get_retry_after(exception)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def _get_breaker(self, endpoint):
+        # must be called with self._lock held
+        if endpoint not in self._breakers:
+            self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self._breakers[endpoint]
+
+
+RETRY_AFTER_STATUS_CODES = {429, 503}
+
+
+def get_retry_after(exception):
+    """
+    Returns the seconds a 429 or 503 response asked to wait for with its
+    ``Retry-After`` header, or ``None``.
+    """
+    response = getattr(exception, 'response', None)
+    if response is not None:
+        # requests.HTTPError
+        status, headers = response.status_code, response.headers
+    else:
+        # aiohttp.ClientResponseError
+        status, headers = getattr(exception, 'status', None), getattr(exception, 'headers', None)
+
+    if status not in RETRY_AFTER_STATUS_CODES or not headers:
+        return None
+    retry_after = headers.get('Retry-After')
+    if retry_after is None:
+        return None
+    elif retry_after.strip().isdigit():
+        return int(retry_after)
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+def get_endpoint(web3):
+    return getattr(web3.provider, 'endpoint_uri', None)
+
+
+def exception_retry_middleware(make_request, web3, errors, retries=5, policy=None):
     """
     Creates middleware that retries failed HTTP requests. Is a default
     middleware for HTTPProvider.
+
+    Without a ``policy``, failed requests are retried immediately, up to
+    ``retries`` attempts.  A :class:`RetryPolicy` adds backoff, the retry
+    budget and the circuit breaker.
     """
+    if policy is None:
+        def immediate_retry_middleware(method, params):
+            if check_if_retry_on_failure(method):
+                for i in range(retries):
+                    try:
+                        return make_request(method, params)
+                    except errors:
+                        if i < retries - 1:
+                            continue
+                        else:
+                            raise
+            else:
+                return make_request(method, params)
+        return immediate_retry_middleware
+
     def middleware(method, params):
-        if check_if_retry_on_failure(method):
-            for i in range(retries):
-                try:
-                    return make_request(method, params)
-                except errors:
-                    if i < retries - 1:
-                        continue
-                    else:
-                        raise
-        else:
-            return make_request(method, params)
+        endpoint = get_endpoint(web3)
+        policy.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            policy.check_circuit(endpoint)
+            try:
+                response = make_request(method, params)
+            except errors as exc:
+                policy.record_failure(endpoint)
+                if not check_if_retry_on_failure(method):
+                    raise
+                delay = policy.get_retry_delay(attempt, exc)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            except Exception:
+                # the endpoint answered, even if not with a usable response
+                policy.record_success(endpoint)
+                raise
+            else:
+                policy.record_success(endpoint)
+                return response
     return middleware
 
 
+def construct_http_retry_request_middleware(policy):
+    """
+    Creates an ``http_retry_request`` middleware which retries with
+    ``policy``, a :class:`RetryPolicy`.
+    """
+    def http_retry_request_middleware(make_request, web3):
+        return exception_retry_middleware(
+            make_request,
+            web3,
+            (ConnectionError, HTTPError, Timeout, TooManyRedirects),
+            policy=policy,
+        )
+    return http_retry_request_middleware
+
+
 def http_retry_request_middleware(make_request, web3):
     return exception_retry_middleware(
         make_request,
         web3,
         (ConnectionError, HTTPError, Timeout, TooManyRedirects)
     )
+
+
+def async_exception_retry_middleware(make_request, web3, errors, retries=5, policy=None):
+    """
+    Creates middleware that retries failed HTTP requests. Is a default
+    middleware for AsyncHTTPProvider.
+
+    Without a ``policy``, failed requests are retried immediately, up to
+    ``retries`` attempts.
+    """
+    if policy is None:
+        async def immediate_retry_middleware(method, params):
+            if check_if_retry_on_failure(method):
+                for i in range(retries):
+                    try:
+                        return await make_request(method, params)
+                    except errors:
+                        if i < retries - 1:
+                            continue
+                        else:
+                            raise
+            else:
+                return await make_request(method, params)
+        return immediate_retry_middleware
+
+    async def middleware(method, params):
+        endpoint = get_endpoint(web3)
+        policy.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            policy.check_circuit(endpoint)
+            try:
+                response = await make_request(method, params)
+            except errors as exc:
+                policy.record_failure(endpoint)
+                if not check_if_retry_on_failure(method):
+                    raise
+                delay = policy.get_retry_delay(attempt, exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except Exception:
+                policy.record_success(endpoint)
+                raise
+            else:
+                policy.record_success(endpoint)
+                return response
+    return middleware
+
+
+def async_http_retry_request_middleware(make_request, web3):
+    import aiohttp
+
+    return async_exception_retry_middleware(
+        make_request,
+        web3,
+        (aiohttp.ClientError, asyncio.TimeoutError)
+    )
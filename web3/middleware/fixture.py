@@ -11,6 +11,7 @@ def construct_fixture_middleware(fixtures):
             else:
                 return make_request(method, params)
         return middleware
+    fixture_middleware.handles_methods = fixtures
     return fixture_middleware
 
 
@@ -29,6 +30,7 @@ def construct_result_generator_middleware(result_generators):
             else:
                 return make_request(method, params)
         return middleware
+    result_generator_middleware.handles_methods = result_generators
     return result_generator_middleware
 
 
@@ -47,4 +49,5 @@ def construct_error_generator_middleware(error_generators):
             else:
                 return make_request(method, params)
         return middleware
+    error_generator_middleware.handles_methods = error_generators
     return error_generator_middleware
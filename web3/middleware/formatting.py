@@ -16,39 +16,77 @@ def construct_formatting_middleware(
             error_formatters=error_formatters or {},
         )
 
-    return construct_web3_formatting_middleware(ignore_web3_in_standard_formatters)
+    formatter_middleware = construct_web3_formatting_middleware(ignore_web3_in_standard_formatters)
+    formatter_middleware.handles_methods = _get_formatted_methods(
+        request_formatters,
+        result_formatters,
+        error_formatters,
+    )
+    return formatter_middleware
 
 
 def construct_web3_formatting_middleware(web3_formatters_builder):
     def formatter_middleware(make_request, w3):
-        formatters = merge(
-            {
-                'request_formatters': {},
-                'result_formatters': {},
-                'error_formatters': {},
-            },
-            web3_formatters_builder(w3),
-        )
+        formatters = _build_formatters(w3, web3_formatters_builder)
         return apply_formatters(make_request=make_request, **formatters)
 
     return formatter_middleware
 
 
-@curry
-def apply_formatters(
-        method,
-        params,
-        make_request,
+def async_construct_formatting_middleware(
+        request_formatters=None,
+        result_formatters=None,
+        error_formatters=None):
+    def ignore_web3_in_standard_formatters(w3):
+        return dict(
+            request_formatters=request_formatters or {},
+            result_formatters=result_formatters or {},
+            error_formatters=error_formatters or {},
+        )
+
+    formatter_middleware = async_construct_web3_formatting_middleware(
+        ignore_web3_in_standard_formatters,
+    )
+    formatter_middleware.handles_methods = _get_formatted_methods(
         request_formatters,
         result_formatters,
-        error_formatters):
+        error_formatters,
+    )
+    return formatter_middleware
+
+
+def async_construct_web3_formatting_middleware(web3_formatters_builder):
+    def formatter_middleware(make_request, w3):
+        formatters = _build_formatters(w3, web3_formatters_builder)
+        return async_apply_formatters(make_request=make_request, **formatters)
+
+    return formatter_middleware
+
+
+def _get_formatted_methods(*formatter_maps):
+    return frozenset().union(*(formatters or {} for formatters in formatter_maps))
+
+
+def _build_formatters(w3, web3_formatters_builder):
+    return merge(
+        {
+            'request_formatters': {},
+            'result_formatters': {},
+            'error_formatters': {},
+        },
+        web3_formatters_builder(w3),
+    )
+
+
+def _format_params(method, params, request_formatters):
     if method in request_formatters:
         formatter = request_formatters[method]
-        formatted_params = formatter(params)
-        response = make_request(method, formatted_params)
+        return formatter(params)
     else:
-        response = make_request(method, params)
+        return params
+
 
+def _format_response(method, response, result_formatters, error_formatters):
     if 'result' in response and method in result_formatters:
         formatter = result_formatters[method]
         formatted_response = assoc(
@@ -67,3 +105,27 @@ def apply_formatters(
         return formatted_response
     else:
         return response
+
+
+@curry
+def apply_formatters(
+        method,
+        params,
+        make_request,
+        request_formatters,
+        result_formatters,
+        error_formatters):
+    response = make_request(method, _format_params(method, params, request_formatters))
+    return _format_response(method, response, result_formatters, error_formatters)
+
+
+@curry
+async def async_apply_formatters(
+        method,
+        params,
+        make_request,
+        request_formatters,
+        result_formatters,
+        error_formatters):
+    response = await make_request(method, _format_params(method, params, request_formatters))
+    return _format_response(method, response, result_formatters, error_formatters)
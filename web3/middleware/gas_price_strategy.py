@@ -17,3 +17,6 @@ def gas_price_strategy_middleware(make_request, web3):
                     return make_request(method, [transaction])
         return make_request(method, params)
     return middleware
+
+
+gas_price_strategy_middleware.handles_methods = {'vns_sendTransaction'}
@@ -1,3 +1,6 @@
+from web3._utils.ens import (
+    may_contain_ens_name,
+)
 from web3._utils.normalizers import (
     abi_ens_resolver,
 )
@@ -15,6 +18,20 @@ def name_to_address_middleware(w3):
     normalizers = [
         abi_ens_resolver(w3),
     ]
-    return construct_formatting_middleware(
+    formatting_middleware = construct_formatting_middleware(
         request_formatters=abi_request_formatters(normalizers, RPC_ABIS)
     )
+
+    def middleware(make_request, web3):
+        resolve_names_and_make_request = formatting_middleware(make_request, web3)
+
+        def middleware_fn(method, params):
+            # walking the params with their ABI types is only worth it when
+            # there is a string which could be a name to resolve
+            if may_contain_ens_name(params):
+                return resolve_names_and_make_request(method, params)
+            else:
+                return make_request(method, params)
+        return middleware_fn
+    middleware.handles_methods = formatting_middleware.handles_methods
+    return middleware
@@ -25,3 +25,26 @@ def normalize_errors_middleware(make_request, web3):
         else:
             return result
     return middleware
+
+
+def async_normalize_errors_middleware(make_request, web3):
+    async def middleware(method, params):
+        result = await make_request(method, params)
+
+        # See normalize_errors_middleware. The client version is requested
+        # through the inner layers, since web3's modules are not awaitable.
+
+        if method == 'vns_getTransactionReceipt' and 'error' in result:
+            client_version = await make_request('web3_clientVersion', [])
+            is_geth = client_version.get('result', '').startswith('Geth')
+            if is_geth and result['error']['code'] == -32000:
+                return assoc(
+                    dissoc(result, 'error'),
+                    'result',
+                    None,
+                )
+            else:
+                return result
+        else:
+            return result
+    return middleware
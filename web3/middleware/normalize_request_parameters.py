@@ -9,6 +9,7 @@ from web3._utils.formatters import (
 )
 
 from .formatting import (
+    async_construct_formatting_middleware,
     construct_formatting_middleware,
 )
 
@@ -23,3 +24,7 @@ METHOD_NORMALIZERS = {
 request_parameter_normalizer = construct_formatting_middleware(
     request_formatters=METHOD_NORMALIZERS,
 )
+
+async_request_parameter_normalizer = async_construct_formatting_middleware(
+    request_formatters=METHOD_NORMALIZERS,
+)
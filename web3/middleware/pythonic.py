@@ -1,4 +1,8 @@
 import codecs
+from collections.abc import (
+    Mapping,
+)
+import functools
 import operator
 
 from vns_utils.curried import (
@@ -45,9 +49,26 @@ from web3._utils.toolz.curried import (
     keymap,
     valmap,
 )
+from web3.datastructures import (
+    AttributeDict,
+    BlockRecord,
+    LazyAttributeDict,
+    LogRecord,
+    ReceiptRecord,
+    TransactionRecord,
+)
+from web3.exceptions import (
+    FieldFormattingError,
+)
 
+from .attrdict import (
+    async_attrdict_middleware,
+    attrdict_middleware,
+    get_result_format,
+)
 from .formatting import (
-    construct_formatting_middleware,
+    apply_formatters,
+    async_apply_formatters,
 )
 
 
@@ -241,11 +262,256 @@ FILTER_PARAMS_FORMATTERS = {
 filter_params_formatter = apply_formatters_to_dict(FILTER_PARAMS_FORMATTERS)
 
 
+subscribe_params_formatter = apply_formatter_if(
+    is_length(2),
+    apply_formatter_at_index(filter_params_formatter, 1),
+)
+
+
 filter_result_formatter = apply_one_of_formatters((
     (apply_formatter_to_array(log_entry_formatter), is_array_of_dicts),
     (apply_formatter_to_array(to_hexbytes(32)), is_array_of_strings),
 ))
 
+
+#
+# Fused formatters
+#
+# These produce the same results as the formatters above, and for the
+# ``attrdict`` variants, as ``AttributeDict.recursive`` applied to those
+# results.  Each builds its result in a single pass over the raw response,
+# rather than through layers of curried formatters and a second traversal.
+#
+def fused_hexbytes_formatter(num_bytes, variable_length=False, nullable=False):
+    max_length = 2 + 2 * num_bytes
+
+    def formatter(value):
+        if isinstance(value, str) and value[:2] == '0x':
+            length = len(value)
+            if length == max_length or (variable_length and length < max_length):
+                return HexBytes(value)
+        elif value is None and nullable:
+            return None
+        return to_hexbytes(num_bytes, value, variable_length=variable_length)
+    return formatter
+
+
+def fused_integer_formatter(value):
+    if isinstance(value, (str, bytes, bytearray)):
+        return int(value, 16)
+    else:
+        return value
+
+
+@functools.lru_cache(maxsize=4096)
+def fused_checksum_address_formatter(value):
+    return to_checksum_address(value)
+
+
+def fused_nullable_checksum_address_formatter(value):
+    if value is None:
+        return None
+    else:
+        return fused_checksum_address_formatter(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def fused_checksum_address_if_address_formatter(value):
+    if is_address(value):
+        return to_checksum_address(value)
+    else:
+        return value
+
+
+fused_hash_formatter = fused_hexbytes_formatter(32)
+fused_nullable_hash_formatter = fused_hexbytes_formatter(32, nullable=True)
+fused_logs_bloom_formatter = fused_hexbytes_formatter(256)
+
+
+def construct_fused_formatter(field_formatters, attrdict=False, lazy=False, record_class=None):
+    """
+    Returns a formatter which applies ``field_formatters`` to the fields of a
+    dict in a single pass.  With ``attrdict``, the result is an
+    ``AttributeDict``, with any other dicts in it converted too.  With
+    ``lazy``, the result is a ``LazyAttributeDict`` which formats each field
+    when it is first read.  With ``record_class``, the result is an instance
+    of that ``Record`` class, with any other dicts in it converted to
+    ``AttributeDict``.
+    """
+    if record_class is not None:
+        attrdict = True
+
+    def lazy_formatter(value):
+        if value is None:
+            return None
+        else:
+            return LazyAttributeDict(value, field_formatters)
+
+    def fused_formatter(value):
+        if value is None:
+            return None
+
+        formatted = {}
+        for key, item in value.items():
+            formatter = field_formatters.get(key)
+            if formatter is not None:
+                try:
+                    formatted[key] = formatter(item)
+                except FieldFormattingError as exc:
+                    # raised by a nested value, whose path gets the key
+                    exc.prepend(key)
+                    raise
+                except (TypeError, ValueError) as exc:
+                    raise FieldFormattingError(key) from exc
+            elif attrdict and isinstance(item, (Mapping, list)):
+                formatted[key] = AttributeDict.recursive(item)
+            else:
+                formatted[key] = item
+
+        if record_class is not None:
+            return record_class(formatted)
+        elif attrdict:
+            return AttributeDict(formatted)
+        else:
+            return formatted
+
+    if lazy:
+        return lazy_formatter
+    else:
+        return fused_formatter
+
+
+def format_fused_array(item_formatter, value):
+    formatted = []
+    append = formatted.append
+    try:
+        for item in value:
+            append(item_formatter(item))
+    except FieldFormattingError as exc:
+        # the item which failed is the one after those already formatted
+        exc.prepend('[%d]' % len(formatted))
+        raise
+    except (TypeError, ValueError) as exc:
+        raise FieldFormattingError('[%d]' % len(formatted)) from exc
+    return formatted
+
+
+def construct_fused_array_formatter(item_formatter):
+    def fused_array_formatter(value):
+        return format_fused_array(item_formatter, value)
+    return fused_array_formatter
+
+
+def construct_fused_transactions_formatter(transaction_formatter):
+    def fused_transactions_formatter(value):
+        if is_array_of_dicts(value):
+            return format_fused_array(transaction_formatter, value)
+        elif is_array_of_strings(value):
+            return format_fused_array(fused_hash_formatter, value)
+        else:
+            raise ValueError("The provided value did not satisfy any of the formatter conditions")
+    return fused_transactions_formatter
+
+
+def build_fused_formatters(attrdict=False, lazy=False, records=False):
+    """
+    Returns a dict of the fused ``transaction``, ``log_entry``, ``receipt``,
+    ``block`` and ``filter_result`` formatters.  Apart from ``filter_result``,
+    they return ``None`` for a ``None`` value.  With ``records``, they return
+    the ``Record`` class of each result.
+    """
+    def record_class(cls):
+        return cls if records else None
+
+    transaction = construct_fused_formatter({
+        'blockHash': fused_nullable_hash_formatter,
+        'blockNumber': fused_integer_formatter,
+        'transactionIndex': fused_integer_formatter,
+        'nonce': fused_integer_formatter,
+        'gas': fused_integer_formatter,
+        'gasPrice': fused_integer_formatter,
+        'value': fused_integer_formatter,
+        'from': fused_checksum_address_formatter,
+        'publicKey': fused_hexbytes_formatter(64, nullable=True),
+        'r': fused_hexbytes_formatter(32, variable_length=True),
+        'raw': HexBytes,
+        's': fused_hexbytes_formatter(32, variable_length=True),
+        'to': fused_checksum_address_if_address_formatter,
+        'hash': fused_hash_formatter,
+        'v': fused_integer_formatter,
+        'standardV': fused_integer_formatter,
+    }, attrdict, lazy, record_class(TransactionRecord))
+
+    log_entry = construct_fused_formatter({
+        'blockHash': fused_nullable_hash_formatter,
+        'blockNumber': fused_integer_formatter,
+        'transactionIndex': fused_integer_formatter,
+        'transactionHash': fused_nullable_hash_formatter,
+        'logIndex': fused_integer_formatter,
+        'address': fused_checksum_address_formatter,
+        'topics': construct_fused_array_formatter(fused_hash_formatter),
+        'data': to_ascii_if_bytes,
+    }, attrdict, lazy, record_class(LogRecord))
+
+    receipt = construct_fused_formatter({
+        'blockHash': fused_nullable_hash_formatter,
+        'blockNumber': fused_integer_formatter,
+        'transactionIndex': fused_integer_formatter,
+        'transactionHash': fused_hash_formatter,
+        'cumulativeGasUsed': fused_integer_formatter,
+        'status': fused_integer_formatter,
+        'gasUsed': fused_integer_formatter,
+        'contractAddress': fused_nullable_checksum_address_formatter,
+        'logs': construct_fused_array_formatter(log_entry),
+        'logsBloom': fused_logs_bloom_formatter,
+    }, attrdict, lazy, record_class(ReceiptRecord))
+
+    block = construct_fused_formatter({
+        'extraData': fused_hexbytes_formatter(32, variable_length=True),
+        'gasLimit': fused_integer_formatter,
+        'gasUsed': fused_integer_formatter,
+        'size': fused_integer_formatter,
+        'timestamp': fused_integer_formatter,
+        'hash': fused_nullable_hash_formatter,
+        'logsBloom': fused_logs_bloom_formatter,
+        'miner': fused_nullable_checksum_address_formatter,
+        'mixHash': fused_hash_formatter,
+        'nonce': fused_hexbytes_formatter(8, variable_length=True, nullable=True),
+        'number': fused_integer_formatter,
+        'parentHash': fused_nullable_hash_formatter,
+        'sha3Uncles': fused_nullable_hash_formatter,
+        'uncles': construct_fused_array_formatter(fused_hash_formatter),
+        'difficulty': fused_integer_formatter,
+        'receiptsRoot': fused_hash_formatter,
+        'stateRoot': fused_hash_formatter,
+        'totalDifficulty': fused_integer_formatter,
+        'transactions': construct_fused_transactions_formatter(transaction),
+        'transactionsRoot': fused_hash_formatter,
+    }, attrdict, lazy, record_class(BlockRecord))
+
+    def filter_result(value):
+        if is_array_of_dicts(value):
+            return [log_entry(entry) for entry in value]
+        elif is_array_of_strings(value):
+            return [fused_hash_formatter(entry) for entry in value]
+        else:
+            raise ValueError("The provided value did not satisfy any of the formatter conditions")
+
+    return {
+        'transaction': transaction,
+        'log_entry': log_entry,
+        'receipt': receipt,
+        'block': block,
+        'filter_result': filter_result,
+    }
+
+
+FUSED_FORMATTERS = build_fused_formatters()
+FUSED_ATTRDICT_FORMATTERS = build_fused_formatters(attrdict=True)
+FUSED_LAZY_FORMATTERS = build_fused_formatters(lazy=True)
+FUSED_RECORD_FORMATTERS = build_fused_formatters(records=True)
+
+
 TRANSACTION_PARAM_FORMATTERS = {
     'chainId': apply_formatter_if(is_integer, str),
 }
@@ -263,110 +529,244 @@ estimate_gas_with_block_id = combine_argument_formatters(
 )
 
 
-pythonic_middleware = construct_formatting_middleware(
-    request_formatters={
-        # Bbbbbbbb        'vns_getBalance': apply_formatter_at_index(block_number_formatter, 1),
-        'vns_getBlockByNumber': apply_formatter_at_index(block_number_formatter, 0),
-        'vns_getBlockTransactionCountByNumber': apply_formatter_at_index(
-            block_number_formatter,
-            0,
-        ),
-        'vns_getCode': apply_formatter_at_index(block_number_formatter, 1),
-        'vns_getStorageAt': apply_formatter_at_index(block_number_formatter, 2),
-        'vns_getTransactionByBlockNumberAndIndex': compose(
-            apply_formatter_at_index(block_number_formatter, 0),
-            apply_formatter_at_index(integer_to_hex, 1),
-        ),
-        'vns_getTransactionCount': apply_formatter_at_index(block_number_formatter, 1),
-        'vns_getUncleCountByBlockNumber': apply_formatter_at_index(block_number_formatter, 0),
-        'vns_getUncleByBlockNumberAndIndex': compose(
-            apply_formatter_at_index(block_number_formatter, 0),
-            apply_formatter_at_index(integer_to_hex, 1),
-        ),
-        'vns_getUncleByBlockHashAndIndex': apply_formatter_at_index(integer_to_hex, 1),
-        'vns_newFilter': apply_formatter_at_index(filter_params_formatter, 0),
-        'vns_getLogs': apply_formatter_at_index(filter_params_formatter, 0),
-        'vns_call': combine_argument_formatters(
-            transaction_param_formatter,
-            block_number_formatter,
-        ),
-        'vns_estimateGas': apply_one_of_formatters((
-            (estimate_gas_without_block_id, is_length(1)),
-            (estimate_gas_with_block_id, is_length(2)),
-        )),
-        'vns_sendTransaction': apply_formatter_at_index(transaction_param_formatter, 0),
-        # personal
-        'personal_importRawKey': apply_formatter_at_index(
-            compose(remove_0x_prefix, hexstr_if_str(to_hex)),
-            0,
-        ),
-        'personal_sign': apply_formatter_at_index(text_if_str(to_hex), 0),
-        'personal_ecRecover': apply_formatter_at_index(text_if_str(to_hex), 0),
-        'personal_sendTransaction': apply_formatter_at_index(transaction_param_formatter, 0),
-        # Snapshot and Revert
-        'evm_revert': apply_formatter_at_index(integer_to_hex, 0),
-        'trace_replayBlockTransactions': apply_formatter_at_index(block_number_formatter, 0),
-        'trace_block': apply_formatter_at_index(block_number_formatter, 0),
-        'trace_call': compose(
-            apply_formatter_at_index(transaction_param_formatter, 0),
-            apply_formatter_at_index(block_number_formatter, 2)
-        ),
-    },
-    result_formatters={
-        # Bbbbbbbb        'vns_accounts': apply_formatter_to_array(to_checksum_address),
-        'vns_blockNumber': to_integer_if_hex,
-        'vns_coinbase': to_checksum_address,
-        'vns_estimateGas': to_integer_if_hex,
-        'vns_gasPrice': to_integer_if_hex,
-        'vns_getBalance': to_integer_if_hex,
-        'vns_getBlockByHash': apply_formatter_if(is_not_null, block_formatter),
-        'vns_getBlockByNumber': apply_formatter_if(is_not_null, block_formatter),
-        'vns_getBlockTransactionCountByHash': to_integer_if_hex,
-        'vns_getBlockTransactionCountByNumber': to_integer_if_hex,
-        'vns_getCode': HexBytes,
-        'vns_getFilterChanges': filter_result_formatter,
-        'vns_getFilterLogs': filter_result_formatter,
-        'vns_getLogs': filter_result_formatter,
-        'vns_getStorageAt': HexBytes,
-        'vns_getTransactionByBlockHashAndIndex': apply_formatter_if(
-            is_not_null,
-            transaction_formatter,
-        ),
-        'vns_getTransactionByBlockNumberAndIndex': apply_formatter_if(
-            is_not_null,
-            transaction_formatter,
-        ),
-        'vns_getTransactionByHash': apply_formatter_if(is_not_null, transaction_formatter),
-        'vns_getTransactionCount': to_integer_if_hex,
-        'vns_getTransactionReceipt': apply_formatter_if(
-            is_not_null,
-            receipt_formatter,
-        ),
-        'vns_getUncleCountByBlockHash': to_integer_if_hex,
-        'vns_getUncleCountByBlockNumber': to_integer_if_hex,
-        'vns_hashrate': to_integer_if_hex,
-        'vns_protocolVersion': compose(
-            apply_formatter_if(is_integer, str),
-            to_integer_if_hex,
-        ),
-        'vns_sendRawTransaction': to_hexbytes(32),
-        'vns_sendTransaction': to_hexbytes(32),
-        'vns_signTransaction': apply_formatter_if(is_not_null, signed_tx_formatter),
-        'vns_sign': HexBytes,
-        'vns_syncing': apply_formatter_if(is_not_false, syncing_formatter),
-        # personal
-        'personal_importRawKey': to_checksum_address,
-        'personal_listAccounts': apply_formatter_to_array(to_checksum_address),
-        'personal_newAccount': to_checksum_address,
-        'personal_sendTransaction': to_hexbytes(32),
-        # SHH
-        'shh_getFilterMessages': apply_formatter_to_array(whisper_log_formatter),
-        # Transaction Pool
-        'txpool_content': transaction_pool_content_formatter,
-        'txpool_inspect': transaction_pool_inspect_formatter,
-        # Snapshot and Revert
-        'evm_snapshot': hex_to_integer,
-        # Net
-        'net_peerCount': to_integer_if_hex,
-    },
+PYTHONIC_REQUEST_FORMATTERS = {
+    # Bbbbbbbb        'vns_getBalance': apply_formatter_at_index(block_number_formatter, 1),
+    'vns_getBlockByNumber': apply_formatter_at_index(block_number_formatter, 0),
+    'vns_getBlockTransactionCountByNumber': apply_formatter_at_index(
+        block_number_formatter,
+        0,
+    ),
+    'vns_getCode': apply_formatter_at_index(block_number_formatter, 1),
+    'vns_getStorageAt': apply_formatter_at_index(block_number_formatter, 2),
+    'vns_getTransactionByBlockNumberAndIndex': compose(
+        apply_formatter_at_index(block_number_formatter, 0),
+        apply_formatter_at_index(integer_to_hex, 1),
+    ),
+    'vns_getTransactionCount': apply_formatter_at_index(block_number_formatter, 1),
+    'vns_getUncleCountByBlockNumber': apply_formatter_at_index(block_number_formatter, 0),
+    'vns_getUncleByBlockNumberAndIndex': compose(
+        apply_formatter_at_index(block_number_formatter, 0),
+        apply_formatter_at_index(integer_to_hex, 1),
+    ),
+    'vns_getUncleByBlockHashAndIndex': apply_formatter_at_index(integer_to_hex, 1),
+    'vns_newFilter': apply_formatter_at_index(filter_params_formatter, 0),
+    'vns_subscribe': subscribe_params_formatter,
+    'vns_getLogs': apply_formatter_at_index(filter_params_formatter, 0),
+    'vns_call': combine_argument_formatters(
+        transaction_param_formatter,
+        block_number_formatter,
+    ),
+    'vns_estimateGas': apply_one_of_formatters((
+        (estimate_gas_without_block_id, is_length(1)),
+        (estimate_gas_with_block_id, is_length(2)),
+    )),
+    'vns_sendTransaction': apply_formatter_at_index(transaction_param_formatter, 0),
+    # personal
+    'personal_importRawKey': apply_formatter_at_index(
+        compose(remove_0x_prefix, hexstr_if_str(to_hex)),
+        0,
+    ),
+    'personal_sign': apply_formatter_at_index(text_if_str(to_hex), 0),
+    'personal_ecRecover': apply_formatter_at_index(text_if_str(to_hex), 0),
+    'personal_sendTransaction': apply_formatter_at_index(transaction_param_formatter, 0),
+    # Snapshot and Revert
+    'evm_revert': apply_formatter_at_index(integer_to_hex, 0),
+    'trace_replayBlockTransactions': apply_formatter_at_index(block_number_formatter, 0),
+    'trace_block': apply_formatter_at_index(block_number_formatter, 0),
+    'trace_call': compose(
+        apply_formatter_at_index(transaction_param_formatter, 0),
+        apply_formatter_at_index(block_number_formatter, 2)
+    ),
+}
+
+
+PYTHONIC_RESULT_FORMATTERS = {
+    # Bbbbbbbb        'vns_accounts': apply_formatter_to_array(to_checksum_address),
+    'vns_blockNumber': to_integer_if_hex,
+    'vns_coinbase': to_checksum_address,
+    'vns_estimateGas': to_integer_if_hex,
+    'vns_gasPrice': to_integer_if_hex,
+    'vns_getBalance': to_integer_if_hex,
+    'vns_getBlockByHash': FUSED_FORMATTERS['block'],
+    'vns_getBlockByNumber': FUSED_FORMATTERS['block'],
+    'vns_getBlockTransactionCountByHash': to_integer_if_hex,
+    'vns_getBlockTransactionCountByNumber': to_integer_if_hex,
+    'vns_getCode': HexBytes,
+    'vns_getFilterChanges': FUSED_FORMATTERS['filter_result'],
+    'vns_getFilterLogs': FUSED_FORMATTERS['filter_result'],
+    'vns_getLogs': FUSED_FORMATTERS['filter_result'],
+    'vns_getStorageAt': HexBytes,
+    'vns_getTransactionByBlockHashAndIndex': FUSED_FORMATTERS['transaction'],
+    'vns_getTransactionByBlockNumberAndIndex': FUSED_FORMATTERS['transaction'],
+    'vns_getTransactionByHash': FUSED_FORMATTERS['transaction'],
+    'vns_getTransactionCount': to_integer_if_hex,
+    'vns_getTransactionReceipt': FUSED_FORMATTERS['receipt'],
+    'vns_getUncleCountByBlockHash': to_integer_if_hex,
+    'vns_getUncleCountByBlockNumber': to_integer_if_hex,
+    'vns_hashrate': to_integer_if_hex,
+    'vns_protocolVersion': compose(
+        apply_formatter_if(is_integer, str),
+        to_integer_if_hex,
+    ),
+    'vns_sendRawTransaction': to_hexbytes(32),
+    'vns_sendTransaction': to_hexbytes(32),
+    'vns_signTransaction': apply_formatter_if(is_not_null, signed_tx_formatter),
+    'vns_sign': HexBytes,
+    'vns_syncing': apply_formatter_if(is_not_false, syncing_formatter),
+    # personal
+    'personal_importRawKey': to_checksum_address,
+    'personal_listAccounts': apply_formatter_to_array(to_checksum_address),
+    'personal_newAccount': to_checksum_address,
+    'personal_sendTransaction': to_hexbytes(32),
+    # SHH
+    'shh_getFilterMessages': apply_formatter_to_array(whisper_log_formatter),
+    # Transaction Pool
+    'txpool_content': transaction_pool_content_formatter,
+    'txpool_inspect': transaction_pool_inspect_formatter,
+    # Snapshot and Revert
+    'evm_snapshot': hex_to_integer,
+    # Net
+    'net_peerCount': to_integer_if_hex,
+}
+
+
+# Formatters for the results pushed by the node for each type of subscription
+PYTHONIC_SUBSCRIPTION_FORMATTERS = {
+    'newHeads': FUSED_FORMATTERS['block'],
+    'logs': FUSED_FORMATTERS['log_entry'],
+    'newPendingTransactions': to_hexbytes(32),
+}
+
+# Used when the attrdict middleware wraps the pythonic middleware directly, so
+# that blocks, transactions and receipts are converted to AttributeDicts in the
+# same pass as they are formatted.  Lists of logs are left to the attrdict
+# middleware, which does not convert them.
+PYTHONIC_ATTRDICT_RESULT_FORMATTERS = dict(
+    PYTHONIC_RESULT_FORMATTERS,
+    vns_getBlockByHash=FUSED_ATTRDICT_FORMATTERS['block'],
+    vns_getBlockByNumber=FUSED_ATTRDICT_FORMATTERS['block'],
+    vns_getTransactionByBlockHashAndIndex=FUSED_ATTRDICT_FORMATTERS['transaction'],
+    vns_getTransactionByBlockNumberAndIndex=FUSED_ATTRDICT_FORMATTERS['transaction'],
+    vns_getTransactionByHash=FUSED_ATTRDICT_FORMATTERS['transaction'],
+    vns_getTransactionReceipt=FUSED_ATTRDICT_FORMATTERS['receipt'],
+)
+
+# Used instead when the ``result_format`` of Web3 is ``'lazy'``
+PYTHONIC_LAZY_RESULT_FORMATTERS = dict(
+    PYTHONIC_RESULT_FORMATTERS,
+    vns_getBlockByHash=FUSED_LAZY_FORMATTERS['block'],
+    vns_getBlockByNumber=FUSED_LAZY_FORMATTERS['block'],
+    vns_getTransactionByBlockHashAndIndex=FUSED_LAZY_FORMATTERS['transaction'],
+    vns_getTransactionByBlockNumberAndIndex=FUSED_LAZY_FORMATTERS['transaction'],
+    vns_getTransactionByHash=FUSED_LAZY_FORMATTERS['transaction'],
+    vns_getTransactionReceipt=FUSED_LAZY_FORMATTERS['receipt'],
+)
+
+# Used instead when the ``result_format`` of Web3 is ``'records'``.  Logs are
+# the bulk of the results kept in memory, so lists of logs are converted too.
+PYTHONIC_RECORD_RESULT_FORMATTERS = dict(
+    PYTHONIC_RESULT_FORMATTERS,
+    vns_getBlockByHash=FUSED_RECORD_FORMATTERS['block'],
+    vns_getBlockByNumber=FUSED_RECORD_FORMATTERS['block'],
+    vns_getFilterChanges=FUSED_RECORD_FORMATTERS['filter_result'],
+    vns_getFilterLogs=FUSED_RECORD_FORMATTERS['filter_result'],
+    vns_getLogs=FUSED_RECORD_FORMATTERS['filter_result'],
+    vns_getTransactionByBlockHashAndIndex=FUSED_RECORD_FORMATTERS['transaction'],
+    vns_getTransactionByBlockNumberAndIndex=FUSED_RECORD_FORMATTERS['transaction'],
+    vns_getTransactionByHash=FUSED_RECORD_FORMATTERS['transaction'],
+    vns_getTransactionReceipt=FUSED_RECORD_FORMATTERS['receipt'],
 )
+
+# Used instead when the ``result_format`` of Web3 is ``'raw'``, which leaves
+# results as they were decoded from the response
+PYTHONIC_RAW_RESULT_FORMATTERS = {}
+
+PYTHONIC_RESULT_FORMATTERS_BY_FORMAT = {
+    'attrdict': PYTHONIC_ATTRDICT_RESULT_FORMATTERS,
+    'lazy': PYTHONIC_LAZY_RESULT_FORMATTERS,
+    'records': PYTHONIC_RECORD_RESULT_FORMATTERS,
+    'raw': PYTHONIC_RAW_RESULT_FORMATTERS,
+}
+
+PYTHONIC_METHODS = frozenset(PYTHONIC_REQUEST_FORMATTERS) | frozenset(PYTHONIC_RESULT_FORMATTERS)
+
+
+def is_wrapped_by(web3, outer_middleware, middleware):
+    """
+    Whether ``outer_middleware`` is the layer of the onion of ``web3`` right
+    outside ``middleware``.
+    """
+    onion = getattr(web3, 'middleware_onion', None)
+    if onion is None:
+        return False
+    elements = onion.elements
+    return any(
+        outer is outer_middleware and inner is middleware
+        for outer, inner in zip(elements, elements[1:])
+    )
+
+
+def get_result_formatters_by_format(web3, outer_middleware, middleware):
+    """
+    Returns a dict of each result format to the result formatters of the
+    pythonic middleware.  Results are only converted to the classes of a
+    result format when the attrdict middleware wraps the pythonic middleware
+    directly.
+    """
+    if is_wrapped_by(web3, outer_middleware, middleware):
+        return PYTHONIC_RESULT_FORMATTERS_BY_FORMAT
+    else:
+        return {
+            result_format: (
+                result_formatters
+                if result_formatters is PYTHONIC_RAW_RESULT_FORMATTERS
+                else PYTHONIC_RESULT_FORMATTERS
+            )
+            for result_format, result_formatters in PYTHONIC_RESULT_FORMATTERS_BY_FORMAT.items()
+        }
+
+
+def pythonic_middleware(make_request, web3):
+    requests_by_format = {
+        result_format: apply_formatters(
+            make_request=make_request,
+            request_formatters=PYTHONIC_REQUEST_FORMATTERS,
+            result_formatters=result_formatters,
+            error_formatters={},
+        )
+        for result_format, result_formatters in get_result_formatters_by_format(
+            web3,
+            attrdict_middleware,
+            pythonic_middleware,
+        ).items()
+    }
+
+    def middleware(method, params):
+        return requests_by_format[get_result_format(web3)](method, params)
+    return middleware
+
+
+pythonic_middleware.handles_methods = PYTHONIC_METHODS
+
+
+def async_pythonic_middleware(make_request, web3):
+    requests_by_format = {
+        result_format: async_apply_formatters(
+            make_request=make_request,
+            request_formatters=PYTHONIC_REQUEST_FORMATTERS,
+            result_formatters=result_formatters,
+            error_formatters={},
+        )
+        for result_format, result_formatters in get_result_formatters_by_format(
+            web3,
+            async_attrdict_middleware,
+            async_pythonic_middleware,
+        ).items()
+    }
+
+    async def middleware(method, params):
+        return await requests_by_format[get_result_format(web3)](method, params)
+    return middleware
+
+
+async_pythonic_middleware.handles_methods = PYTHONIC_METHODS
@@ -1,3 +1,5 @@
+import functools
+
 from vns_utils.toolz import (
     curry,
     pipe,
@@ -23,6 +25,29 @@ def retrieve_async_method_call_fn(w3, module, method):
     return caller
 
 
+class RawResults:
+    """
+    Calls the methods of ``module`` with the ``'raw'`` result format, so that
+    they return results as decoded from the provider's responses.
+    """
+    def __init__(self, module):
+        self.module = module
+
+    def __getattr__(self, attr):
+        web3 = self.module.web3
+        # properties make their requests as they are read
+        with web3.using_result_format('raw'):
+            value = getattr(self.module, attr)
+        if not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def raw_method(*args, **kwargs):
+            with web3.using_result_format('raw'):
+                return value(*args, **kwargs)
+        return raw_method
+
+
 #  TODO: Replace this with ModuleV2 when ready.
 class Module:
     web3 = None
@@ -30,6 +55,20 @@ class Module:
     def __init__(self, web3):
         self.web3 = web3
 
+    @property
+    def raw(self):
+        """
+        This module, with methods which return the results as decoded from the
+        provider's responses, skipping the formatting of the pythonic and
+        attrdict middlewares.  Requests are still formatted and validated.
+        """
+        if getattr(self, 'is_async', False):
+            raise TypeError(
+                "Raw results are overridden per thread, which does not suit coroutines. "
+                "Set the result_format of Web3 to 'raw' instead."
+            )
+        return RawResults(self)
+
     @classmethod
     def attach(cls, target, module_name=None):
         if not module_name:
@@ -4,6 +4,12 @@ from .base import (  # noqa: F401
 )
 
 from .rpc import HTTPProvider  # noqa: F401
+from .async_rpc import AsyncHTTPProvider  # noqa: F401
 from .ipc import IPCProvider  # noqa: F401
 from .websocket import WebsocketProvider  # noqa: F401
 from .auto import AutoProvider  # noqa: F401
+from .balanced import LoadBalancedProvider  # noqa: F401
+from .cassette import (  # noqa: F401
+    RecordingProvider,
+    ReplayProvider,
+)
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+
+from vns_utils import (
+    to_dict,
+)
+
+from web3._utils.http import (
+    construct_user_agent,
+)
+from web3._utils.profiling import (
+    BATCH_METHOD,
+)
+from web3._utils.request import (
+    async_make_post_request,
+    close_async_sessions,
+)
+from web3.datastructures import (
+    NamedElementOnion,
+)
+from web3.middleware import (
+    async_http_retry_request_middleware,
+)
+
+from .base import (
+    JSONBaseProvider,
+)
+from .rpc import (
+    get_default_endpoint,
+)
+
+
+class AsyncHTTPProvider(JSONBaseProvider):
+    """
+    An HTTP provider whose ``make_request`` is a coroutine.  Requests share a
+    pooled ``aiohttp`` session per endpoint and event loop, so many requests
+    can be in flight from a single event loop.
+    """
+    logger = logging.getLogger("web3.providers.AsyncHTTPProvider")
+    is_async = True
+    endpoint_uri = None
+    _request_kwargs = None
+    _middlewares = NamedElementOnion([
+        (async_http_retry_request_middleware, 'http_retry_request'),
+    ])
+
+    def __init__(self, endpoint_uri=None, request_kwargs=None):
+        if endpoint_uri is None:
+            self.endpoint_uri = get_default_endpoint()
+        else:
+            self.endpoint_uri = endpoint_uri
+        self._request_kwargs = request_kwargs or {}
+        super().__init__()
+
+    def __str__(self):
+        return "Async RPC connection {0}".format(self.endpoint_uri)
+
+    @to_dict
+    def get_request_kwargs(self):
+        if 'headers' not in self._request_kwargs:
+            yield 'headers', self.get_request_headers()
+        for key, value in self._request_kwargs.items():
+            yield key, value
+
+    def get_request_headers(self):
+        return {
+            'Content-Type': 'application/json',
+            'User-Agent': construct_user_agent(str(type(self))),
+        }
+
+    async def make_request(self, method, params):
+        self.logger.debug("Making request HTTP. URI: %s, Method: %s",
+                          self.endpoint_uri, method)
+        with self._measure_request(self.endpoint_uri, method) as measurement:
+            request_data = self.encode_rpc_request(method, params)
+            measurement.request_bytes = len(request_data)
+            raw_response = await async_make_post_request(
+                self.endpoint_uri,
+                request_data,
+                **self.get_request_kwargs()
+            )
+            measurement.response_bytes = len(raw_response)
+            response = self.decode_rpc_response(raw_response)
+            measurement.response = response
+        self.logger.debug("Getting response HTTP. URI: %s, "
+                          "Method: %s, Response: %s",
+                          self.endpoint_uri, method, response)
+        return response
+
+    async def make_batch_request(self, requests):
+        self.logger.debug("Making batch request HTTP. URI: %s, Size: %d",
+                          self.endpoint_uri, len(requests))
+        with self._measure_request(self.endpoint_uri, BATCH_METHOD) as measurement:
+            request_ids, request_data = self.encode_batch_rpc_request(requests)
+            measurement.request_bytes = len(request_data)
+            raw_response = await async_make_post_request(
+                self.endpoint_uri,
+                request_data,
+                **self.get_request_kwargs()
+            )
+            measurement.response_bytes = len(raw_response)
+            return self.decode_batch_rpc_response(raw_response, request_ids)
+
+    def isConnected(self):
+        raise TypeError(
+            "AsyncHTTPProvider can only check the connection from an event loop, "
+            "with `await provider.coro_isConnected()`"
+        )
+
+    async def close(self):
+        """
+        Closes the session of the running event loop for the endpoint.
+        """
+        await close_async_sessions(self.endpoint_uri)
+
+    async def coro_isConnected(self):
+        import aiohttp
+
+        try:
+            response = await self.make_request('web3_clientVersion', [])
+        except (IOError, aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+        assert response['jsonrpc'] == '2.0'
+        assert 'error' not in response
+
+        return True
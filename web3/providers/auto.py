@@ -51,6 +51,10 @@ class AutoProvider(BaseProvider):
         WebsocketProvider,
     )
     _active_provider = None
+    _profiler = None
+    _metrics = None
+    # the disconnects of the providers which were active before the current one
+    _previous_disconnects = 0
 
     def __init__(self, potential_providers=None):
         """
@@ -65,12 +69,48 @@ class AutoProvider(BaseProvider):
         else:
             self._potential_providers = self.default_providers
 
+    @property
+    def disconnects(self):
+        # switching to another provider counts as a disconnect, so that anything
+        # cached for the connection is dropped
+        if self._active_provider is None:
+            return self._previous_disconnects
+        return self._previous_disconnects + self._active_provider.disconnects
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        # requests are timed by the provider they are proxied to
+        self._profiler = profiler
+        if self._active_provider is not None:
+            self._active_provider.profiler = profiler
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, collector):
+        # requests are measured by the provider they are proxied to
+        self._metrics = collector
+        if self._active_provider is not None:
+            self._active_provider.metrics = collector
+
     def make_request(self, method, params):
         try:
             return self._proxy_request(method, params)
         except IOError as exc:
             return self._proxy_request(method, params, use_cache=False)
 
+    def make_batch_request(self, requests):
+        try:
+            return self._proxy_batch_request(requests)
+        except IOError as exc:
+            return self._proxy_batch_request(requests, use_cache=False)
+
     def isConnected(self):
         provider = self._get_active_provider(use_cache=True)
         return provider is not None and provider.isConnected()
@@ -87,6 +127,15 @@ class AutoProvider(BaseProvider):
 
         return provider.make_request(method, params)
 
+    def _proxy_batch_request(self, requests, use_cache=True):
+        provider = self._get_active_provider(use_cache)
+        if provider is None:
+            raise CannotHandleRequest(
+                "Could not discover provider while making batch request: "
+                "requests:{0}\n".format(requests))
+
+        return provider.make_batch_request(requests)
+
     def _get_active_provider(self, use_cache):
         if use_cache and self._active_provider is not None:
             return self._active_provider
@@ -94,6 +143,10 @@ class AutoProvider(BaseProvider):
         for Provider in self._potential_providers:
             provider = Provider()
             if provider is not None and provider.isConnected():
+                provider.profiler = self._profiler
+                provider.metrics = self._metrics
+                if self._active_provider is not None:
+                    self._previous_disconnects += self._active_provider.disconnects + 1
                 self._active_provider = provider
                 return provider
 
@@ -0,0 +1,462 @@
+import collections
+import concurrent.futures
+import itertools
+import logging
+import math
+import random
+import threading
+import time
+
+from web3._utils.threads import (
+    spawn,
+)
+from web3.exceptions import (
+    CannotHandleRequest,
+)
+from web3.middleware.exception_retry_request import (
+    check_if_retry_on_failure,
+)
+
+from .base import (
+    BaseProvider,
+)
+
+FILTER_CREATION_METHODS = {
+    'vns_newFilter',
+    'vns_newBlockFilter',
+    'vns_newPendingTransactionFilter',
+}
+FILTER_METHODS = {
+    'vns_getFilterChanges',
+    'vns_getFilterLogs',
+    'vns_uninstallFilter',
+}
+
+DEFAULT_SMOOTHING = 0.3
+DEFAULT_MAX_BLOCK_LAG = 2
+DEFAULT_HEAD_REFRESH_INTERVAL = 5
+# the seconds a failed request is assumed to cost, on top of its retry
+FAILURE_PENALTY = 1.0
+
+# methods which a node may have acted on before the request failed, and which
+# would then be acted on twice if sent to another endpoint
+NON_IDEMPOTENT_METHODS = {
+    'vns_sendTransaction',
+    'vns_sendRawTransaction',
+    'personal_sendTransaction',
+    'vns_submitWork',
+    'vns_submitHashrate',
+}
+
+# methods which may be retried but change the state of the node
+UNHEDGEABLE_METHODS = FILTER_CREATION_METHODS | FILTER_METHODS | {
+    'vns_sendRawTransaction',
+    'vns_submitWork',
+}
+HEDGEABLE_NAMESPACES = {'vns', 'net'}
+# latencies kept to compute the hedging delay from, and how many are needed
+HEDGE_LATENCY_WINDOW = 1000
+MIN_HEDGE_LATENCY_SAMPLES = 20
+
+
+def is_hedgeable(method):
+    """
+    Read-only methods from the retry whitelist of
+    :mod:`web3.middleware.exception_retry_request`, which are safe to send to
+    two nodes at once.
+    """
+    return (
+        check_if_retry_on_failure(method) and
+        method.split('_')[0] in HEDGEABLE_NAMESPACES and
+        method not in UNHEDGEABLE_METHODS
+    )
+
+
+def can_fail_over(method):
+    """
+    Methods from the retry whitelist of
+    :mod:`web3.middleware.exception_retry_request` which are safe to send to
+    another endpoint after a connection error.
+    """
+    return check_if_retry_on_failure(method) and method not in NON_IDEMPOTENT_METHODS
+
+
+def percentile(sorted_values, percent):
+    index = max(int(math.ceil(len(sorted_values) * percent / 100.0)) - 1, 0)
+    return sorted_values[index]
+
+
+class Endpoint:
+    """
+    The routing statistics kept for one of the providers of a
+    :class:`LoadBalancedProvider`.  ``latency`` and ``error_rate`` are
+    exponentially weighted moving averages of the observed requests, with
+    ``latency`` only measured on successful requests.
+    """
+    def __init__(self, provider):
+        self.provider = provider
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.head = None
+        self.requests = 0
+
+    def __repr__(self):
+        return "<Endpoint {0} latency={1:.4f} error_rate={2:.2f} head={3}>".format(
+            self.provider, self.latency, self.error_rate, self.head,
+        )
+
+    @property
+    def score(self):
+        # the expected cost of a request, scaled by how busy the endpoint is
+        return (self.latency + self.error_rate * FAILURE_PENALTY) * (self.in_flight + 1)
+
+    def record(self, latency, failed, smoothing):
+        self.requests += 1
+        if not failed:
+            self.latency += smoothing * (latency - self.latency)
+        self.error_rate += smoothing * (float(failed) - self.error_rate)
+
+
+class LoadBalancedProvider(BaseProvider):
+    """
+    Spreads requests over several providers connected to nodes of the same
+    chain.
+
+    Each request goes to the better of two randomly picked endpoints, judged on
+    their observed latency, error rate and requests in flight.  Endpoints whose
+    head block is more than ``max_block_lag`` behind the highest known head are
+    only used when no other endpoint is available.  Filters get ids of the
+    balancer's own, since nodes may hand out the same ids, and requests about
+    a filter go to the endpoint which created it, with its id there.  A
+    request which fails with a connection error is retried on the remaining
+    endpoints, unless the node may already have acted on it, like a
+    transaction which was sent.
+
+    With ``hedge_percentile`` set, a read-only request which has not been
+    answered within that percentile of recent latencies is also sent to a
+    second endpoint, and the first response is used.
+    """
+    logger = logging.getLogger("web3.providers.LoadBalancedProvider")
+
+    failover_errors = (OSError, TimeoutError, concurrent.futures.TimeoutError)
+
+    def __init__(self,
+                 providers,
+                 smoothing=DEFAULT_SMOOTHING,
+                 max_block_lag=DEFAULT_MAX_BLOCK_LAG,
+                 head_refresh_interval=DEFAULT_HEAD_REFRESH_INTERVAL,
+                 hedge_percentile=None,
+                 hedge_min_delay=0):
+        if not providers:
+            raise ValueError("LoadBalancedProvider needs at least one provider")
+        self.endpoints = [Endpoint(provider) for provider in providers]
+        self.smoothing = smoothing
+        self.max_block_lag = max_block_lag
+        self.head_refresh_interval = head_refresh_interval
+        self._lock = threading.Lock()
+        # the endpoint and endpoint-local id of each filter, by the id given out
+        self._filters = {}
+        self._filter_ids = itertools.count(1)
+        self._last_head_refresh = None
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self._latencies = collections.deque(maxlen=HEDGE_LATENCY_WINDOW)
+        self._latencies_since_delay = 0
+        self._hedge_delay = None
+        self._hedge_executor = None
+
+    def __str__(self):
+        return "Load balanced connection to {0}".format(
+            ", ".join(str(endpoint.provider) for endpoint in self.endpoints)
+        )
+
+    @property
+    def disconnects(self):
+        return sum(endpoint.provider.disconnects for endpoint in self.endpoints)
+
+    @property
+    def profiler(self):
+        return self.endpoints[0].provider.profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        # requests are timed by the provider of the endpoint they are sent to
+        for endpoint in self.endpoints:
+            endpoint.provider.profiler = profiler
+
+    @property
+    def metrics(self):
+        return self.endpoints[0].provider.metrics
+
+    @metrics.setter
+    def metrics(self, collector):
+        # requests are measured by the provider of the endpoint they are sent to
+        for endpoint in self.endpoints:
+            endpoint.provider.metrics = collector
+
+    def make_request(self, method, params):
+        if method in FILTER_METHODS and params:
+            with self._lock:
+                if method == 'vns_uninstallFilter':
+                    filter_location = self._filters.pop(params[0], None)
+                else:
+                    filter_location = self._filters.get(params[0])
+            if filter_location is not None:
+                endpoint, local_filter_id = filter_location
+                return self._send(
+                    endpoint,
+                    endpoint.provider.make_request,
+                    method,
+                    [local_filter_id] + list(params[1:]),
+                )
+
+        if self.hedge_percentile is not None and is_hedgeable(method):
+            endpoint, response = self._send_hedged(method, params)
+        else:
+            endpoint, response = self._send_with_failover(
+                lambda provider: provider.make_request(method, params),
+                method,
+                fail_over=can_fail_over(method),
+            )
+
+        if method in FILTER_CREATION_METHODS and response.get('result') is not None:
+            with self._lock:
+                filter_id = hex(next(self._filter_ids))
+                self._filters[filter_id] = (endpoint, response['result'])
+            response = dict(response, result=filter_id)
+        elif method == 'vns_blockNumber' and 'result' in response:
+            self._update_head(endpoint, response['result'])
+        return response
+
+    def make_batch_request(self, requests):
+        requests = list(requests)
+        if any(method in FILTER_METHODS | FILTER_CREATION_METHODS for method, _ in requests):
+            # filter requests must each go to the endpoint holding the filter
+            return [self.make_request(method, params) for method, params in requests]
+
+        _, responses = self._send_with_failover(
+            lambda provider: provider.make_batch_request(requests),
+            'batch',
+            fail_over=all(can_fail_over(method) for method, _ in requests),
+        )
+        return responses
+
+    def isConnected(self):
+        return any(endpoint.provider.isConnected() for endpoint in self.endpoints)
+
+    def _send_with_failover(self, send, description, tried=None, fail_over=True):
+        """
+        Sends the request to the best endpoint and, if ``fail_over`` is set,
+        to the next best when it fails with a connection error.  Requests
+        which the node may have acted on before failing, like a transaction
+        which was sent, must not fail over, and raise the error instead.
+        """
+        self._maybe_refresh_heads()
+
+        tried = list(tried or [])
+        while True:
+            endpoint = self._choose_endpoint(exclude=tried)
+            if endpoint is None:
+                raise CannotHandleRequest(
+                    "All endpoints failed while making request: {0}".format(description)
+                )
+            tried.append(endpoint)
+            try:
+                return endpoint, self._send(endpoint, send, endpoint.provider)
+            except self.failover_errors:
+                if not fail_over:
+                    raise
+                self.logger.warning(
+                    "Request %s to %s failed, trying another endpoint",
+                    description,
+                    endpoint.provider,
+                    exc_info=True,
+                )
+
+    def _send_hedged(self, method, params):
+        self._maybe_refresh_heads()
+        delay = self._get_hedge_delay()
+        primary = self._choose_endpoint()
+        if delay is None or primary is None:
+            return self._send_with_failover(
+                lambda provider: self._make_timed_request(provider, method, params),
+                method,
+            )
+
+        attempts = {self._send_primary(primary, method, params): primary}
+        done, _ = concurrent.futures.wait(attempts, timeout=delay)
+        if not done:
+            secondary = self._choose_endpoint(exclude=[primary])
+            if secondary is not None:
+                with self._lock:
+                    self.hedged_requests += 1
+                hedge = self._get_hedge_executor().submit(
+                    self._send,
+                    secondary,
+                    self._make_timed_request,
+                    secondary.provider,
+                    method,
+                    params,
+                )
+                attempts[hedge] = secondary
+
+        pending = set(attempts)
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                try:
+                    response = future.result()
+                except self.failover_errors:
+                    # any other error is raised, as it would have been without
+                    # hedging
+                    continue
+                for loser in pending:
+                    # the loser keeps running if it has started, but its
+                    # response is ignored
+                    loser.cancel()
+                endpoint = attempts[future]
+                if endpoint is not primary:
+                    with self._lock:
+                        self.hedge_wins += 1
+                return endpoint, response
+
+        return self._send_with_failover(
+            lambda provider: self._make_timed_request(provider, method, params),
+            method,
+            tried=list(attempts.values()),
+        )
+
+    def _send_primary(self, endpoint, method, params):
+        """
+        Sends the primary request of a hedged request on a thread of its own,
+        rather than through the hedge executor, so that primaries are never
+        held up behind one another and the hedge delay only counts from when
+        the request is sent.  Returns a future of its response.
+        """
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+
+        def send():
+            try:
+                response = self._send(
+                    endpoint,
+                    self._make_timed_request,
+                    endpoint.provider,
+                    method,
+                    params,
+                )
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(response)
+
+        thread = threading.Thread(target=send, name='web3-hedge-primary')
+        thread.daemon = True
+        thread.start()
+        return future
+
+    def _make_timed_request(self, provider, method, params):
+        start = time.monotonic()
+        response = provider.make_request(method, params)
+        with self._lock:
+            self._latencies.append(time.monotonic() - start)
+            self._latencies_since_delay += 1
+            if self._latencies_since_delay >= MIN_HEDGE_LATENCY_SAMPLES:
+                # recomputed every so often, rather than sorting on each request
+                self._hedge_delay = None
+        return response
+
+    def _get_hedge_delay(self):
+        with self._lock:
+            if len(self._latencies) < MIN_HEDGE_LATENCY_SAMPLES:
+                return None
+            if self._hedge_delay is None:
+                self._latencies_since_delay = 0
+                self._hedge_delay = max(
+                    percentile(sorted(self._latencies), self.hedge_percentile),
+                    self.hedge_min_delay,
+                )
+            return self._hedge_delay
+
+    def _get_hedge_executor(self):
+        with self._lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix='web3-hedge',
+                )
+            return self._hedge_executor
+
+    def _send(self, endpoint, send, *args):
+        with self._lock:
+            endpoint.in_flight += 1
+        start = time.monotonic()
+        failed = True
+        try:
+            response = send(*args)
+            failed = False
+            return response
+        finally:
+            with self._lock:
+                endpoint.in_flight -= 1
+                endpoint.record(time.monotonic() - start, failed, self.smoothing)
+
+    def _choose_endpoint(self, exclude=()):
+        with self._lock:
+            candidates = [endpoint for endpoint in self.endpoints if endpoint not in exclude]
+            if not candidates:
+                return None
+
+            heads = [endpoint.head for endpoint in candidates if endpoint.head is not None]
+            if heads:
+                min_head = max(heads) - self.max_block_lag
+                current = [
+                    endpoint for endpoint in candidates
+                    if endpoint.head is None or endpoint.head >= min_head
+                ]
+                candidates = current or candidates
+
+            if len(candidates) <= 2:
+                choices = candidates
+            else:
+                choices = random.sample(candidates, 2)
+            return min(choices, key=lambda endpoint: endpoint.score)
+
+    def _update_head(self, endpoint, block_number):
+        if isinstance(block_number, str):
+            block_number = int(block_number, 16)
+        with self._lock:
+            endpoint.head = block_number
+
+    def _maybe_refresh_heads(self):
+        if self.head_refresh_interval is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if (self._last_head_refresh is not None and
+                    now - self._last_head_refresh < self.head_refresh_interval):
+                return
+            self._last_head_refresh = now
+
+        for endpoint in self.endpoints:
+            spawn(self._refresh_head, endpoint)
+
+    def _refresh_head(self, endpoint):
+        try:
+            response = self._send(
+                endpoint,
+                endpoint.provider.make_request,
+                'vns_blockNumber',
+                [],
+            )
+        except Exception:
+            self.logger.debug("Could not refresh head of %s", endpoint.provider, exc_info=True)
+            return
+
+        if 'result' in response:
+            self._update_head(endpoint, response['result'])
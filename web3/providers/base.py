@@ -1,21 +1,52 @@
 import itertools
 
-from vns_utils import (
-    to_bytes,
-    to_text,
+from web3._utils.batching import (
+    DEFAULT_MAX_MICRO_BATCH_SIZE,
+    DEFAULT_MICRO_BATCH_WINDOW,
+    AsyncMicroBatcher,
+    MicroBatcher,
+    get_batch_collector,
+    waiting_outside_batch,
 )
-
 from web3._utils.encoding import (
     FriendlyJsonSerde,
 )
+from web3._utils.metrics import (
+    measure_request,
+)
+from web3._utils.profiling import (
+    ROUTE_STAGE,
+    get_middleware_name,
+    time_stage,
+)
+from web3._utils.scheduling import (
+    DEFAULT_CLASS_PRIORITIES,
+    DEFAULT_METHOD_CLASSES,
+    RequestScheduler,
+)
+from web3.datastructures import (
+    NamedElementOnion,
+)
 from web3.middleware import (
-    combine_middlewares,
+    compile_middlewares,
 )
 
 
 class BaseProvider:
+    is_async = False
+    micro_batcher = None
+    scheduler = None
+    # the RequestProfiler of the request manager, while profiling is enabled
+    profiler = None
+    # the MetricsCollector of the request manager, while metrics are enabled
+    metrics = None
+    # counts up whenever a persistent connection to the node is lost, so that
+    # the metadata cached for the connection is looked up again
+    disconnects = 0
     _middlewares = ()
-    _request_func_cache = (None, None)  # a tuple of (all_middlewares, request_func)
+    # a tuple of (outer_middlewares, provider_middlewares, all_middlewares, profiler,
+    # request_func)
+    _request_func_cache = (None, None, None, None, None)
 
     @property
     def middlewares(self):
@@ -30,47 +61,244 @@ class BaseProvider:
         @param outer_middlewares is an iterable of middlewares, ordered by first to execute
         @returns a function that calls all the middleware and eventually self.make_request()
         """
-        all_middlewares = tuple(outer_middlewares) + tuple(self.middlewares)
+        onion = outer_middlewares
+        outer_middlewares = as_middleware_tuple(outer_middlewares)
+        provider_middlewares = as_middleware_tuple(self.middlewares)
+        # the middlewares of asynchronous providers return coroutines, which
+        # are not profiled
+        profiler = None if self.is_async else self.profiler
+
+        (
+            cached_outer,
+            cached_provider,
+            cached_all,
+            cached_profiler,
+            request_func,
+        ) = self._request_func_cache
+        if (
+            cached_outer is outer_middlewares and
+            cached_provider is provider_middlewares and
+            cached_profiler is profiler
+        ):
+            # neither onion, nor the profiler, has changed since the last request
+            return request_func
 
-        cache_key = self._request_func_cache[0]
-        if cache_key is None or cache_key != all_middlewares:
-            self._request_func_cache = (
-                all_middlewares,
-                self._generate_request_func(web3, all_middlewares)
-            )
-        return self._request_func_cache[-1]
+        all_middlewares = outer_middlewares + provider_middlewares
+        if cached_all is None or cached_all != all_middlewares or cached_profiler is not profiler:
+            if profiler is None:
+                request_func = self._generate_request_func(web3, all_middlewares)
+            else:
+                request_func = self._generate_request_func(
+                    web3,
+                    all_middlewares,
+                    profiler,
+                    as_middleware_names(onion, outer_middlewares) +
+                    as_middleware_names(self.middlewares, provider_middlewares),
+                )
+        self._request_func_cache = (
+            outer_middlewares,
+            provider_middlewares,
+            all_middlewares,
+            profiler,
+            request_func,
+        )
+        return request_func
 
-    def _generate_request_func(self, web3, middlewares):
-        return combine_middlewares(
+    def _generate_request_func(self, web3, middlewares, profiler=None, names=None):
+        if profiler is None:
+            provider_request_fn = self._route_request
+        else:
+            provider_request_fn = profiler.profile_layer(ROUTE_STAGE, self._route_request)
+        return compile_middlewares(
             middlewares=middlewares,
             web3=web3,
-            provider_request_fn=self.make_request,
+            provider_request_fn=provider_request_fn,
+            profiler=profiler,
+            names=names,
         )
 
+    def _time_stage(self, method, stage):
+        """
+        Returns a context manager which records the time of ``stage`` of a
+        request for ``method`` while profiling is enabled.
+        """
+        return time_stage(self.profiler, method, stage)
+
+    def _measure_request(self, endpoint, method):
+        """
+        Returns a context manager which records a request for ``method`` sent
+        to ``endpoint`` while metrics are enabled.
+        """
+        return measure_request(self.metrics, endpoint, method)
+
+    def _route_request(self, method, params):
+        """
+        Innermost request function of the middleware onion.  Requests are held
+        back by the scheduler, if there is one, until its rate limits allow
+        them.  Requests made from within
+        :meth:`web3.manager.RequestManager.request_batch` are then handed to
+        the batch collector, and other requests to the micro batcher if there
+        is one, instead of being sent individually.
+        """
+        if self.scheduler is not None:
+            if self.is_async:
+                return self._coro_route_scheduled_request(method, params)
+            with waiting_outside_batch(self):
+                self.scheduler.acquire(method)
+        return self._send_request(method, params)
+
+    async def _coro_route_scheduled_request(self, method, params):
+        await self.scheduler.coro_acquire(method)
+        return await self._send_request(method, params)
+
+    def _send_request(self, method, params):
+        collector = get_batch_collector(self)
+        if collector is not None:
+            return collector.submit(method, params)
+        elif self.micro_batcher is not None:
+            return self.micro_batcher.submit(method, params)
+        else:
+            return self.make_request(method, params)
+
+    def enable_micro_batching(self,
+                              window=DEFAULT_MICRO_BATCH_WINDOW,
+                              max_batch_size=DEFAULT_MAX_MICRO_BATCH_SIZE):
+        """
+        Sends requests made within ``window`` seconds of each other together
+        through :meth:`make_batch_request`, in batches of at most
+        ``max_batch_size`` requests.  Returns the batcher, whose ``histogram``
+        counts the batches sent by size.
+        """
+        if self.is_async:
+            self.micro_batcher = AsyncMicroBatcher(self, window, max_batch_size)
+        else:
+            self.micro_batcher = MicroBatcher(self, window, max_batch_size)
+        return self.micro_batcher
+
+    def disable_micro_batching(self):
+        self.micro_batcher = None
+
+    def enable_rate_limiting(self,
+                             rate=None,
+                             burst=None,
+                             class_limits=None,
+                             method_classes=DEFAULT_METHOD_CLASSES,
+                             class_priorities=DEFAULT_CLASS_PRIORITIES):
+        """
+        Holds requests back to at most ``rate`` per second, with bursts of up
+        to ``burst``, and the requests of each method class to the limits in
+        ``class_limits``.  Waiting requests are sent in order of priority.
+        Returns the :class:`~web3._utils.scheduling.RequestScheduler`.
+        """
+        self.scheduler = RequestScheduler(
+            rate,
+            burst,
+            class_limits,
+            method_classes,
+            class_priorities,
+        )
+        return self.scheduler
+
+    def disable_rate_limiting(self):
+        self.scheduler = None
+
     def make_request(self, method, params):
         raise NotImplementedError("Providers must implement this method")
 
+    def make_batch_request(self, requests):
+        """
+        @param requests is an iterable of ``(method, params)`` pairs
+        @returns a list of responses, in the same order as ``requests``
+
+        Providers which can send several requests in a single round trip
+        should override this.
+        """
+        return [self.make_request(method, params) for method, params in requests]
+
     def isConnected(self):
         raise NotImplementedError("Providers must implement this method")
 
 
+def as_middleware_tuple(middlewares):
+    if isinstance(middlewares, NamedElementOnion):
+        return middlewares.elements
+    else:
+        return tuple(middlewares)
+
+
+def as_middleware_names(middlewares, middleware_tuple):
+    """
+    Returns the profiling stage names of the ``middleware_tuple`` made from
+    ``middlewares`` by :func:`as_middleware_tuple`.
+    """
+    if isinstance(middlewares, NamedElementOnion):
+        names = middlewares.names
+    else:
+        names = middleware_tuple
+    return tuple(get_middleware_name(name) for name in names)
+
+
 class JSONBaseProvider(BaseProvider):
+    # the codec of web3._utils.json_codecs to use, or None for the default
+    json_codec = None
+
     def __init__(self):
         self.request_counter = itertools.count()
 
     def decode_rpc_response(self, response):
-        text_response = to_text(response)
-        return FriendlyJsonSerde().json_decode(text_response)
+        # decoded straight from the raw bytes, which the JSON codecs accept
+        return FriendlyJsonSerde(self.json_codec).json_decode(response)
 
-    def encode_rpc_request(self, method, params):
-        rpc_dict = {
+    def decode_batch_rpc_response(self, response, request_ids):
+        return self.match_batch_rpc_responses(self.decode_rpc_response(response), request_ids)
+
+    def match_batch_rpc_responses(self, responses, request_ids):
+        """
+        Returns the responses of a decoded JSON-RPC batch in the order of
+        ``request_ids``.  The JSON-RPC spec allows a server to answer a batch in
+        any order, so responses are matched up by ``id``.
+        """
+        if not isinstance(responses, list):
+            # A server which rejects the batch as a whole answers with a single
+            # error object, which applies to every request in the batch.
+            return [responses] * len(request_ids)
+
+        responses_by_id = {
+            response.get('id'): response for response in responses if isinstance(response, dict)
+        }
+        return [
+            responses_by_id.get(request_id, {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {
+                    "code": -32603,
+                    "message": "No response to batched request with id {0}".format(request_id),
+                },
+            })
+            for request_id in request_ids
+        ]
+
+    def form_rpc_request(self, method, params):
+        return {
             "jsonrpc": "2.0",
             "method": method,
             "params": params or [],
             "id": next(self.request_counter),
         }
-        encoded = FriendlyJsonSerde().json_encode(rpc_dict)
-        return to_bytes(text=encoded)
+
+    def encode_rpc_request(self, method, params):
+        return self.encode_rpc_dict(self.form_rpc_request(method, params))
+
+    def encode_rpc_dict(self, rpc_dict):
+        return FriendlyJsonSerde(self.json_codec).json_encode_bytes(rpc_dict)
+
+    def encode_batch_rpc_request(self, requests):
+        """
+        @param requests is an iterable of ``(method, params)`` pairs
+        @returns a tuple of the request ids and the encoded JSON-RPC batch
+        """
+        rpc_dicts = [self.form_rpc_request(method, params) for method, params in requests]
+        return [rpc_dict['id'] for rpc_dict in rpc_dicts], self.encode_rpc_dict(rpc_dicts)
 
     def isConnected(self):
         try:
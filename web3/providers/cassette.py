@@ -0,0 +1,176 @@
+"""
+Providers which record the requests made to another provider to a cassette
+file, and serve the recorded responses back without a node.
+
+A cassette is a file of newline-delimited JSON, with one line per request:
+
+    {"method": "vns_blockNumber", "params": [], "response": {...}, "latency": 0.012}
+"""
+import collections
+import json
+import threading
+import time
+
+from web3._utils.encoding import (
+    FriendlyJsonSerde,
+)
+from web3.exceptions import (
+    CannotHandleRequest,
+)
+
+from .base import (
+    BaseProvider,
+)
+
+
+def get_request_key(method, params):
+    return method, json.dumps(params, sort_keys=True, separators=(',', ':'))
+
+
+class RecordingProvider(BaseProvider):
+    """
+    Passes every request on to ``provider``, appending the request, its
+    response and the time taken to the cassette at ``cassette_path``.
+    """
+    def __init__(self, provider, cassette_path):
+        self.provider = provider
+        self.cassette_path = cassette_path
+        self._serde = FriendlyJsonSerde()
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return "Recording {0} to {1}".format(self.provider, self.cassette_path)
+
+    @property
+    def disconnects(self):
+        return self.provider.disconnects
+
+    @property
+    def profiler(self):
+        return self.provider.profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        # requests are timed by the provider they are recorded from
+        self.provider.profiler = profiler
+
+    @property
+    def metrics(self):
+        return self.provider.metrics
+
+    @metrics.setter
+    def metrics(self, collector):
+        # requests are measured by the provider they are recorded from
+        self.provider.metrics = collector
+
+    def make_request(self, method, params):
+        start = time.monotonic()
+        response = self.provider.make_request(method, params)
+        self._record([(method, params, response)], time.monotonic() - start)
+        return response
+
+    def make_batch_request(self, requests):
+        requests = list(requests)
+        start = time.monotonic()
+        responses = self.provider.make_batch_request(requests)
+        self._record(
+            [
+                (method, params, response)
+                for (method, params), response in zip(requests, responses)
+            ],
+            time.monotonic() - start,
+        )
+        return responses
+
+    def isConnected(self):
+        return self.provider.isConnected()
+
+    def _record(self, exchanges, latency):
+        lines = b''.join(
+            self._serde.json_encode_bytes({
+                'method': method,
+                'params': params,
+                'response': response,
+                'latency': latency,
+            }) + b'\n'
+            for method, params, response in exchanges
+        )
+        with self._lock:
+            with open(self.cassette_path, 'ab') as cassette:
+                cassette.write(lines)
+
+
+class ReplayProvider(BaseProvider):
+    """
+    Answers requests with the responses recorded in the cassette at
+    ``cassette_path``.  A request made several times gets the recorded
+    responses in turn, and then the last one again.  A request which was not
+    recorded raises ``CannotHandleRequest``.
+
+    :param latency: Seconds to wait before returning each response.
+    :param replay_latency: Also wait for the time the recorded request took,
+        multiplied by ``latency_scale``.
+    """
+    def __init__(self, cassette_path, latency=0, replay_latency=False, latency_scale=1.0):
+        self.cassette_path = cassette_path
+        self.latency = latency
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._index = load_cassette(cassette_path)
+        self._positions = collections.Counter()
+
+    def __str__(self):
+        return "Replaying {0}".format(self.cassette_path)
+
+    def make_request(self, method, params):
+        response, recorded_latency = self._next_exchange(method, params)
+        delay = self.latency
+        if self.replay_latency:
+            delay += recorded_latency * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    def make_batch_request(self, requests):
+        exchanges = [self._next_exchange(method, params) for method, params in requests]
+        # a batch is recorded as taking the time of the whole batch for every
+        # request in it
+        delay = self.latency
+        if self.replay_latency and exchanges:
+            delay += max(latency for _, latency in exchanges) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        return [response for response, _ in exchanges]
+
+    def isConnected(self):
+        return True
+
+    def _next_exchange(self, method, params):
+        key = get_request_key(method, params)
+        exchanges = self._index.get(key)
+        if not exchanges:
+            raise CannotHandleRequest(
+                "No recorded response to {0} with params {1}".format(method, key[1])
+            )
+        with self._lock:
+            position = min(self._positions[key], len(exchanges) - 1)
+            self._positions[key] += 1
+        return exchanges[position]
+
+
+def load_cassette(cassette_path):
+    """
+    Returns a dict of the request keys of a cassette to the list of their
+    ``(response, latency)`` pairs, in the order they were recorded.
+    """
+    serde = FriendlyJsonSerde()
+    index = collections.defaultdict(list)
+    with open(cassette_path, 'rb') as cassette:
+        for line in cassette:
+            if not line.strip():
+                continue
+            exchange = serde.json_decode(line)
+            key = get_request_key(exchange['method'], exchange['params'])
+            index[key].append((exchange['response'], exchange['latency']))
+    return dict(index)
@@ -1,12 +1,21 @@
+import contextlib
+import itertools
 import logging
 import os
 from pathlib import (
     Path,
 )
+import queue
+import re
 import socket
 import sys
-import threading
 
+from web3._utils.profiling import (
+    BATCH_METHOD,
+    DECODE_STAGE,
+    ENCODE_STAGE,
+    TRANSPORT_STAGE,
+)
 from web3._utils.threads import (
     Timeout,
 )
@@ -15,10 +24,7 @@ from .base import (
     JSONBaseProvider,
 )
 
-try:
-    from json import JSONDecodeError
-except ImportError:
-    JSONDecodeError = ValueError
+DEFAULT_RECV_SIZE = 65536
 
 
 def get_ipc_socket(ipc_path, timeout=0.1):
@@ -36,6 +42,7 @@ def get_ipc_socket(ipc_path, timeout=0.1):
 
 class PersistantSocket:
     sock = None
+    disconnects = 0
 
     def __init__(self, ipc_path):
         self.ipc_path = ipc_path
@@ -56,16 +63,39 @@ class PersistantSocket:
             except Exception:
                 pass
             self.sock = None
+            self.disconnects += 1
 
     def _open(self):
         return get_ipc_socket(self.ipc_path)
 
     def reset(self):
         self.sock.close()
+        self.disconnects += 1
         self.sock = self._open()
         return self.sock
 
 
+class PersistantSocketPool:
+    """
+    A pool of persistent sockets to the same IPC path.  Each request checks out
+    a socket of its own, so up to ``len(sockets)`` requests can be in flight at
+    once.  Sockets are only connected when they are first used, and the most
+    recently used socket is handed out first.
+    """
+    def __init__(self, sockets):
+        self._idle = queue.LifoQueue()
+        for persistent_socket in sockets:
+            self._idle.put(persistent_socket)
+
+    @contextlib.contextmanager
+    def checkout(self):
+        persistent_socket = self._idle.get()
+        try:
+            yield persistent_socket
+        finally:
+            self._idle.put(persistent_socket)
+
+
 def get_default_ipc_path():
     if sys.platform == 'darwin':
         ipc_path = os.path.expanduser(os.path.join(
@@ -186,11 +216,149 @@ def get_dev_ipc_path():
         )
 
 
+# Each match runs up to and including the next object/array delimiter which is
+# not inside a string.  When no delimiter is left, the final match runs to the
+# end of the buffer instead, capturing a string which has been cut off by the
+# end of the buffer.
+JSON_DELIMITER_RE = re.compile(
+    rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*'
+    rb'(?:([\[\]{}])|("[^"\\]*(?:\\.[^"\\]*)*\\?)?\Z)'
+)
+# the rest of a string, up to its closing quote, or up to the end of the buffer
+# or a final backslash whose escaped byte has not been received yet
+STRING_REST_RE = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*')
+DEPTH_CHANGES = {
+    b'{': 1,
+    b'[': 1,
+    b'}': -1,
+    b']': -1,
+}
+JSON_WHITESPACE = b' \t\r\n'
+
+
+class JSONFrameReader:
+    """
+    Splits a stream of bytes into complete JSON objects or arrays.
+
+    Received bytes are appended to a single buffer and only the bytes which
+    have not been scanned yet are looked at, tracking the nesting depth of
+    objects and arrays outside of strings, and whether the scan stopped
+    within a string or right after a backslash in one.  This locates the end
+    of each document in one pass, regardless of how many chunks it, or any
+    long string in it, arrives in, so that it only has to be decoded once.
+    """
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scan_position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, data):
+        self._buffer += data
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        frame = self.next_frame()
+        if frame is None:
+            raise StopIteration
+        return frame
+
+    def next_frame(self):
+        """
+        Returns the bytes of the next complete document, or ``None`` if the
+        buffer does not hold one yet.
+        """
+        if self._depth == 0 and not self._in_string:
+            # skip any whitespace between documents
+            start = len(self._buffer) - len(self._buffer.lstrip(JSON_WHITESPACE))
+            if start:
+                del self._buffer[:start]
+            self._scan_position = 0
+
+        end = self._scan()
+        if end is None:
+            return None
+        else:
+            frame = bytes(self._buffer[:end])
+            del self._buffer[:end]
+            self._scan_position = 0
+            return frame
+
+    def _scan(self):
+        position = self._scan_position
+        if self._in_string:
+            position = self._scan_string_rest(position)
+            if position is None:
+                return None
+
+        tokens = JSON_DELIMITER_RE.findall(self._buffer, position)
+        delimiters = [delimiter for delimiter, _ in tokens if delimiter]
+        depths = list(itertools.accumulate(map(DEPTH_CHANGES.__getitem__, delimiters)))
+
+        if -self._depth in depths:
+            # Only the document's final delimiter brings the depth back to zero
+            # and its position is only looked up once per document.
+            index = depths.index(-self._depth)
+            matches = JSON_DELIMITER_RE.finditer(self._buffer, position)
+            self._depth = 0
+            return next(itertools.islice(matches, index, None)).end()
+
+        if depths:
+            self._depth += depths[-1]
+        # A string which has not been fully received is captured by one of the
+        # last two matches, as the final match at the end of the buffer may be
+        # empty.  An odd number of backslashes at its end leaves the last one
+        # waiting for the byte it escapes.
+        partial_string = max((partial for _, partial in tokens[-2:]), key=len)
+        if partial_string:
+            trailing_backslashes = len(partial_string) - len(partial_string.rstrip(b'\\'))
+            self._in_string = True
+            self._escaped = trailing_backslashes % 2 == 1
+        self._scan_position = len(self._buffer)
+        return None
+
+    def _scan_string_rest(self, position):
+        """
+        Scans the rest of the string the previous scan stopped in.  Returns
+        the position after its closing quote, or ``None`` if it has not been
+        fully received yet.
+        """
+        buffer_length = len(self._buffer)
+        if self._escaped:
+            if position == buffer_length:
+                return None
+            position += 1
+            self._escaped = False
+
+        position = STRING_REST_RE.match(self._buffer, position).end()
+        if position == buffer_length:
+            self._scan_position = position
+            return None
+        elif self._buffer[position] == ord('\\'):
+            # only the final byte of the buffer can be an unmatched backslash
+            self._escaped = True
+            self._scan_position = buffer_length
+            return None
+        else:
+            self._in_string = False
+            return position + 1
+
+
 class IPCProvider(JSONBaseProvider):
     logger = logging.getLogger("web3.providers.IPCProvider")
     _socket = None
 
-    def __init__(self, ipc_path=None, timeout=10, *args, **kwargs):
+    def __init__(
+            self,
+            ipc_path=None,
+            timeout=10,
+            recv_size=DEFAULT_RECV_SIZE,
+            pool_size=1,
+            *args,
+            **kwargs):
         if ipc_path is None:
             self.ipc_path = get_default_ipc_path()
         elif isinstance(ipc_path, str) or isinstance(ipc_path, Path):
@@ -199,44 +367,68 @@ class IPCProvider(JSONBaseProvider):
             raise TypeError("ipc_path must be of type string or pathlib.Path")
 
         self.timeout = timeout
-        self._lock = threading.Lock()
+        self.recv_size = recv_size
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1, got %r" % pool_size)
         self._socket = PersistantSocket(self.ipc_path)
+        self._sockets = [self._socket] + [
+            PersistantSocket(self.ipc_path) for _ in range(pool_size - 1)
+        ]
+        self._socket_pool = PersistantSocketPool(self._sockets)
         super().__init__(*args, **kwargs)
 
+    @property
+    def disconnects(self):
+        return sum(persistent_socket.disconnects for persistent_socket in self._sockets)
+
     def make_request(self, method, params):
         self.logger.debug("Making request IPC. Path: %s, Method: %s",
                           self.ipc_path, method)
-        request = self.encode_rpc_request(method, params)
-
-        with self._lock, self._socket as sock:
+        with self._measure_request(self.ipc_path, method) as measurement:
+            with self._time_stage(method, ENCODE_STAGE):
+                request = self.encode_rpc_request(method, params)
+            response = self._send_and_receive(request, method, measurement)
+            measurement.response = response
+        return response
+
+    def make_batch_request(self, requests):
+        self.logger.debug("Making batch request IPC. Path: %s, Size: %d",
+                          self.ipc_path, len(requests))
+        with self._measure_request(self.ipc_path, BATCH_METHOD) as measurement:
+            with self._time_stage(BATCH_METHOD, ENCODE_STAGE):
+                request_ids, request = self.encode_batch_rpc_request(requests)
+            responses = self._send_and_receive(request, BATCH_METHOD, measurement)
+        return self.match_batch_rpc_responses(responses, request_ids)
+
+    def _send_and_receive(self, request, method, measurement):
+        measurement.request_bytes = len(request)
+        with self._time_stage(method, TRANSPORT_STAGE):
+            return self._send_and_receive_frame(request, method, measurement)
+
+    def _send_and_receive_frame(self, request, method, measurement):
+        with self._socket_pool.checkout() as persistent_socket, persistent_socket as sock:
             try:
                 sock.sendall(request)
             except BrokenPipeError:
                 # one extra attempt, then give up
-                sock = self._socket.reset()
+                sock = persistent_socket.reset()
                 sock.sendall(request)
 
-            raw_response = b""
+            reader = JSONFrameReader()
             with Timeout(self.timeout) as timeout:
                 while True:
                     try:
-                        raw_response += sock.recv(4096)
+                        reader.feed(sock.recv(self.recv_size))
                     except socket.timeout:
                         timeout.sleep(0)
                         continue
-                    if raw_response == b"":
+                    frame = reader.next_frame()
+                    if frame is None:
                         timeout.sleep(0)
-                    elif has_valid_json_rpc_ending(raw_response):
-                        try:
-                            response = self.decode_rpc_response(raw_response)
-                        except JSONDecodeError:
-                            timeout.sleep(0)
-                            continue
-                        else:
-                            return response
                     else:
-                        timeout.sleep(0)
-                        continue
+                        measurement.response_bytes = len(frame)
+                        with self._time_stage(method, DECODE_STAGE):
+                            return self.decode_rpc_response(frame)
 
 
 # A valid JSON RPC response can only end in } or ] http://www.jsonrpc.org/specification
@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+import weakref
 
 from vns_utils import (
     to_dict,
@@ -8,7 +10,14 @@ from vns_utils import (
 from web3._utils.http import (
     construct_user_agent,
 )
+from web3._utils.profiling import (
+    BATCH_METHOD,
+    DECODE_STAGE,
+    ENCODE_STAGE,
+    TRANSPORT_STAGE,
+)
 from web3._utils.request import (
+    create_session,
     make_post_request,
 )
 from web3.datastructures import (
@@ -27,19 +36,43 @@ def get_default_endpoint():
     return os.environ.get('WEB3_HTTP_PROVIDER_URI', 'http://localhost:8545')
 
 
+class _ThreadSession:
+    """
+    Holds the session of a thread in a ``threading.local``, which drops it when
+    the thread ends, closing the session's connections.
+    """
+    def __init__(self, session):
+        self.session = session
+        self._finalizer = weakref.finalize(self, session.close)
+
+    def close(self):
+        self._finalizer()
+
+
 class HTTPProvider(JSONBaseProvider):
     logger = logging.getLogger("web3.providers.HTTPProvider")
     endpoint_uri = None
     _request_args = None
     _request_kwargs = None
+    _session_kwargs = None
     _middlewares = NamedElementOnion([(http_retry_request_middleware, 'http_retry_request')])
 
-    def __init__(self, endpoint_uri=None, request_kwargs=None):
+    def __init__(self,
+                 endpoint_uri=None,
+                 request_kwargs=None,
+                 session_kwargs=None,
+                 per_thread_session=False):
         if endpoint_uri is None:
             self.endpoint_uri = get_default_endpoint()
         else:
             self.endpoint_uri = endpoint_uri
         self._request_kwargs = request_kwargs or {}
+        self._session_kwargs = session_kwargs
+        self._per_thread_session = per_thread_session
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._thread_sessions = threading.local()
+        self._all_thread_sessions = weakref.WeakSet()
         super().__init__()
 
     def __str__(self):
@@ -52,6 +85,43 @@ class HTTPProvider(JSONBaseProvider):
         for key, value in self._request_kwargs.items():
             yield key, value
 
+    def get_session(self):
+        """
+        The session requests are made with, or ``None`` to use the session
+        shared by every provider for the endpoint.
+        """
+        if self._per_thread_session:
+            thread_session = getattr(self._thread_sessions, 'session', None)
+            if thread_session is None:
+                thread_session = _ThreadSession(create_session(**(self._session_kwargs or {})))
+                self._thread_sessions.session = thread_session
+                with self._session_lock:
+                    self._all_thread_sessions.add(thread_session)
+            return thread_session.session
+        elif self._session_kwargs is not None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = create_session(**self._session_kwargs)
+            return self._session
+        else:
+            return None
+
+    def close(self):
+        """
+        Closes the connections of the sessions of the provider.  Sessions of
+        threads are otherwise closed when their thread ends.  Requests made
+        afterwards open new sessions.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+            thread_sessions = list(self._all_thread_sessions)
+            self._all_thread_sessions = weakref.WeakSet()
+            self._thread_sessions = threading.local()
+        if session is not None:
+            session.close()
+        for thread_session in thread_sessions:
+            thread_session.close()
+
     def get_request_headers(self):
         return {
             'Content-Type': 'application/json',
@@ -61,14 +131,40 @@ class HTTPProvider(JSONBaseProvider):
     def make_request(self, method, params):
         self.logger.debug("Making request HTTP. URI: %s, Method: %s",
                           self.endpoint_uri, method)
-        request_data = self.encode_rpc_request(method, params)
-        raw_response = make_post_request(
-            self.endpoint_uri,
-            request_data,
-            **self.get_request_kwargs()
-        )
-        response = self.decode_rpc_response(raw_response)
+        with self._measure_request(self.endpoint_uri, method) as measurement:
+            with self._time_stage(method, ENCODE_STAGE):
+                request_data = self.encode_rpc_request(method, params)
+            measurement.request_bytes = len(request_data)
+            with self._time_stage(method, TRANSPORT_STAGE):
+                raw_response = make_post_request(
+                    self.endpoint_uri,
+                    request_data,
+                    session=self.get_session(),
+                    **self.get_request_kwargs()
+                )
+            measurement.response_bytes = len(raw_response)
+            with self._time_stage(method, DECODE_STAGE):
+                response = self.decode_rpc_response(raw_response)
+            measurement.response = response
         self.logger.debug("Getting response HTTP. URI: %s, "
                           "Method: %s, Response: %s",
                           self.endpoint_uri, method, response)
         return response
+
+    def make_batch_request(self, requests):
+        self.logger.debug("Making batch request HTTP. URI: %s, Size: %d",
+                          self.endpoint_uri, len(requests))
+        with self._measure_request(self.endpoint_uri, BATCH_METHOD) as measurement:
+            with self._time_stage(BATCH_METHOD, ENCODE_STAGE):
+                request_ids, request_data = self.encode_batch_rpc_request(requests)
+            measurement.request_bytes = len(request_data)
+            with self._time_stage(BATCH_METHOD, TRANSPORT_STAGE):
+                raw_response = make_post_request(
+                    self.endpoint_uri,
+                    request_data,
+                    session=self.get_session(),
+                    **self.get_request_kwargs()
+                )
+            measurement.response_bytes = len(raw_response)
+            with self._time_stage(BATCH_METHOD, DECODE_STAGE):
+                return self.decode_batch_rpc_response(raw_response, request_ids)
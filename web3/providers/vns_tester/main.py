@@ -14,6 +14,8 @@ class AsyncEthereumTesterProvider(BaseProvider):
     For now its purpose is to provide an awaitable request function
     for testing the async api execution.
     """
+    is_async = True
+
     def __init__(self):
         self.vns_tester = EthereumTesterProvider()
 
@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import json
 import logging
 import os
@@ -8,6 +9,14 @@ from threading import (
 
 import websockets
 
+from web3._utils.metrics import (
+    NULL_MEASUREMENT,
+)
+from web3._utils.profiling import (
+    BATCH_METHOD,
+    ENCODE_STAGE,
+    TRANSPORT_STAGE,
+)
 from web3.exceptions import (
     ValidationError,
 )
@@ -17,6 +26,11 @@ from web3.providers.base import (
 
 RESTRICTED_WEBSOCKET_KWARGS = {'uri', 'loop'}
 DEFAULT_WEBSOCKET_TIMEOUT = 10
+DEFAULT_MAX_IN_FLIGHT_REQUESTS = 100
+# notifications which arrive for a subscription before it has been added
+MAX_UNCLAIMED_NOTIFICATIONS = 1024
+
+logger = logging.getLogger("web3.providers.WebsocketProvider")
 
 
 def _start_event_loop(loop):
@@ -37,27 +51,143 @@ def get_default_endpoint():
 
 
 class PersistentWebSocket:
+    """
+    A websocket connection shared by all requests of a provider.
 
-    def __init__(self, endpoint_uri, loop, websocket_kwargs):
+    Requests are pipelined: each request registers a future under its JSON-RPC
+    id(s) and sends its payload, while a single reader task receives every
+    message on the connection and resolves the future with the matching id.
+    Subscription notifications are delivered to the matching subscription.
+    """
+
+    def __init__(
+            self,
+            endpoint_uri,
+            loop,
+            websocket_kwargs,
+            max_in_flight_requests=DEFAULT_MAX_IN_FLIGHT_REQUESTS,
+            decode_message=json.loads):
         self.ws = None
+        self.decode_message = decode_message
         self.endpoint_uri = endpoint_uri
         self.loop = loop
         self.websocket_kwargs = websocket_kwargs
+        self.max_in_flight_requests = max_in_flight_requests
+        self.disconnects = 0
+        self._pending = {}
+        self._subscriptions = {}
+        self._unclaimed_notifications = collections.deque(maxlen=MAX_UNCLAIMED_NOTIFICATIONS)
+        # created on first use, so that they belong to the provider's loop
+        self._connect_lock = None
+        self._in_flight = None
 
-    async def __aenter__(self):
-        if self.ws is None:
-            self.ws = await websockets.connect(
-                uri=self.endpoint_uri, loop=self.loop, **self.websocket_kwargs
-            )
+    async def connect(self):
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self.ws is None:
+                self.ws = await websockets.connect(
+                    uri=self.endpoint_uri, loop=self.loop, **self.websocket_kwargs
+                )
+                asyncio.ensure_future(self._read_messages(self.ws), loop=self.loop)
         return self.ws
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if exc_val is not None:
+    async def request(self, request_data, request_ids, timeout, measurement=NULL_MEASUREMENT):
+        """
+        Send ``request_data`` and wait for the response to ``request_ids``, the
+        ids of the request or of every request in a batch.  The size of the
+        response is set on ``measurement``.
+        """
+        if self._in_flight is None:
+            self._in_flight = asyncio.Semaphore(self.max_in_flight_requests)
+
+        async with self._in_flight:
+            ws = await self.connect()
+            response = self.loop.create_future()
+            for request_id in request_ids:
+                self._pending[request_id] = (response, request_ids)
             try:
-                await self.ws.close()
+                await asyncio.wait_for(ws.send(request_data), timeout=timeout)
+                message, measurement.response_bytes = await asyncio.wait_for(
+                    response,
+                    timeout=timeout,
+                )
+                return message
+            finally:
+                for request_id in request_ids:
+                    self._pending.pop(request_id, None)
+
+    async def _read_messages(self, ws):
+        try:
+            while True:
+                data = await ws.recv()
+                self._dispatch(self.decode_message(data), len(data))
+        except Exception as exc:
+            # The connection is unusable, so fail everything waiting on it and
+            # let the next request open a new one.
+            if self.ws is ws:
+                self.ws = None
+                self.disconnects += 1
+            for response, _ in list(self._pending.values()):
+                if not response.done():
+                    response.set_exception(exc)
+            # subscriptions do not survive the connection they were made on
+            subscriptions, self._subscriptions = self._subscriptions, {}
+            for subscription in subscriptions.values():
+                subscription.close(exc)
+            try:
+                await ws.close()
             except Exception:
                 pass
-            self.ws = None
+
+    async def add_subscription(self, subscription):
+        subscription_id = subscription.subscription_id
+        self._subscriptions[subscription_id] = subscription
+
+        unclaimed = list(self._unclaimed_notifications)
+        self._unclaimed_notifications.clear()
+        for notification in unclaimed:
+            if notification['subscription'] == subscription_id:
+                self._notify(notification)
+            else:
+                self._unclaimed_notifications.append(notification)
+
+    async def remove_subscription(self, subscription_id):
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is not None:
+            subscription.close()
+
+    def _notify(self, notification):
+        subscription = self._subscriptions.get(notification['subscription'])
+        if subscription is None:
+            self._unclaimed_notifications.append(notification)
+            return
+        try:
+            subscription.deliver(notification['result'])
+        except Exception:
+            logger.exception("Could not deliver notification to %s", subscription)
+
+    def _dispatch(self, message, size=None):
+        if is_subscription_notification(message):
+            self._notify(message['params'])
+            return
+
+        if isinstance(message, list):
+            ids = [item.get('id') for item in message if isinstance(item, dict)]
+        else:
+            ids = [message.get('id')]
+
+        for message_id in ids:
+            if message_id in self._pending:
+                response, request_ids = self._pending[message_id]
+                for request_id in request_ids:
+                    self._pending.pop(request_id, None)
+                if not response.done():
+                    response.set_result((message, size))
+                return
+
+        logger.warning("Received websocket message for no pending request: %r", message)
 
 
 class WebsocketProvider(JSONBaseProvider):
@@ -68,7 +198,8 @@ class WebsocketProvider(JSONBaseProvider):
             self,
             endpoint_uri=None,
             websocket_kwargs=None,
-            websocket_timeout=DEFAULT_WEBSOCKET_TIMEOUT
+            websocket_timeout=DEFAULT_WEBSOCKET_TIMEOUT,
+            max_in_flight_requests=DEFAULT_MAX_IN_FLIGHT_REQUESTS,
     ):
         self.endpoint_uri = endpoint_uri
         self.websocket_timeout = websocket_timeout
@@ -87,33 +218,99 @@ class WebsocketProvider(JSONBaseProvider):
                     '{0} are not allowed in websocket_kwargs, '
                     'found: {1}'.format(RESTRICTED_WEBSOCKET_KWARGS, found_restricted_keys)
                 )
+        super().__init__()
         self.conn = PersistentWebSocket(
-            self.endpoint_uri, WebsocketProvider._loop, websocket_kwargs
+            self.endpoint_uri,
+            WebsocketProvider._loop,
+            websocket_kwargs,
+            max_in_flight_requests,
+            self.decode_rpc_response,
         )
-        super().__init__()
 
     def __str__(self):
         return "WS connection {0}".format(self.endpoint_uri)
 
-    async def coro_make_request(self, request_data):
-        async with self.conn as conn:
-            await asyncio.wait_for(
-                conn.send(request_data),
-                timeout=self.websocket_timeout
-            )
-            return json.loads(
-                await asyncio.wait_for(
-                    conn.recv(),
-                    timeout=self.websocket_timeout
-                )
-            )
+    @property
+    def disconnects(self):
+        return self.conn.disconnects
+
+    async def coro_make_request(self,
+                                request_data,
+                                request_ids=None,
+                                measurement=NULL_MEASUREMENT):
+        if request_ids is None:
+            request_ids = _get_request_ids(request_data)
+        return await self.conn.request(
+            request_data,
+            request_ids,
+            self.websocket_timeout,
+            measurement,
+        )
 
     def make_request(self, method, params):
         self.logger.debug("Making request WebSocket. URI: %s, "
                           "Method: %s", self.endpoint_uri, method)
-        request_data = self.encode_rpc_request(method, params)
+        with self._measure_request(self.endpoint_uri, method) as measurement:
+            with self._time_stage(method, ENCODE_STAGE):
+                rpc_dict = self.form_rpc_request(method, params)
+                request_data = self.encode_rpc_dict(rpc_dict)
+            measurement.request_bytes = len(request_data)
+            # responses are decoded by the event loop's thread, within the transport
+            with self._time_stage(method, TRANSPORT_STAGE):
+                future = asyncio.run_coroutine_threadsafe(
+                    self.coro_make_request(request_data, [rpc_dict['id']], measurement),
+                    WebsocketProvider._loop
+                )
+                response = future.result()
+            measurement.response = response
+        return response
+
+    def add_subscription(self, subscription):
+        """
+        Deliver the notifications for ``subscription`` to it, from now until it
+        is removed or the connection closes.
+        """
         future = asyncio.run_coroutine_threadsafe(
-            self.coro_make_request(request_data),
+            self.conn.add_subscription(subscription),
             WebsocketProvider._loop
         )
         return future.result()
+
+    def remove_subscription(self, subscription_id):
+        future = asyncio.run_coroutine_threadsafe(
+            self.conn.remove_subscription(subscription_id),
+            WebsocketProvider._loop
+        )
+        return future.result()
+
+    def make_batch_request(self, requests):
+        self.logger.debug("Making batch request WebSocket. URI: %s, "
+                          "Size: %d", self.endpoint_uri, len(requests))
+        with self._measure_request(self.endpoint_uri, BATCH_METHOD) as measurement:
+            with self._time_stage(BATCH_METHOD, ENCODE_STAGE):
+                request_ids, request_data = self.encode_batch_rpc_request(requests)
+            measurement.request_bytes = len(request_data)
+            with self._time_stage(BATCH_METHOD, TRANSPORT_STAGE):
+                future = asyncio.run_coroutine_threadsafe(
+                    self.coro_make_request(request_data, request_ids, measurement),
+                    WebsocketProvider._loop
+                )
+                responses = future.result()
+        return self.match_batch_rpc_responses(responses, request_ids)
+
+
+def is_subscription_notification(message):
+    return (
+        isinstance(message, dict) and
+        'id' not in message and
+        isinstance(message.get('params'), dict) and
+        'subscription' in message['params']
+    )
+
+
+def _get_request_ids(request_data):
+    request = json.loads(request_data)
+    if isinstance(request, list):
+        return [item['id'] for item in request]
+    else:
+        return [request['id']]
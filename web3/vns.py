@@ -24,6 +24,9 @@ from web3._utils.filters import (
     LogFilter,
     TransactionFilter,
 )
+from web3._utils.subscriptions import (
+    Subscription,
+)
 from web3._utils.threads import (
     Timeout,
 )
@@ -384,6 +387,37 @@ class Bbbbbbbb(Module):
                             "a valid filter object, or a filter_id as a string "
                             "or hex.")
 
+    def subscribe(self, subscription_type, filter_params=None, callback=None):
+        if not hasattr(self.web3.provider, 'add_subscription'):
+            raise ValueError(
+                "Subscriptions need a provider with a persistent connection, such "
+                "as the WebsocketProvider.  Got: {0}".format(self.web3.provider)
+            )
+        if filter_params is None:
+            params = [subscription_type]
+        else:
+            params = [subscription_type, filter_params]
+
+        subscription = Subscription(self.web3, subscription_type, callback)
+        try:
+            subscription.subscription_id = self.web3.manager.request_blocking(
+                "vns_subscribe", params,
+            )
+            self.web3.provider.add_subscription(subscription)
+        except Exception:
+            subscription.close()
+            raise
+        return subscription
+
+    def unsubscribe(self, subscription_id):
+        try:
+            return self.web3.manager.request_blocking(
+                "vns_unsubscribe", [subscription_id],
+            )
+        finally:
+            if hasattr(self.web3.provider, 'remove_subscription'):
+                self.web3.provider.remove_subscription(subscription_id)
+
     def getFilterChanges(self, filter_id):
         return self.web3.manager.request_blocking(
             "vns_getFilterChanges", [filter_id],